@@ -0,0 +1,60 @@
+"""
+Benchmark: shift analytics (tools/core/analytics.py) on synthetic events.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_analytics [--users 300] [--days 120]
+
+Each user works one shift per day with one pause. The script checks the
+worked hours and pause count against the generated data and reports the
+time of compute_summary.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from tools.core.analytics import compute_summary, heatmap_text
+
+
+def make_events(users: int, days: int, start: datetime, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    events = []
+    for user in range(users):
+        for day in range(days):
+            started = start + timedelta(days=day, hours=8, minutes=rng.randint(0, 120))
+            paused = started + timedelta(hours=3)
+            resumed = paused + timedelta(minutes=rng.randint(5, 30))
+            ended = resumed + timedelta(hours=4)
+            for event_type, at in (('start', started), ('pause', paused), ('resume', resumed), ('end', ended)):
+                events.append({'user_id': str(10**17 + user), 'type': event_type, 'at': at.isoformat()})
+    return events
+
+
+def bench(users: int, days: int, repeat: int = 3):
+    start = datetime(2025, 1, 6)
+    events = make_events(users, days, start)
+    end = start + timedelta(days=days)
+
+    best = None
+    for _ in range(repeat):
+        began = time.perf_counter()
+        summary = compute_summary(events, start, end, end, 9 * 3600 + 5 * 60)
+        elapsed = time.perf_counter() - began
+        best = elapsed if best is None else min(best, elapsed)
+
+    assert round(summary['worked_hours']) == users * days * 7, "Worked hours differ"
+    assert summary['pauses'] == users * days, "Pause count differs"
+
+    print(f"{users} users, {days} days, {len(events)} events, best of {repeat}: {best * 1000:.1f} ms")
+    print(f"  worked {summary['worked_hours']:.0f} h, average pause {summary['average_pause'] / 60:.1f} min, "
+          f"{len(summary['late_users'])} user(s) late at least once")
+    print(heatmap_text(summary['heatmap']))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=300)
+    parser.add_argument('--days', type=int, default=120)
+    args = parser.parse_args()
+
+    bench(args.users, args.days)
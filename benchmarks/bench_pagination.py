@@ -0,0 +1,326 @@
+"""
+Benchmark: PaginatedEmbed layout engine vs the previous implementation.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_pagination [--items 10000]
+
+The previous implementation is kept below as LegacyPaginatedEmbed. Besides
+timing both, the script checks that they produce identical pages.
+"""
+import argparse
+import copy
+import random
+import time
+from datetime import datetime, timedelta
+
+import discord
+
+from tools.core.pagination import (
+    PaginatedEmbed, EMBED_MAX_FIELDS, FIELD_VALUE_MAX_CHARS, MESSAGE_MAX_CHARS, MESSAGE_MAX_EMBEDS
+)
+
+
+class LegacyPaginatedEmbed(PaginatedEmbed):
+    """
+    PaginatedEmbed.generate_pages as it was before the layout engine.
+
+    One fix is applied: the trial embed is a real copy. Embed.copy() shares
+    the fields list, so the original code appended every trial field to the
+    page being built (duplicated fields on multi-section pages).
+    """
+
+    def _build_section_content(self, section: dict, start_idx: int, items_count: int) -> tuple[str, int]:
+        items = section['items']
+        formatter = section['formatter']
+        max_items = section['max_items']
+
+        if not items:
+            return section['empty_message'], 0
+
+        if max_items is not None:
+            items = items[:max_items]
+
+        content = ""
+        items_used = 0
+
+        for i in range(start_idx, min(start_idx + items_count, len(items))):
+            item_text = formatter(items[i])
+            content += item_text + "\n"
+            items_used += 1
+
+        remaining = len(items) - (start_idx + items_used)
+        if remaining > 0:
+            content += f"\n*... et {remaining} autre(s)*"
+
+        return content.strip(), items_used
+
+    def generate_pages(self):
+        pages = []
+        current_embed = discord.Embed(title=self.title, description=self.description, color=self.color)
+
+        if not self.sections:
+            pages.append(current_embed)
+            return pages
+
+        section_indices = [0] * len(self.sections)
+        sections_completed = [False] * len(self.sections)
+
+        while not all(sections_completed):
+            page_created = False
+
+            for section_idx, section in enumerate(self.sections):
+                if sections_completed[section_idx]:
+                    continue
+
+                start_idx = section_indices[section_idx]
+                items_remaining = len(section['items']) - start_idx
+
+                if items_remaining <= 0:
+                    sections_completed[section_idx] = True
+                    continue
+
+                items_to_try = min(self.items_per_page, items_remaining)
+
+                while items_to_try > 0:
+                    content, items_used = self._build_section_content(section, start_idx, items_to_try)
+
+                    test_embed = discord.Embed.from_dict(copy.deepcopy(current_embed.to_dict()))
+                    test_embed.add_field(name=section['name'], value=content, inline=section['inline'])
+
+                    if self._calculate_embed_size(test_embed) <= self.max_chars_per_page:
+                        current_embed.add_field(name=section['name'], value=content, inline=section['inline'])
+                        section_indices[section_idx] += items_used
+                        page_created = True
+
+                        if section_indices[section_idx] >= len(section['items']):
+                            sections_completed[section_idx] = True
+                        break
+                    else:
+                        items_to_try = max(1, items_to_try // 2)
+
+                        if items_to_try == 1:
+                            if len(current_embed.fields) == 0:
+                                content = content[:1500] + "... (tronqué)"
+                                current_embed.add_field(name=section['name'], value=content, inline=section['inline'])
+                                section_indices[section_idx] += 1
+                                page_created = True
+                            break
+                        elif items_to_try < 1:
+                            break
+
+            if len(current_embed.fields) > 0:
+                pages.append(current_embed)
+                current_embed = discord.Embed(title=self.title, description=self.description, color=self.color)
+            elif not page_created:
+                break
+
+        total_pages = len(pages)
+        for i, page in enumerate(pages):
+            footer = self.footer_text
+            if total_pages > 1:
+                footer += f" | Page {i + 1}/{total_pages}"
+            page.set_footer(text=footer)
+            page.timestamp = discord.utils.utcnow()
+
+        return pages if pages else [current_embed]
+
+
+def make_users(count: int, seed: int = 0) -> list:
+    """Users shaped like ActivityManager data"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    users = []
+    for i in range(count):
+        status = rng.choice(['active', 'pause', 'ended'])
+        users.append((str(10**17 + i), {
+            'username': f"user{i}",
+            'status': status,
+            'last_action': (now - timedelta(minutes=rng.randint(0, 10000))).isoformat(),
+            'pause_duration': rng.randint(1, 60) if status == 'pause' else None
+        }))
+    return users
+
+
+def make_paginated(cls, items: list, formatter, **kwargs):
+    paginated = cls(title="📊 Pointeuse", description="Statut en temps réel", footer_text="Bench", **kwargs)
+    paginated.add_section(name="", items=items, formatter=formatter, empty_message="Vide")
+    return paginated
+
+
+class CountingFormatter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, user_data):
+        self.calls += 1
+        user_id, data = user_data
+        last_action = f"<t:{int(datetime.fromisoformat(data['last_action']).timestamp())}:R>"
+        return f"🟢 <@{user_id}>\n**Statut:** {data['status']}\n**Dernière action:** {last_action}\n"
+
+
+class CountingStr(CountingFormatter):
+    def __call__(self, item):
+        self.calls += 1
+        return str(item)
+
+
+def pages_signature(pages: list) -> list:
+    signature = []
+    for page in pages:
+        data = page.to_dict()
+        data.pop('timestamp', None)
+        signature.append(data)
+    return signature
+
+
+def check_equivalence(cases: int = 300, seed: int = 1):
+    """Compare both implementations on random sections, including edge cases"""
+    rng = random.Random(seed)
+    pieces = ["a", "  lead", "trail  \n", "   ", "\n", "x" * 300, "y" * 2000, "mot " * 20]
+
+    for case in range(cases):
+        kwargs = {
+            'items_per_page': rng.choice([1, 2, 3, 5, 10]),
+            'max_chars_per_page': rng.choice([200, 600, 1900])
+        }
+        description = rng.choice(["", "Description"])
+        sections = []
+        for _ in range(rng.randint(0, 3)):
+            items = ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(0, 25))]
+            sections.append((rng.choice(["", "Section", "🔄 **Tâches**"]), items))
+
+        results = []
+        for cls in (LegacyPaginatedEmbed, PaginatedEmbed):
+            paginated = cls(title="Titre", description=description, footer_text="f", **kwargs)
+            for name, items in sections:
+                paginated.add_section(name=name, items=items, formatter=str)
+            results.append(pages_signature(paginated.generate_pages()))
+
+        if results[0] != results[1]:
+            raise AssertionError(f"Implementations differ on case {case} (seed {seed})")
+
+
+def check_lazy_sources(cases: int = 300, seed: int = 2):
+    """Lazy sources (generator, cursor, bounded items) must render like plain lists"""
+    rng = random.Random(seed)
+
+    class Cursor:
+        def __init__(self, items):
+            self.items = items
+
+        def fetch(self, start, stop):
+            return self.items[start:stop]
+
+    for case in range(cases):
+        kwargs = {
+            'items_per_page': rng.choice([1, 3, 5, 10]),
+            'max_chars_per_page': rng.choice([600, 1900, 6000])
+        }
+        sections = []
+        for _ in range(rng.randint(0, 3)):
+            items = ["w" * rng.randint(1, 40) + str(i) for i in range(rng.randint(0, 40))]
+            sections.append((rng.choice(["Section", "🔄 **Tâches**"]), items))
+
+        variants = {
+            'list': lambda items: {'items': items},
+            'generator': lambda items: {'items': (item for item in items)},
+            'generator+total': lambda items: {'items': (item for item in items), 'total': len(items)},
+            'cursor+bound': lambda items: {'items': Cursor(items), 'total': len(items), 'max_item_chars': 45},
+            'dict view+bound': lambda items: {'items': dict.fromkeys(items).keys(), 'max_item_chars': 45},
+        }
+        results = {}
+        for label, source in variants.items():
+            paginated = PaginatedEmbed(title="Titre", footer_text="f", **kwargs)
+            for name, items in sections:
+                paginated.add_section(name=name, formatter=str, **source(items))
+            count = paginated.page_count()
+            results[label] = pages_signature([paginated.render_page(i) for i in range(count)])
+
+        if len(set(map(repr, results.values()))) != 1:
+            raise AssertionError(f"Lazy sources differ on case {case} (seed {seed})")
+
+
+def message_size(embeds: list) -> int:
+    """Characters counted by Discord towards the 6000 limit of a message"""
+    size = 0
+    for embed in embeds:
+        size += len(embed.title or "") + len(embed.description or "") + len(embed.footer.text or "")
+        size += sum(len(field.name) + len(field.value) for field in embed.fields)
+    return size
+
+
+def check_discord_limits(cases: int = 200, seed: int = 3):
+    """pack_fields pages must respect Discord's limits and show every item once, in order"""
+    rng = random.Random(seed)
+
+    for case in range(cases):
+        bound = rng.choice([None, 60, 150])
+        sections = []
+        for _ in range(rng.randint(1, 3)):
+            length = bound or 400
+            items = [f"{len(sections)}:{i}:" + "z" * rng.randint(1, length - 12) for i in range(rng.randint(0, 600))]
+            sections.append((rng.choice(["", "Section"]), items))
+
+        paginated = PaginatedEmbed(title="Titre", description="Desc", footer_text="f",
+                                   items_per_page=rng.choice([5, 10, 50]), pack_fields=True)
+        for name, items in sections:
+            paginated.add_section(name=name, items=items, formatter=str, max_item_chars=bound)
+
+        try:
+            paginated.generate_pages()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"case {case}: generate_pages accepted pack_fields")
+
+        shown = []
+        for embeds in paginated.generate_messages():
+            assert len(embeds) <= MESSAGE_MAX_EMBEDS, f"case {case}: too many embeds"
+            assert message_size(embeds) <= MESSAGE_MAX_CHARS, f"case {case}: message too long"
+            for embed in embeds:
+                assert len(embed.fields) <= EMBED_MAX_FIELDS, f"case {case}: too many fields"
+                for field in embed.fields:
+                    assert 0 < len(field.value) <= FIELD_VALUE_MAX_CHARS, f"case {case}: bad field"
+                    shown.extend(field.value.split("\n"))
+
+        expected = [item for _, items in sections for item in items]
+        assert shown == expected, f"case {case}: items lost or reordered"
+
+
+def bench(items: int, repeat: int = 3):
+    scenarios = [
+        ("status panel (5/page)", make_users(items), CountingFormatter, 5),
+        ("long items (10/page, halving)", [("x" * 350) + str(i) for i in range(items)], CountingStr, 10),
+    ]
+
+    for label, data, formatter_cls, items_per_page in scenarios:
+        print(f"{label}, {items} items, best of {repeat}:")
+        outputs = {}
+        for cls in (LegacyPaginatedEmbed, PaginatedEmbed):
+            best = None
+            for _ in range(repeat):
+                formatter = formatter_cls()
+                paginated = make_paginated(cls, data, formatter, items_per_page=items_per_page, max_chars_per_page=1900)
+                start = time.perf_counter()
+                pages = paginated.generate_pages()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            outputs[cls.__name__] = pages_signature(pages)
+            print(f"  {cls.__name__:22s} {best * 1000:9.1f} ms  {len(pages)} pages  {formatter.calls} formatter calls")
+
+        assert outputs['LegacyPaginatedEmbed'] == outputs['PaginatedEmbed'], "Outputs differ"
+        print("  identical output: yes")
+
+    paginated = make_paginated(PaginatedEmbed, make_users(items), CountingFormatter(), items_per_page=5, pack_fields=True)
+    print(f"status panel with pack_fields: {paginated.page_count()} pages")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--items', type=int, default=10000)
+    args = parser.parse_args()
+
+    check_equivalence()
+    check_lazy_sources()
+    check_discord_limits()
+    bench(args.items)
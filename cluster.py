@@ -0,0 +1,198 @@
+"""
+Cluster launcher - runs the bot as several worker processes.
+
+Each worker is a normal `main.py` process owning a subset of the Discord
+shards. All workers share one SQLite state store (instead of the JSON files)
+and elect a leader through a lease in that store; singleton jobs such as
+daily resets are claimed in the store so they run exactly once.
+
+Usage:
+    python cluster.py --workers 4 --shards 8
+    python cluster.py --simulate --workers 3   # local test, no Discord login
+
+Defaults can be set in config.json:
+    "cluster": {"workers": 2, "shards": 2, "state_db": "tools/data/state.db"}
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def load_config():
+    try:
+        with open('config.json', 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def assign_shards(workers: int, shards: int) -> list:
+    """Distribute shard ids round-robin over workers"""
+    return [list(range(worker, shards, workers)) for worker in range(workers)]
+
+
+def run_cluster(workers: int, shards: int, state_db: str, restart_delay: float = 10):
+    """Start one main.py process per worker and restart them if they crash"""
+    assignments = assign_shards(workers, shards)
+    processes = {}
+    stopping = False
+
+    def spawn(worker_id: int):
+        env = dict(
+            os.environ,
+            MAXBOT_WORKER_ID=str(worker_id),
+            MAXBOT_SHARD_IDS=",".join(map(str, assignments[worker_id])),
+            MAXBOT_SHARD_COUNT=str(shards),
+            MAXBOT_STATE_DB=state_db
+        )
+        process = subprocess.Popen([sys.executable, 'main.py'], env=env)
+        print(f"Worker {worker_id} started (pid {process.pid}, shards {assignments[worker_id]})")
+        return process
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process in processes.values():
+            process.send_signal(signal.SIGTERM)
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for worker_id in range(workers):
+        processes[worker_id] = spawn(worker_id)
+
+    while processes:
+        time.sleep(1)
+        for worker_id, process in list(processes.items()):
+            code = process.poll()
+            if code is None:
+                continue
+            if stopping:
+                del processes[worker_id]
+                continue
+            print(f"Worker {worker_id} exited with code {code}, restarting in {restart_delay}s")
+            time.sleep(restart_delay)
+            processes[worker_id] = spawn(worker_id)
+
+
+# ---------------------------------------------------------------------------
+# Local simulation: several workers on one machine, no Discord connection
+# ---------------------------------------------------------------------------
+
+def simulate_worker(worker_id: int, shard_ids: list, shard_count: int, state_db: str, rounds: int):
+    """Behave like a worker: load owned instances, elect a leader and claim daily resets"""
+    from tools.core.state_store import StateStore, LeaderElection, shard_for_guild
+
+    store = StateStore(state_db)
+    holder = str(worker_id)
+    election = LeaderElection(store, holder, ttl=1.0)
+
+    def owns_guild(guild_id):
+        return shard_for_guild(guild_id, shard_count) in shard_ids
+
+    owned = store.load_instances('task', owns_guild)
+    for instance in owned:
+        instance['loaded_by'] = holder
+    store.save_instances('task', owned, owns_guild)
+
+    all_instances = store.load_instances('task')
+    for round_no in range(rounds):
+        election.step()
+        # Every worker races for every reset to prove the claims are exclusive
+        for instance in all_instances:
+            if store.claim(f"task:daily_reset:{instance['instance_id']}:{round_no}", holder):
+                store.conn.execute(
+                    "INSERT INTO sim_runs (instance_id, round, worker) VALUES (?, ?, ?)",
+                    (instance['instance_id'], round_no, holder)
+                )
+        if election.is_leader:
+            store.conn.execute("INSERT INTO sim_leaders (round, worker) VALUES (?, ?)", (round_no, holder))
+        time.sleep(0.05)
+    store.close()
+
+
+def run_simulation(workers: int, shards: int, guilds: int = 50, rounds: int = 20) -> bool:
+    """Run simulated workers against a temporary store and check the invariants"""
+    from tools.core.state_store import StateStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_db = os.path.join(tmp, "state.db")
+        store = StateStore(state_db)
+        store.conn.executescript(
+            """
+            CREATE TABLE sim_runs (instance_id TEXT, round INTEGER, worker TEXT);
+            CREATE TABLE sim_leaders (round INTEGER, worker TEXT);
+            """
+        )
+        store.save_instances('task', [
+            {'instance_id': f"instance-{i}", 'guild_id': (1000 + i) << 22}
+            for i in range(guilds)
+        ])
+
+        assignments = assign_shards(workers, shards)
+        processes = [
+            multiprocessing.Process(
+                target=simulate_worker,
+                args=(worker_id, assignments[worker_id], shards, state_db, rounds)
+            )
+            for worker_id in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        ok = all(process.exitcode == 0 for process in processes)
+
+        runs = store.conn.execute(
+            "SELECT instance_id, round, COUNT(*) FROM sim_runs GROUP BY instance_id, round"
+        ).fetchall()
+        duplicated = [row for row in runs if row[2] != 1]
+        missing = guilds * rounds - len(runs)
+        loaders = store.conn.execute(
+            "SELECT json_extract(data, '$.loaded_by'), COUNT(*) FROM instances GROUP BY 1"
+        ).fetchall()
+        unowned = sum(count for loader, count in loaders if loader is None)
+        leaders = store.conn.execute(
+            "SELECT worker, COUNT(DISTINCT round) FROM sim_leaders GROUP BY worker"
+        ).fetchall()
+        store.close()
+
+    print(f"Simulated {workers} workers over {shards} shards, {guilds} instances, {rounds} reset rounds")
+    print(f"  instances per worker: {dict(loaders)}")
+    print(f"  leader rounds per worker: {dict(leaders)}")
+    print(f"  resets run: {len(runs)}, duplicated: {len(duplicated)}, missing: {missing}")
+
+    ok = ok and not duplicated and missing == 0 and unowned == 0
+    print("OK" if ok else "FAILED")
+    return ok
+
+
+def main():
+    cluster_config = load_config().get('cluster', {})
+
+    parser = argparse.ArgumentParser(description="Run the bot as a cluster of worker processes")
+    parser.add_argument('--workers', type=int, default=cluster_config.get('workers', 2))
+    parser.add_argument('--shards', type=int, default=cluster_config.get('shards'))
+    parser.add_argument('--state-db', default=cluster_config.get('state_db', 'tools/data/state.db'))
+    parser.add_argument('--simulate', action='store_true', help="Run a local simulation without Discord")
+    args = parser.parse_args()
+
+    shards = args.shards or args.workers
+    if shards < args.workers:
+        parser.error("--shards must be >= --workers")
+
+    if args.simulate:
+        sys.exit(0 if run_simulation(args.workers, shards) else 1)
+
+    run_cluster(args.workers, shards, args.state_db)
+
+
+if __name__ == "__main__":
+    main()
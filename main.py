@@ -2,9 +2,10 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import json
+import os
 
 # Import tool classes
-from tools.core import ActivityManager, TaskManager, ReviewManager, PostManager
+from tools.core import ActivityManager, TaskManager, ReviewManager, PostManager, BaseTool, StateStore, LeaderElection
 
 # Load configuration
 def load_config():
@@ -13,36 +14,70 @@ def load_config():
 
 config = load_config()
 
+# Cluster worker settings (set by cluster.py, absent in single-process mode)
+WORKER_ID = os.environ.get('MAXBOT_WORKER_ID')
+leader_election = None
+if WORKER_ID is not None:
+    state_store = StateStore(os.environ['MAXBOT_STATE_DB'])
+    BaseTool.configure_cluster(
+        state_store,
+        shard_ids=[int(s) for s in os.environ['MAXBOT_SHARD_IDS'].split(',')],
+        shard_count=int(os.environ['MAXBOT_SHARD_COUNT']),
+        worker_id=WORKER_ID
+    )
+    leader_election = LeaderElection(state_store, WORKER_ID)
+    BotBase = commands.AutoShardedBot
+    shard_kwargs = {
+        'shard_ids': sorted(BaseTool.shard_ids),
+        'shard_count': BaseTool.shard_count
+    }
+else:
+    BotBase = commands.Bot
+    shard_kwargs = {}
+
 # Bot setup with intents
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-class MyBot(commands.Bot):
+class MyBot(BotBase):
     def __init__(self):
         super().__init__(
             command_prefix="!",
-            intents=intents
+            intents=intents,
+            **shard_kwargs
         )
+        self.state_restored = False  # on_ready also fires after gateway reconnects
 
     async def setup_hook(self):
         # Register all tool-specific commands
         for tool in TOOLS:
             await tool.setup_commands(self)
 
-        # Sync commands globally
-        await self.tree.sync()
-        print("Synced commands globally")
+        if leader_election is not None:
+            self.loop.create_task(leader_election.run())
+
+        # Sync commands globally (once per cluster)
+        if WORKER_ID in (None, '0'):
+            await self.tree.sync()
+            print("Synced commands globally")
 
     async def on_ready(self):
         print(f'Logged in as {self.user} (ID: {self.user.id})')
         print('------')
 
-        # Clear all instances from JSON files on bot start
-        for tool in TOOLS:
-            tool.instances['instances'] = []
-            tool.save_instances()
-            print(f"Cleared instances for {tool.display_name}")
+        # Clear or restore the instances once per process, not on every reconnect.
+        # Restoring (pause timers, schedules...) needs clear_instances_on_start set to false.
+        clear_instances = config['bot_settings'].get('clear_instances_on_start', False)
+        if not self.state_restored:
+            self.state_restored = True
+            for tool in TOOLS:
+                if clear_instances:
+                    tool.instances['instances'] = []
+                    tool.save_instances()
+                    print(f"Cleared instances for {tool.display_name}")
+                # Restart in-memory jobs (pause timers...) from the stored state
+                await tool.restore_state(self)
 
         # Set bot status
         activity = discord.Game(name=config['bot_settings']['activity'])
@@ -51,7 +86,7 @@ class MyBot(commands.Bot):
             activity=activity
         )
 
-        print("Bot is ready and all instances are cleared!")
+        print("Bot is ready and all instances are cleared!" if clear_instances else "Bot is ready, instances restored!")
 
     async def on_message(self, message: discord.Message):
         # Ignore bot messages
@@ -75,6 +110,15 @@ class MyBot(commands.Bot):
                         await tool.handle_video_message(message, instance['instance_id'])
                         break
 
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        # Raw events also cover messages that are not in the message cache (e.g. sent before a restart)
+        for tool in TOOLS:
+            tool.handle_deleted_messages([payload.message_id])
+
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        for tool in TOOLS:
+            tool.handle_deleted_messages(payload.message_ids)
+
 bot = MyBot()
 
 # Initialize all tools
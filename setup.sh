@@ -58,7 +58,8 @@ if [ ! -f "config.json" ] || grep -q "YOUR_BOT_TOKEN_HERE" config.json 2>/dev/nu
   "allowed_user_ids": [1428084017114124449, 690283716823613461],
   "bot_settings": {
     "status": "online",
-    "activity": "Manage le serveur."
+    "activity": "Manage le serveur.",
+    "clear_instances_on_start": false
   }
 }
 CONF
@@ -3,7 +3,9 @@ from .task_manager import TaskManager
 from .review_manager import ReviewManager
 from .post_manager import PostManager
 from .base_tool import BaseTool
-from .pagination import PaginatedEmbed, PaginationView, create_simple_paginated_view
+from .pagination import PaginatedEmbed, PaginationView, FragmentCache, SequenceChain, JumpToPageModal, create_simple_paginated_view
+from .search_index import PrefixIndex
+from .state_store import StateStore, LeaderElection
 
 __all__ = [
     'ActivityManager',
@@ -13,5 +15,11 @@ __all__ = [
     'BaseTool',
     'PaginatedEmbed',
     'PaginationView',
-    'create_simple_paginated_view'
+    'FragmentCache',
+    'SequenceChain',
+    'JumpToPageModal',
+    'PrefixIndex',
+    'create_simple_paginated_view',
+    'StateStore',
+    'LeaderElection'
 ]
@@ -1,9 +1,41 @@
 import discord
 from discord import app_commands
 from .base_tool import BaseTool
-from .pagination import PaginatedEmbed, PaginationView
+from .pagination import PaginatedEmbed, PaginationView, FragmentCache, JumpToPageModal
+from .pause_timers import PauseTimerService
+from .shift_log import ShiftLog, shift_event_type, split_by_day
+from .status_index import StatusIndex
+from .analytics import numpy_available, compute_summary, heatmap_text, render_heatmap_png, chart_pool
+from .export import parse_day
 import asyncio
-from datetime import datetime, timedelta
+import io
+import time
+from datetime import date, datetime, timedelta
+
+
+STATUS_EMOJIS = {
+    'active': '🟢',
+    'pause': '🟡',
+    'ended': '🔴'
+}
+
+# Longueur maximale d'une ligne du panel (mention, statut et timestamp)
+USER_LINE_MAX_CHARS = 150
+
+# Retards : premier début de shift de la journée après shift_start_time (par instance) + tolérance
+DEFAULT_SHIFT_START_TIME = "09:00"
+LATE_START_GRACE_MINUTES = 5
+
+# Délai minimal entre deux clics d'un même utilisateur sur les boutons de shift
+BUTTON_COOLDOWN_SECONDS = 3.0
+
+# Clôture automatique des shifts oubliés : heure "HH:MM" par instance (shift_cutoff_time), désactivée si absente
+SHIFT_CUTOFF_DM_CONCURRENCY = 5
+# Seul un shift sans action depuis ce nombre d'heures avant la clôture est considéré oublié (shift_cutoff_min_idle par instance)
+SHIFT_CUTOFF_MIN_IDLE_HOURS = 12
+
+# Jours de rollups gardés dans l'instance (sauvegardée à chaque changement) ; au-delà ils sont recalculés depuis le shift log
+ROLLUP_RETENTION_DAYS = 92
 
 
 class ActivityManager(BaseTool):
@@ -17,8 +49,18 @@ class ActivityManager(BaseTool):
             emoji="📊",
             json_file="tools/data/activity_manager.json"
         )
-        self.pause_tasks = {}  # Store active pause timers: {(instance_id, user_id): task}
+        self.pause_timers = PauseTimerService(self.on_pause_expired)  # Pending pause ends: {(instance_id, user_id): pause_end}
         self.refresh_tasks = {}  # Store auto-refresh tasks: {instance_id: task}
+        self.status_layouts = {}  # Cached admin panel layouts: {instance_id: (data_version, PaginatedEmbed)}
+        self.admin_pages = {}  # Page shown on each admin panel message, in memory only: {message_id: page}
+        self.user_fragments = FragmentCache()  # Formatted user lines keyed by (instance_id, user_id, version)
+        self.status_indexes = {}  # Users ordered by (status, last_action) with live counters: {instance_id: StatusIndex}
+        self.shift_log = ShiftLog("tools/data/activity_events.jsonl")  # Append-only start/pause/resume/end events
+        self.button_clicks = {}  # Last accepted shift button click: {(instance_id, user_id): monotonic time}
+        self.button_stats = {'applied': 0, 'noop': 0, 'debounced': 0}  # Shift button outcomes since startup
+        self.cutoff_sweeper = None  # Single task closing forgotten shifts of all instances
+        self.cutoff_wakeup = asyncio.Event()  # Set when a cutoff time is changed
+        self.last_cutoffs = {}  # Last cutoff swept per instance: {instance_id: datetime}
         self.bot = None  # Will be set in setup_commands
 
     async def send_setup_embeds(self, bot, instance_id: str, setup_channel_id: int, admin_channel_id: int):
@@ -47,15 +89,15 @@ class ActivityManager(BaseTool):
         await setup_channel.send(content="@everyone", embed=setup_embed, view=view)
 
         # Admin channel - send initial status embed with pagination
-        admin_embed = self.create_status_embed(instance_id, page=0)
+        admin_embeds = self.create_status_embeds(instance_id, page=0)
         admin_view = AdminPanelView(self, instance_id, page=0)
-        admin_message = await admin_channel.send(embed=admin_embed, view=admin_view)
+        admin_message = await admin_channel.send(embeds=admin_embeds, view=admin_view)
 
         # Store admin message ID for updates
         instance = self.get_instance(instance_id)
         if instance:
             instance['admin_message_id'] = admin_message.id
-            instance['admin_page'] = 0  # Track current page
+            self.track_message(admin_message.id, instance_id, None, 'admin_message_id')
             for i, inst in enumerate(self.instances['instances']):
                 if inst.get('instance_id') == instance_id:
                     self.instances['instances'][i] = instance
@@ -71,65 +113,103 @@ class ActivityManager(BaseTool):
 
         return True
 
-    def create_status_embed(self, instance_id: str, page: int = 0) -> discord.Embed:
-        """Create the status embed for admin panel with pagination"""
-        instance = self.get_instance(instance_id)
-        users = instance.get('users', {}) if instance else {}
-
-        # Convert to list for pagination
-        users_list = list(users.items())
-
-        status_emojis = {
-            'active': '🟢',
-            'pause': '🟡',
-            'ended': '🔴'
-        }
-
-        def format_user(user_data):
-            user_id, data = user_data
-            status = data['status']
-            emoji = status_emojis.get(status, '⚪')
+    def get_status_paginated(self, instance_id: str) -> PaginatedEmbed:
+        """Get the admin panel PaginatedEmbed, rebuilt only when the data changed"""
+        cached = self.status_layouts.get(instance_id)
+        if cached and cached[0] == self.data_version:
+            return cached[1]
 
-            status_text = {
-                'active': 'En shift',
-                'pause': f"En pause ({data.get('pause_duration', '?')} min)",
-                'ended': 'Shift terminé'
-            }.get(status, 'Inconnu')
-
-            last_action = data.get('last_action', 'Jamais')
-            if last_action != 'Jamais':
-                try:
-                    dt = datetime.fromisoformat(last_action)
-                    last_action = f"<t:{int(dt.timestamp())}:R>"
-                except:
-                    pass
-
-            return f"{emoji} <@{user_id}>\n**Statut:** {status_text}\n**Dernière action:** {last_action}\n"
+        status_index = self.get_status_index(instance_id)
+        counts = status_index.counts
 
         # Créer l'embed paginé
         paginated = PaginatedEmbed(
             title="📊 Pointeuse",
-            description="Statut en temps réel de tous les utilisateurs",
+            description=(
+                "Statut en temps réel de tous les utilisateurs\n"
+                f"{STATUS_EMOJIS['active']} **{counts['active']}** en shift · "
+                f"{STATUS_EMOJIS['pause']} **{counts['pause']}** en pause · "
+                f"{STATUS_EMOJIS['ended']} **{counts['ended']}** terminé(s)"
+            ),
             color=discord.Color.from_rgb(255, 255, 255),
             footer_text="Mise à jour automatique toutes les 60s",
-            items_per_page=5,
-            max_chars_per_page=1900
+            items_per_page=5,  # Users per field, a page holds as many fields as Discord allows
+            pack_fields=True
         )
 
         paginated.add_section(
             name="",
-            items=users_list,
-            formatter=format_user,
+            items=status_index,  # En shift d'abord, puis en pause, puis terminés ; seuls les users de la page sont formatés
+            formatter=self.format_user,
             empty_message="Aucun utilisateur n'a commencé son shift.",
-            inline=False
+            inline=False,
+            cache=self.user_fragments,
+            cache_key=lambda user_data: (instance_id, user_data[0], self.entity_version(instance_id, user_data[0])),
+            max_item_chars=USER_LINE_MAX_CHARS
         )
 
-        pages = paginated.generate_pages()
+        self.status_layouts[instance_id] = (self.data_version, paginated)
+        return paginated
+
+    def get_status_index(self, instance_id: str) -> StatusIndex:
+        """Status index of an instance, built from its users on first use"""
+        status_index = self.status_indexes.get(instance_id)
+        if status_index is None:
+            instance = self.get_instance(instance_id)
+            users = instance.setdefault('users', {}) if instance else {}
+            status_index = StatusIndex(users)
+            self.status_indexes[instance_id] = status_index
+        return status_index
+
+    def get_status_counts(self, instance_id: str) -> dict:
+        """Number of users per status, maintained incrementally"""
+        return dict(self.get_status_index(instance_id).counts)
+
+    @staticmethod
+    def format_user(user_data) -> str:
+        """Format one user line of the admin panel"""
+        user_id, data = user_data
+        status = data['status']
+        emoji = STATUS_EMOJIS.get(status, '⚪')
+
+        if status == 'active':
+            status_text = 'En shift'
+        elif status == 'pause':
+            status_text = f"En pause ({data.get('pause_duration', '?')} min)"
+        elif status == 'ended':
+            status_text = 'Shift terminé'
+        else:
+            status_text = 'Inconnu'
+
+        last_action = data.get('last_action', 'Jamais')
+        if last_action != 'Jamais':
+            try:
+                dt = datetime.fromisoformat(last_action)
+                last_action = f"<t:{int(dt.timestamp())}:R>"
+            except:
+                pass
+
+        return f"{emoji} <@{user_id}>\n**Statut:** {status_text}\n**Dernière action:** {last_action}\n"
+
+    def create_status_embeds(self, instance_id: str, page: int = 0) -> list:
+        """Create the admin panel embeds of one page (only the requested page is built)"""
+        return self.get_status_paginated(instance_id).render_message(page)
 
-        # S'assurer que la page demandée existe
-        page = max(0, min(page, len(pages) - 1))
+    def get_status_page_count(self, instance_id: str) -> int:
+        """Number of admin panel pages, from the same cached layout as create_status_embeds"""
+        return self.get_status_paginated(instance_id).page_count()
 
-        return pages[page]
+    def searchable_entities(self, instance: dict):
+        for user_id, data in instance.get('users', {}).items():
+            yield user_id, (data.get('username'), user_id)
+
+    def find_status_page(self, instance_id: str, query: str):
+        """Admin panel page showing the first user whose name or ID starts with query"""
+        query = query.strip().lstrip('<@!').rstrip('>')  # Accept a pasted mention
+        matches = self.search_index(instance_id).search(query)
+        if not matches:
+            return None
+        return self.get_status_paginated(instance_id).find_page(matches, key=lambda user_data: user_data[0])
 
     async def auto_refresh_admin_panel(self, bot, instance_id: str, admin_channel_id: int):
         """Auto-refresh admin panel every 60 seconds - one task per instance"""
@@ -149,18 +229,25 @@ class ActivityManager(BaseTool):
                         del self.refresh_tasks[instance_id]
                     break
 
-                try:
-                    admin_message = await admin_channel.fetch_message(instance['admin_message_id'])
-                    current_page = instance.get('admin_page', 0)
-                    new_embed = self.create_status_embed(instance_id, page=current_page)
+                # A panel known to be deleted (raw delete event) is sent again without a failing fetch
+                admin_message = None
+                if instance['admin_message_id']:
+                    try:
+                        admin_message = await admin_channel.fetch_message(instance['admin_message_id'])
+                    except discord.NotFound:
+                        pass
+
+                if admin_message:
+                    current_page = self.admin_pages.get(admin_message.id, 0)
+                    new_embeds = self.create_status_embeds(instance_id, page=current_page)
                     admin_view = AdminPanelView(self, instance_id, page=current_page)
-                    await admin_message.edit(embed=new_embed, view=admin_view)
-                except discord.NotFound:
-                    new_embed = self.create_status_embed(instance_id, page=0)
+                    await admin_message.edit(embeds=new_embeds, view=admin_view)
+                else:
+                    new_embeds = self.create_status_embeds(instance_id, page=0)
                     admin_view = AdminPanelView(self, instance_id, page=0)
-                    admin_message = await admin_channel.send(embed=new_embed, view=admin_view)
+                    admin_message = await admin_channel.send(embeds=new_embeds, view=admin_view)
                     instance['admin_message_id'] = admin_message.id
-                    instance['admin_page'] = 0
+                    self.track_message(admin_message.id, instance_id, None, 'admin_message_id')
                     for i, inst in enumerate(self.instances['instances']):
                         if inst.get('instance_id') == instance_id:
                             self.instances['instances'][i] = instance
@@ -175,8 +262,8 @@ class ActivityManager(BaseTool):
         if instance_id in self.refresh_tasks:
             del self.refresh_tasks[instance_id]
 
-    def add_user_if_not_exists(self, instance_id: str, user_id: int, username: str):
-        """Add user to tracking if they don't exist"""
+    def add_user_if_not_exists(self, instance_id: str, user_id: int, username: str, save: bool = True):
+        """Add user to tracking if they don't exist (save=False leaves the save to the caller)"""
         instance = self.get_instance(instance_id)
         if not instance:
             return
@@ -192,25 +279,42 @@ class ActivityManager(BaseTool):
                 'pause_end': None,
                 'pause_duration': None
             }
+            self.bump_entity_version(instance_id, str(user_id))
+            self.index_entity(instance_id, str(user_id), (username, str(user_id)))
+            self.reindex_user_status(instance_id, str(user_id))
             for i, inst in enumerate(self.instances['instances']):
                 if inst.get('instance_id') == instance_id:
                     self.instances['instances'][i] = instance
                     break
-            self.save_instances()
+            if save:
+                self.save_instances()
 
-    def update_user_status(self, instance_id: str, user_id: int, status: str, **kwargs):
-        """Update user status"""
+    def update_user_status(self, instance_id: str, user_id: int, status: str, **kwargs) -> bool:
+        """
+        Update user status, returns False when nothing changed.
+
+        A transition to the current status with the same extra fields (start
+        while already in shift, end while already ended...) is a no-op: no
+        event, no save and no admin panel refresh.
+        """
         instance = self.get_instance(instance_id)
         if not instance or 'users' not in instance:
-            return
+            return False
 
         user_key = str(user_id)
         if user_key in instance['users']:
+            if self.is_noop_transition(instance['users'][user_key], status, **kwargs):
+                return False
+
+            now = datetime.now()
+            self.record_shift_event(instance, user_key, status, now)
             instance['users'][user_key]['status'] = status
-            instance['users'][user_key]['last_action'] = datetime.now().isoformat()
+            instance['users'][user_key]['last_action'] = now.isoformat()
 
             for key, value in kwargs.items():
                 instance['users'][user_key][key] = value
+            self.bump_entity_version(instance_id, user_key)
+            self.reindex_user_status(instance_id, user_key)
 
             for i, inst in enumerate(self.instances['instances']):
                 if inst.get('instance_id') == instance_id:
@@ -219,6 +323,38 @@ class ActivityManager(BaseTool):
             self.save_instances()
 
             asyncio.create_task(self.refresh_admin_panel_now(instance_id))
+            return True
+        return False
+
+    @staticmethod
+    def is_noop_transition(user_data: dict, status: str, **kwargs) -> bool:
+        """True if applying `status` and `kwargs` would not change the user"""
+        if user_data.get('status') != status:
+            return False
+        return all(user_data.get(key) == value for key, value in kwargs.items())
+
+    def accept_button_click(self, instance_id: str, user_id: int) -> bool:
+        """
+        Per-user cooldown of the shift buttons: False (and counted) if the
+        user already clicked less than BUTTON_COOLDOWN_SECONDS ago.
+        """
+        now = time.monotonic()
+        key = (instance_id, user_id)
+        last = self.button_clicks.get(key)
+        if last is not None and now - last < BUTTON_COOLDOWN_SECONDS:
+            self.button_stats['debounced'] += 1
+            return False
+
+        self.button_clicks[key] = now
+        if len(self.button_clicks) > 1000:
+            # Drop the clicks whose cooldown is over so the dict stays small
+            self.button_clicks = {
+                k: t for k, t in self.button_clicks.items() if now - t < BUTTON_COOLDOWN_SECONDS
+            }
+        return True
+
+    def count_button_outcome(self, applied: bool):
+        self.button_stats['applied' if applied else 'noop'] += 1
 
     async def refresh_admin_panel_now(self, instance_id: str):
         """Immediately refresh the admin panel after a status change"""
@@ -227,7 +363,7 @@ class ActivityManager(BaseTool):
                 return
 
             instance = self.get_instance(instance_id)
-            if not instance or 'admin_message_id' not in instance:
+            if not instance or not instance.get('admin_message_id'):
                 return
 
             admin_channel = self.bot.get_channel(instance['admin_channel'])
@@ -235,52 +371,436 @@ class ActivityManager(BaseTool):
                 return
 
             admin_message = await admin_channel.fetch_message(instance['admin_message_id'])
-            current_page = instance.get('admin_page', 0)
-            new_embed = self.create_status_embed(instance_id, page=current_page)
+            current_page = self.admin_pages.get(admin_message.id, 0)
+            new_embeds = self.create_status_embeds(instance_id, page=current_page)
             admin_view = AdminPanelView(self, instance_id, page=current_page)
-            await admin_message.edit(embed=new_embed, view=admin_view)
+            await admin_message.edit(embeds=new_embeds, view=admin_view)
         except Exception as e:
             print(f"Error refreshing admin panel immediately: {e}")
 
-    def update_admin_page(self, instance_id: str, page: int):
-        """Update the current admin page"""
+    def reindex_user_status(self, instance_id: str, user_key: str):
+        """Keep the status index in sync after a user was added or changed status (O(log n) search)"""
+        status_index = self.status_indexes.get(instance_id)
+        if status_index is not None:
+            status_index.update(user_key)
+
+    def record_shift_event(self, instance: dict, user_key: str, new_status: str, now: datetime, pending_events: list = None):
+        """
+        Log a status change and update the user's daily rollups.
+
+        The interval since the previous status change is added to the worked
+        or pause time of the day(s) it covers, so totals never need a replay
+        of the event log. Called before the new status is stored. With
+        `pending_events`, the event is collected there instead of written, for
+        the caller to append once its save succeeded.
+        """
+        user = instance['users'][user_key]
+        old_status = user.get('status')
+
+        days = instance.setdefault('rollups', {}).setdefault(user_key, {})
+        self.prune_rollups(days, now.date())
+        if old_status in ('active', 'pause') and user.get('last_action'):
+            field = 'worked' if old_status == 'active' else 'paused'
+            for day, seconds in split_by_day(datetime.fromisoformat(user['last_action']), now):
+                rollup = days.setdefault(day, {'worked': 0, 'paused': 0, 'pauses': 0})
+                rollup[field] += round(seconds)
+
+        event_type = shift_event_type(old_status, new_status)
+        if event_type is None:
+            return
+        if event_type == 'pause':
+            rollup = days.setdefault(now.date().isoformat(), {'worked': 0, 'paused': 0, 'pauses': 0})
+            rollup['pauses'] += 1
+        if pending_events is not None:
+            pending_events.append((instance['instance_id'], user_key, event_type, now))
+            return
+        self.shift_log.append(instance['instance_id'], user_key, event_type, now)
+
+    @staticmethod
+    def rollup_cutoff(today: date) -> date:
+        """First day whose rollups are still kept in the instance"""
+        return today - timedelta(days=ROLLUP_RETENTION_DAYS - 1)
+
+    def prune_rollups(self, days: dict, today: date):
+        """Drop the days of a user's rollups older than the retention window"""
+        cutoff = self.rollup_cutoff(today).isoformat()
+        for day in [day for day in days if day < cutoff]:
+            del days[day]
+
+    def prune_all_rollups(self, today: date = None) -> int:
+        """Prune the rollups of every user (startup); returns the number of days dropped"""
+        today = today or date.today()
+        dropped = 0
+        for instance in self.instances['instances']:
+            rollups = instance.get('rollups', {})
+            for user_key in list(rollups):
+                before = len(rollups[user_key])
+                self.prune_rollups(rollups[user_key], today)
+                dropped += before - len(rollups[user_key])
+                if not rollups[user_key]:
+                    del rollups[user_key]
+        if dropped:
+            self.save_instances()
+        return dropped
+
+    def rollups_for_range(self, instance_id: str, rollups: dict, start_day: date, end_day: date) -> dict:
+        """
+        Daily rollups {user_id: {day: rollup}} covering [start_day, end_day]:
+        the instance's `rollups`, plus the days before the retention window
+        replayed from the shift log (only when the range reaches them).
+        """
+        cutoff = self.rollup_cutoff(date.today())
+        if start_day >= cutoff:
+            return rollups
+
+        old_end = min(end_day + timedelta(days=1), cutoff)
+        replayed = self.shift_log.daily_rollups(
+            instance_id,
+            since=datetime.combine(start_day, datetime.min.time()),
+            until=datetime.combine(old_end, datetime.min.time())
+        )
+        for user_key, days in rollups.items():
+            replayed.setdefault(user_key, {}).update(days)
+        return replayed
+
+    def get_shift_totals(self, instance_id: str, user_id: int, start_day: date, end_day: date, include_current: bool = True) -> dict:
+        """
+        Worked time, pause time (seconds) and pause count of a user over
+        [start_day, end_day], read from the daily rollups in O(days) (the
+        shift log is replayed for days past ROLLUP_RETENTION_DAYS).
+        """
+        instance = self.get_instance(instance_id)
+        user_key = str(user_id)
+        days = self.rollups_for_range(instance_id, instance.get('rollups', {}), start_day, end_day).get(user_key, {}) if instance else {}
+
+        totals = {'worked': 0, 'paused': 0, 'pauses': 0}
+        day = start_day
+        while day <= end_day:
+            rollup = days.get(day.isoformat())
+            if rollup:
+                for field in totals:
+                    totals[field] += rollup[field]
+            day += timedelta(days=1)
+
+        # Interval still open (user currently in shift or on pause)
+        user = instance.get('users', {}).get(user_key) if instance else None
+        if include_current and user and user.get('status') in ('active', 'pause') and user.get('last_action'):
+            field = 'worked' if user['status'] == 'active' else 'paused'
+            for day_iso, seconds in split_by_day(datetime.fromisoformat(user['last_action']), datetime.now()):
+                if start_day.isoformat() <= day_iso <= end_day.isoformat():
+                    totals[field] += seconds
+        return totals
+
+    def get_week_totals(self, instance_id: str, user_id: int) -> dict:
+        """Totals of the current week (Monday to today)"""
+        today = date.today()
+        return self.get_shift_totals(instance_id, user_id, today - timedelta(days=today.weekday()), today)
+
+    async def start_pause_timer(self, bot, instance_id: str, user_id: int, duration_minutes: int):
+        """Schedule the end of a user's pause (uses the stored pause_end when set)"""
+        self.bot = bot
+        pause_end = None
         instance = self.get_instance(instance_id)
         if instance:
-            instance['admin_page'] = page
-            for i, inst in enumerate(self.instances['instances']):
-                if inst.get('instance_id') == instance_id:
-                    self.instances['instances'][i] = instance
-                    break
+            pause_end = instance.get('users', {}).get(str(user_id), {}).get('pause_end')
+
+        due = datetime.fromisoformat(pause_end) if pause_end else datetime.now() + timedelta(minutes=duration_minutes)
+        self.pause_timers.schedule((instance_id, user_id), due.timestamp())
+        self.pause_timers.start()
+
+    def cancel_pause_timer(self, instance_id: str, user_id: int):
+        """Cancel a pending pause end (end of shift...)"""
+        self.pause_timers.cancel((instance_id, user_id))
+
+    def restore_pause_timers(self, bot) -> int:
+        """Reschedule the pauses stored in the instances, returns how many were restored"""
+        self.bot = bot
+        restored = 0
+        for instance in self.instances['instances']:
+            for user_key, data in instance.get('users', {}).items():
+                if data.get('status') != 'pause' or not data.get('pause_end'):
+                    continue
+                try:
+                    due = datetime.fromisoformat(data['pause_end'])
+                except ValueError:
+                    continue
+                # Pauses already over are delivered in the first batch
+                self.pause_timers.schedule((instance['instance_id'], int(user_key)), due.timestamp())
+                restored += 1
+        self.pause_timers.start()
+        return restored
+
+    async def restore_state(self, bot):
+        dropped = self.prune_all_rollups()
+        if dropped:
+            print(f"Pruned {dropped} day(s) of rollups older than {ROLLUP_RETENTION_DAYS} days for {self.display_name}")
+        restored = self.restore_pause_timers(bot)
+        if restored:
+            print(f"Restored {restored} pause timer(s) for {self.display_name}")
+        self.start_cutoff_sweeper(bot)
+
+    @staticmethod
+    def parse_cutoff_time(instance: dict):
+        """Configured cutoff time of an instance as (hour, minute), None if disabled"""
+        value = instance.get('shift_cutoff_time')
+        if not value:
+            return None
+        try:
+            cutoff = datetime.strptime(value, '%H:%M')
+        except ValueError:
+            return None
+        return cutoff.hour, cutoff.minute
+
+    def latest_cutoff(self, instance: dict, now: datetime):
+        """Most recent cutoff at or before `now` (None if disabled)"""
+        cutoff_time = self.parse_cutoff_time(instance)
+        if cutoff_time is None:
+            return None
+        cutoff = now.replace(hour=cutoff_time[0], minute=cutoff_time[1], second=0, microsecond=0)
+        return cutoff if cutoff <= now else cutoff - timedelta(days=1)
+
+    def start_cutoff_sweeper(self, bot):
+        """Start the shift cutoff task (no-op if already running)"""
+        self.bot = bot
+        if self.cutoff_sweeper is None or self.cutoff_sweeper.done():
+            self.cutoff_sweeper = asyncio.create_task(self.run_cutoff_sweeper())
+
+    async def run_cutoff_sweeper(self):
+        """
+        Sleep until the next cutoff of any instance, then close the stale
+        shifts of every instance whose cutoff has passed.
+
+        On the first pass the latest past cutoff of each instance is swept,
+        which closes the shifts forgotten while the bot was offline.
+        """
+        while True:
+            try:
+                self.cutoff_wakeup.clear()
+                now = datetime.now()
+                next_due = None
+                for instance in list(self.instances['instances']):
+                    instance_id = instance['instance_id']
+                    cutoff = self.latest_cutoff(instance, now)
+                    if cutoff is None:
+                        continue
+                    if self.last_cutoffs.get(instance_id) != cutoff:
+                        self.last_cutoffs[instance_id] = cutoff
+                        if self.claim_once(f"shift_cutoff:{instance_id}:{cutoff.isoformat()}"):
+                            await self.close_stale_shifts(instance_id, cutoff)
+                    upcoming = cutoff + timedelta(days=1)
+                    if next_due is None or upcoming < next_due:
+                        next_due = upcoming
+
+                timeout = None if next_due is None else max((next_due - datetime.now()).total_seconds(), 0) + 1
+                try:
+                    await asyncio.wait_for(self.cutoff_wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error in shift cutoff sweeper: {e}")
+                await asyncio.sleep(60)
+
+    async def close_stale_shifts(self, instance_id: str, cutoff: datetime) -> list:
+        """
+        End every shift (active or on pause) with no action during the
+        instance's minimum idle time before `cutoff` (SHIFT_CUTOFF_MIN_IDLE_HOURS
+        by default), as if the user had clicked "Fin de shift" at the cutoff.
+        A shift with a recent action, e.g. a night shift running across the
+        cutoff, is left open: if it is really forgotten, a later cutoff
+        closes it.
+
+        Stale users come from the status index (bisect on last_action), and
+        the whole sweep is saved once and refreshes the admin panel once.
+        Returns the closed user ids.
+        """
+        instance = self.get_instance(instance_id)
+        if not instance or not instance.get('users'):
+            return []
+
+        idle_since = cutoff - timedelta(hours=instance.get('shift_cutoff_min_idle') or SHIFT_CUTOFF_MIN_IDLE_HOURS)
+        status_index = self.get_status_index(instance_id)
+        stale = status_index.users_with_status_before('active', idle_since) + status_index.users_with_status_before('pause', idle_since)
+        if not stale:
+            return []
+
+        self.apply_bulk_update(instance_id, {user_key: 'ended' for user_key in stale}, at=cutoff)
+        print(f"Closed {len(stale)} forgotten shift(s) for {self.display_name} instance {instance_id}")
+
+        if instance.get('shift_cutoff_dm'):
+            asyncio.create_task(self.notify_closed_shifts(stale, cutoff))
+        return stale
+
+    def apply_bulk_update(self, instance_id: str, transitions: dict, removals=(), at: datetime = None) -> int:
+        """
+        Apply many status changes ({user_id: status}) and user removals as
+        one transaction: every user is updated in memory (rollups, indexes,
+        pause timers), then the state is saved once, the shift events
+        appended to the log and the admin panel refreshed once. If the save
+        fails the users and rollups are restored, nothing is logged and the
+        error is raised. Removed users lose their rollups (the shift log
+        keeps their history). Returns the number of users changed.
+        """
+        instance = self.get_instance(instance_id)
+        if not instance or 'users' not in instance:
+            return 0
+
+        at = at or datetime.now()
+        users = instance['users']
+        removals = [user_key for user_key in removals if user_key in users]
+        changed = {
+            user_key: status for user_key, status in transitions.items()
+            if user_key in users and not self.is_noop_transition(users[user_key], status)
+        }
+        # Users leaving with an open shift get their end of shift logged first
+        for user_key in removals:
+            if users[user_key].get('status') in ('active', 'pause'):
+                changed.setdefault(user_key, 'ended')
+        if not changed and not removals:
+            return 0
+
+        snapshot = {user_key: dict(users[user_key]) for user_key in set(changed) | set(removals)}
+        rollups = instance.setdefault('rollups', {})
+        rollups_snapshot = {
+            user_key: {day: dict(rollup) for day, rollup in rollups[user_key].items()}
+            for user_key in snapshot if user_key in rollups
+        }
+
+        # Events are written to the shift log only once the save succeeded
+        events = []
+        for user_key, status in changed.items():
+            self.record_shift_event(instance, user_key, status, at, pending_events=events)
+            user = users[user_key]
+            user['status'] = status
+            user['last_action'] = at.isoformat()
+            user['pause_end'] = None
+            user['pause_duration'] = None
+        for user_key in removals:
+            del users[user_key]
+            rollups.pop(user_key, None)  # Their history stays in the shift log
+
+        try:
             self.save_instances()
+        except Exception:
+            users.update(snapshot)
+            for user_key in snapshot:
+                if user_key in rollups_snapshot:
+                    rollups[user_key] = rollups_snapshot[user_key]
+                else:
+                    rollups.pop(user_key, None)
+            raise
+        self.shift_log.append_many(events)
+
+        for user_key in snapshot:
+            self.bump_entity_version(instance_id, user_key)
+            self.reindex_user_status(instance_id, user_key)
+            self.cancel_pause_timer(instance_id, int(user_key))
+        for user_key in removals:
+            self.unindex_entity(instance_id, user_key)
 
-    async def start_pause_timer(self, bot, instance_id: str, user_id: int, duration_minutes: int):
-        """Start a pause timer for a user"""
-        if (instance_id, user_id) in self.pause_tasks:
-            self.pause_tasks[(instance_id, user_id)].cancel()
+        asyncio.create_task(self.refresh_admin_panel_now(instance_id))
+        return len(snapshot)
 
-        async def pause_timer():
-            await asyncio.sleep(duration_minutes * 60)
+    def end_all_shifts(self, instance_id: str) -> int:
+        """End every open shift (active or on pause) of an instance"""
+        status_index = self.get_status_index(instance_id)
+        open_shifts = status_index.users_with_status('active') + status_index.users_with_status('pause')
+        return self.apply_bulk_update(instance_id, {user_key: 'ended' for user_key in open_shifts})
 
-            user = await bot.fetch_user(user_id)
-            if user:
+    def clear_all_pauses(self, instance_id: str) -> int:
+        """Put every user on pause back in shift"""
+        paused = self.get_status_index(instance_id).users_with_status('pause')
+        return self.apply_bulk_update(instance_id, {user_key: 'active' for user_key in paused})
+
+    async def purge_departed_users(self, instance_id: str, guild: discord.Guild) -> int:
+        """Remove the users who are no longer members of the guild"""
+        instance = self.get_instance(instance_id)
+        if not instance or not guild:
+            return 0
+        if not guild.chunked:
+            await guild.chunk()
+        departed = [user_key for user_key in instance.get('users', {}) if guild.get_member(int(user_key)) is None]
+        return self.apply_bulk_update(instance_id, {}, removals=departed)
+
+    async def notify_closed_shifts(self, user_keys: list, cutoff: datetime):
+        """DM the users whose shift was closed automatically (bounded concurrency)"""
+        semaphore = asyncio.Semaphore(SHIFT_CUTOFF_DM_CONCURRENCY)
+
+        async def notify(user_key):
+            async with semaphore:
                 try:
-                    embed = discord.Embed(
-                        title="⏰ Pause terminée",
-                        description=f"Ta pause de {duration_minutes} minutes est terminée !\nClique sur le bouton pour confirmer que tu reprends ton shift.",
-                        color=discord.Color.from_rgb(255, 255, 255)
+                    user_id = int(user_key)
+                    user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+                    await user.send(
+                        f"🔴 Ton shift a été clôturé automatiquement à {cutoff.strftime('%H:%M')} "
+                        f"(oubli de **Fin de shift** ?)."
                     )
-                    view = ConfirmResumeView(self, instance_id, user_id)
-                    await user.send(embed=embed, view=view)
                 except Exception as e:
-                    print(f"Error sending pause end DM: {e}")
-                    # Fallback: repasser en active automatiquement si le DM ne passe pas
-                    self.update_user_status(instance_id, user_id, 'active', pause_end=None, pause_duration=None)
+                    print(f"Error sending shift cutoff DM: {e}")
+
+        await asyncio.gather(*(notify(user_key) for user_key in user_keys))
 
-            if (instance_id, user_id) in self.pause_tasks:
-                del self.pause_tasks[(instance_id, user_id)]
+    async def set_shift_cutoff(self, interaction: discord.Interaction, time_value: str, dm: bool, min_idle_hours: int = None):
+        """Configure (or disable with "off") the automatic shift closure of an instance"""
+        instance = await self.resolve_command_instance(interaction)
+        if not instance:
+            return
 
-        task = asyncio.create_task(pause_timer())
-        self.pause_tasks[(instance_id, user_id)] = task
+        if time_value.strip().lower() == 'off':
+            instance['shift_cutoff_time'] = None
+            message = "✅ Clôture automatique des shifts désactivée."
+        else:
+            try:
+                cutoff = datetime.strptime(time_value.strip(), '%H:%M')
+            except ValueError:
+                await interaction.response.send_message(
+                    "❌ Heure invalide, utilisez le format HH:MM (ou off).",
+                    ephemeral=True,
+                    delete_after=60
+                )
+                return
+            instance['shift_cutoff_time'] = cutoff.strftime('%H:%M')
+            if min_idle_hours is not None:
+                instance['shift_cutoff_min_idle'] = min_idle_hours
+            idle = instance.get('shift_cutoff_min_idle') or SHIFT_CUTOFF_MIN_IDLE_HOURS
+            message = (
+                f"✅ Les shifts sans action depuis {idle} h seront clôturés chaque jour à {instance['shift_cutoff_time']}"
+                + (" avec un message privé." if dm else ".")
+            )
+        instance['shift_cutoff_dm'] = dm
+        self.save_instances()
+
+        # New cutoff: don't sweep a cutoff that already passed today, only the next one
+        cutoff = self.latest_cutoff(instance, datetime.now())
+        if cutoff is not None:
+            self.last_cutoffs[instance['instance_id']] = cutoff
+        self.cutoff_wakeup.set()
+
+        await interaction.response.send_message(message, ephemeral=True, delete_after=60)
+
+    async def on_pause_expired(self, key):
+        """Called by the pause timer service when a pause is over: DM the user"""
+        instance_id, user_id = key
+        instance = self.get_instance(instance_id)
+        data = instance.get('users', {}).get(str(user_id)) if instance else None
+        if not data or data.get('status') != 'pause':
+            return  # Shift ended or resumed meanwhile
+
+        duration_minutes = data.get('pause_duration', '?')
+        try:
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            embed = discord.Embed(
+                title="⏰ Pause terminée",
+                description=f"Ta pause de {duration_minutes} minutes est terminée !\nClique sur le bouton pour confirmer que tu reprends ton shift.",
+                color=discord.Color.from_rgb(255, 255, 255)
+            )
+            view = ConfirmResumeView(self, instance_id, user_id)
+            await user.send(embed=embed, view=view)
+        except Exception as e:
+            print(f"Error sending pause end DM: {e}")
+            # Fallback: repasser en active automatiquement si le DM ne passe pas
+            self.update_user_status(instance_id, user_id, 'active', pause_end=None, pause_duration=None)
 
     async def confirm_resume(self, instance_id: str, user_id: int):
         """Confirm user is resuming work after pause"""
@@ -288,10 +808,176 @@ class ActivityManager(BaseTool):
         asyncio.create_task(self.refresh_admin_panel_now(instance_id))
 
 
+    def build_export_rows(self, instance: dict, start_day: date, end_day: date, content: str = 'heures'):
+        """Columns and row generator of a shift export (daily hours or raw events)"""
+        users = instance.get('users', {})
+
+        if content == 'evenements':
+            columns = ['date', 'heure', 'user_id', 'username', 'evenement']
+            events = self.shift_log.iter_events(
+                instance['instance_id'],
+                since=datetime.combine(start_day, datetime.min.time()),
+                until=datetime.combine(end_day + timedelta(days=1), datetime.min.time())
+            )
+            rows = (
+                (event['at'][:10], event['at'][11:19], event['user_id'],
+                 users.get(event['user_id'], {}).get('username'), event['type'])
+                for event in events
+            )
+            return columns, rows
+
+        columns = ['date', 'user_id', 'username', 'heures_travaillees', 'heures_pause', 'pauses']
+        # Only a shallow copy is taken here, the generator (and any log replay) runs in the export thread
+        recent = {user_key: dict(days) for user_key, days in instance.get('rollups', {}).items()}
+
+        def timesheet_rows():
+            rollups = list(self.rollups_for_range(instance['instance_id'], recent, start_day, end_day).items())
+            day = start_day
+            while day <= end_day:
+                day_iso = day.isoformat()
+                for user_key, days in rollups:
+                    rollup = days.get(day_iso)
+                    if rollup:
+                        yield (
+                            day_iso, user_key, users.get(user_key, {}).get('username'),
+                            round(rollup['worked'] / 3600, 2), round(rollup['paused'] / 3600, 2), rollup['pauses']
+                        )
+                day += timedelta(days=1)
+
+        return columns, timesheet_rows()
+
+    def create_stats_embed(self, summary: dict, start_day: date, end_day: date) -> discord.Embed:
+        """Summary embed of the shift analytics"""
+        embed = discord.Embed(
+            title="📈 Statistiques Pointeuse",
+            description=f"Du **{start_day}** au **{end_day}**",
+            color=discord.Color.from_rgb(255, 255, 255)
+        )
+        embed.add_field(
+            name="⏱️ Heures travaillées",
+            value=f"{summary['worked_hours']:.1f} h ({summary['users']} utilisateur(s))",
+            inline=True
+        )
+        embed.add_field(
+            name="☕ Pauses",
+            value=f"{summary['pauses']} pause(s), {summary['average_pause'] / 60:.0f} min en moyenne",
+            inline=True
+        )
+
+        late_users = summary['late_users']
+        late_lines = [f"<@{user_id}> : {count} jour(s)" for user_id, count in late_users[:5]]
+        if len(late_users) > 5:
+            late_lines.append(f"*... et {len(late_users) - 5} autre(s)*")
+        embed.add_field(name="⏰ Retards", value="\n".join(late_lines) or "Aucun retard", inline=False)
+
+        embed.add_field(
+            name=f"📅 Couverture par heure (pic : {summary['heatmap'].max():.1f} en shift)",
+            value=f"```\n{heatmap_text(summary['heatmap'])}\n```",
+            inline=False
+        )
+        embed.set_footer(text=f"{summary['events']} événement(s) analysé(s)")
+        return embed
+
+    async def send_stats(self, interaction: discord.Interaction, start: str, end: str, chart: bool = False):
+        """Compute the analytics of the instance for a date range and send the summary"""
+        if not numpy_available():
+            await interaction.response.send_message(
+                "❌ Les statistiques nécessitent le paquet numpy.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        instance = await self.resolve_command_instance(interaction)
+        if not instance:
+            return
+
+        try:
+            start_day, end_day = parse_day(start), parse_day(end)
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ Dates invalides, utilisez le format AAAA-MM-JJ.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        range_start = datetime.combine(start_day, datetime.min.time())
+        range_end = datetime.combine(end_day + timedelta(days=1), datetime.min.time())
+        shift_start = datetime.strptime(instance.get('shift_start_time', DEFAULT_SHIFT_START_TIME), '%H:%M')
+        start_of_day = shift_start.hour * 3600 + shift_start.minute * 60 + LATE_START_GRACE_MINUTES * 60
+
+        # One day of margin to know who was already in shift when the range starts
+        events = self.shift_log.iter_events(instance['instance_id'], since=range_start - timedelta(days=1), until=range_end)
+        try:
+            summary = await asyncio.to_thread(compute_summary, events, range_start, range_end, datetime.now(), start_of_day)
+        except Exception as e:
+            print(f"Error computing activity stats: {e}")
+            await interaction.followup.send("❌ Erreur lors du calcul des statistiques.", ephemeral=True)
+            return
+
+        embed = self.create_stats_embed(summary, start_day, end_day)
+        extra = {}
+        if chart:
+            try:
+                png = await asyncio.get_running_loop().run_in_executor(
+                    chart_pool(), render_heatmap_png, summary['heatmap'].tolist(), f"Couverture du {start_day} au {end_day}"
+                )
+                extra['file'] = discord.File(io.BytesIO(png), filename="couverture.png")
+                embed.set_image(url="attachment://couverture.png")
+            except Exception as e:
+                print(f"Error rendering activity chart: {e}")
+
+        await interaction.followup.send(embed=embed, ephemeral=True, **extra)
+
     async def setup_commands(self, bot):
         """Register ActivityManager-specific commands"""
         self.bot = bot
 
+        @bot.tree.command(name="stats_pointeuse", description="Statistiques de présence (couverture, pauses, retards)")
+        @app_commands.describe(
+            debut="Date de début (AAAA-MM-JJ)",
+            fin="Date de fin incluse (AAAA-MM-JJ)",
+            graphique="Joindre un graphique PNG de la couverture"
+        )
+        async def stats_pointeuse(interaction: discord.Interaction, debut: str, fin: str, graphique: bool = False):
+            await self.send_stats(interaction, debut, fin, graphique)
+
+        @bot.tree.command(name="cloture_pointeuse", description="Clôturer automatiquement les shifts oubliés chaque jour")
+        @app_commands.describe(
+            heure="Heure de clôture (HH:MM) ou off pour désactiver",
+            dm="Prévenir les utilisateurs concernés en message privé",
+            inactivite=f"Heures sans action avant la clôture pour considérer un shift oublié (défaut {SHIFT_CUTOFF_MIN_IDLE_HOURS})"
+        )
+        async def cloture_pointeuse(interaction: discord.Interaction, heure: str, dm: bool = False,
+                                    inactivite: app_commands.Range[int, 1, 48] = None):
+            await self.set_shift_cutoff(interaction, heure, dm, inactivite)
+
+        @bot.tree.command(name="export_pointeuse", description="Exporter les heures ou les événements de shift")
+        @app_commands.describe(
+            debut="Date de début (AAAA-MM-JJ)",
+            fin="Date de fin incluse (AAAA-MM-JJ)",
+            contenu="Heures par jour ou journal des événements",
+            format="Format du fichier"
+        )
+        @app_commands.choices(
+            contenu=[
+                app_commands.Choice(name="Heures par jour", value="heures"),
+                app_commands.Choice(name="Événements", value="evenements")
+            ],
+            format=[
+                app_commands.Choice(name="CSV (gzip)", value="csv"),
+                app_commands.Choice(name="Parquet", value="parquet")
+            ]
+        )
+        async def export_pointeuse(interaction: discord.Interaction, debut: str, fin: str, contenu: str = 'heures', format: str = 'csv'):
+            await self.run_export(
+                interaction, debut, fin, format, f"pointeuse_{contenu}",
+                lambda instance, start_day, end_day: self.build_export_rows(instance, start_day, end_day, contenu)
+            )
+
 
 # Confirm Resume View (for DM after pause)
 class ConfirmResumeView(discord.ui.View):
@@ -335,47 +1021,117 @@ class AdminPanelView(discord.ui.View):
         self.instance_id = instance_id
         self.page = page
 
-        instance = manager.get_instance(instance_id)
-        users = instance.get('users', {}) if instance else {}
-        total_users = len(users)
-        total_pages = max(1, (total_users + 4) // 5)
-
-        prev_button = discord.ui.Button(
+        self.prev_button = discord.ui.Button(
             label="◀️ Précédent",
-            style=discord.ButtonStyle.gray,
-            disabled=(page == 0)
+            style=discord.ButtonStyle.gray
         )
-        prev_button.callback = self.previous_page
-        self.add_item(prev_button)
+        self.prev_button.callback = self.previous_page
+        self.add_item(self.prev_button)
 
-        next_button = discord.ui.Button(
+        self.next_button = discord.ui.Button(
             label="Suivant ▶️",
-            style=discord.ButtonStyle.gray,
-            disabled=(page >= total_pages - 1)
+            style=discord.ButtonStyle.gray
         )
-        next_button.callback = self.next_page
-        self.add_item(next_button)
+        self.next_button.callback = self.next_page
+        self.add_item(self.next_button)
 
-    async def previous_page(self, interaction: discord.Interaction):
-        self.page = max(0, self.page - 1)
-        self.manager.update_admin_page(self.instance_id, self.page)
+        self.jump_button = discord.ui.Button(
+            label="🔎 Rechercher",
+            style=discord.ButtonStyle.gray
+        )
+        self.jump_button.callback = self.open_search
+        self.add_item(self.jump_button)
+
+        self.bulk_button = discord.ui.Button(
+            label="⚙️ Actions groupées",
+            style=discord.ButtonStyle.gray
+        )
+        self.bulk_button.callback = self.open_bulk_actions
+        self.add_item(self.bulk_button)
+
+        self._update_buttons()
 
-        new_embed = self.manager.create_status_embed(self.instance_id, page=self.page)
-        new_view = AdminPanelView(self.manager, self.instance_id, page=self.page)
-        await interaction.response.edit_message(embed=new_embed, view=new_view)
+    def _update_buttons(self):
+        total_pages = self.manager.get_status_page_count(self.instance_id)
+        self.page = max(0, min(self.page, total_pages - 1))
+        self.prev_button.disabled = (self.page == 0)
+        self.next_button.disabled = (self.page >= total_pages - 1)
+
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        """Navigation purely in memory: no state is written to disk"""
+        self.page = page
+        self._update_buttons()
+        self.manager.admin_pages[interaction.message.id] = self.page
+
+        new_embeds = self.manager.create_status_embeds(self.instance_id, page=self.page)
+        await interaction.response.edit_message(embeds=new_embeds, view=self)
+
+    async def previous_page(self, interaction: discord.Interaction):
+        await self._show_page(interaction, self.page - 1)
 
     async def next_page(self, interaction: discord.Interaction):
-        instance = self.manager.get_instance(self.instance_id)
-        users = instance.get('users', {}) if instance else {}
-        total_users = len(users)
-        total_pages = max(1, (total_users + 4) // 5)
+        await self._show_page(interaction, self.page + 1)
+
+    async def open_search(self, interaction: discord.Interaction):
+        modal = JumpToPageModal(
+            self.manager.get_status_page_count(self.instance_id),
+            self._show_page,
+            lambda query: self.manager.find_status_page(self.instance_id, query),
+            search_label="Utilisateur (nom ou ID)"
+        )
+        await interaction.response.send_modal(modal)
+
+    async def open_bulk_actions(self, interaction: discord.Interaction):
+        if not await self.manager.check_permission(interaction):
+            return
+
+        counts = self.manager.get_status_counts(self.instance_id)
+        await interaction.response.send_message(
+            "⚙️ **Actions groupées**\n"
+            f"{STATUS_EMOJIS['active']} {counts['active']} en shift · "
+            f"{STATUS_EMOJIS['pause']} {counts['pause']} en pause\n"
+            "Chaque action est appliquée à tous les utilisateurs concernés en une seule fois.",
+            view=BulkActionsView(self.manager, self.instance_id),
+            ephemeral=True,
+            delete_after=120
+        )
+
+
+# Bulk actions (ephemeral, opened from the admin panel)
+class BulkActionsView(discord.ui.View):
+    def __init__(self, manager: ActivityManager, instance_id: str):
+        super().__init__(timeout=120)
+        self.manager = manager
+        self.instance_id = instance_id
+
+    async def _run(self, interaction: discord.Interaction, action, done_message: str):
+        # Acknowledge first: fetching the members of a large guild can outlast the 3 s deadline
+        await interaction.response.defer()
+        try:
+            count = await action()
+        except Exception as e:
+            print(f"Error applying bulk action: {e}")
+            await interaction.edit_original_response(content="❌ Erreur, aucune modification n'a été enregistrée.", view=None)
+            return
+        await interaction.edit_original_response(content=done_message.format(count=count), view=None)
+
+    @discord.ui.button(label="Terminer tous les shifts", style=discord.ButtonStyle.red, emoji="🔴")
+    async def end_all(self, interaction: discord.Interaction, button: discord.ui.Button):
+        async def action():
+            return self.manager.end_all_shifts(self.instance_id)
+        await self._run(interaction, action, "✅ {count} shift(s) terminé(s).")
 
-        self.page = min(total_pages - 1, self.page + 1)
-        self.manager.update_admin_page(self.instance_id, self.page)
+    @discord.ui.button(label="Lever toutes les pauses", style=discord.ButtonStyle.gray, emoji="🟢")
+    async def clear_pauses(self, interaction: discord.Interaction, button: discord.ui.Button):
+        async def action():
+            return self.manager.clear_all_pauses(self.instance_id)
+        await self._run(interaction, action, "✅ {count} pause(s) levée(s).")
 
-        new_embed = self.manager.create_status_embed(self.instance_id, page=self.page)
-        new_view = AdminPanelView(self.manager, self.instance_id, page=self.page)
-        await interaction.response.edit_message(embed=new_embed, view=new_view)
+    @discord.ui.button(label="Retirer les membres partis", style=discord.ButtonStyle.gray, emoji="🧹")
+    async def purge(self, interaction: discord.Interaction, button: discord.ui.Button):
+        async def action():
+            return await self.manager.purge_departed_users(self.instance_id, interaction.guild)
+        await self._run(interaction, action, "✅ {count} utilisateur(s) retiré(s).")
 
 
 # Activity Buttons View
@@ -385,43 +1141,60 @@ class ActivityButtonsView(discord.ui.View):
         self.manager = manager
         self.instance_id = instance_id
 
+    async def _debounced(self, interaction: discord.Interaction) -> bool:
+        """Reply and return True if the click falls within the user's cooldown"""
+        if self.manager.accept_button_click(self.instance_id, interaction.user.id):
+            return False
+        await interaction.response.send_message(
+            "⏳ Doucement ! Réessaie dans quelques secondes.",
+            ephemeral=True,
+            delete_after=60
+        )
+        return True
+
     @discord.ui.button(label="Début de shift", style=discord.ButtonStyle.green, emoji="👋")
     async def start_shift(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if await self._debounced(interaction):
+            return
+
+        # Saved together with the status change below
         self.manager.add_user_if_not_exists(
             self.instance_id,
             interaction.user.id,
-            interaction.user.name
+            interaction.user.name,
+            save=False
         )
 
-        self.manager.update_user_status(self.instance_id, interaction.user.id, 'active')
+        applied = self.manager.update_user_status(self.instance_id, interaction.user.id, 'active')
+        self.manager.count_button_outcome(applied)
 
         await interaction.response.send_message(
-            "✅ Je commence mon shift ! 🚀",
+            "✅ Je commence mon shift ! 🚀" if applied else "ℹ️ Ton shift est déjà en cours.",
             ephemeral=True,
             delete_after=60
         )
 
     @discord.ui.button(label="Pause", style=discord.ButtonStyle.gray, emoji="☕")
     async def take_pause(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if await self._debounced(interaction):
+            return
+
         modal = PauseModal(self.manager, self.instance_id)
         await interaction.response.send_modal(modal)
 
     @discord.ui.button(label="Fin de shift", style=discord.ButtonStyle.red, emoji="👋")
     async def end_shift(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.manager.add_user_if_not_exists(
-            self.instance_id,
-            interaction.user.id,
-            interaction.user.name
-        )
-
-        if (self.instance_id, interaction.user.id) in self.manager.pause_tasks:
-            self.manager.pause_tasks[(self.instance_id, interaction.user.id)].cancel()
-            del self.manager.pause_tasks[(self.instance_id, interaction.user.id)]
+        if await self._debounced(interaction):
+            return
 
-        self.manager.update_user_status(self.instance_id, interaction.user.id, 'ended')
+        # Unknown users are created with status 'ended': nothing to do for them
+        applied = self.manager.update_user_status(self.instance_id, interaction.user.id, 'ended')
+        self.manager.count_button_outcome(applied)
+        if applied:
+            self.manager.cancel_pause_timer(self.instance_id, interaction.user.id)
 
         await interaction.response.send_message(
-            "✅ Mon shift est terminé, à demain ! 🙌",
+            "✅ Mon shift est terminé, à demain ! 🙌" if applied else "ℹ️ Ton shift est déjà terminé.",
             ephemeral=True,
             delete_after=60
         )
@@ -456,18 +1229,20 @@ class PauseModal(discord.ui.Modal):
             self.manager.add_user_if_not_exists(
                 self.instance_id,
                 interaction.user.id,
-                interaction.user.name
+                interaction.user.name,
+                save=False
             )
 
             pause_end = (datetime.now() + timedelta(minutes=duration)).isoformat()
 
-            self.manager.update_user_status(
+            applied = self.manager.update_user_status(
                 self.instance_id,
                 interaction.user.id,
                 'pause',
                 pause_end=pause_end,
                 pause_duration=duration
             )
+            self.manager.count_button_outcome(applied)
 
             bot = interaction.client
             await self.manager.start_pause_timer(bot, self.instance_id, interaction.user.id, duration)
@@ -0,0 +1,208 @@
+"""
+Shift analytics over the ActivityManager event log.
+
+Events are loaded once into columnar NumPy arrays (user code, event type,
+local time in seconds) and every statistic is computed with array
+operations: shift/pause intervals come from shifting the sorted arrays by
+one, the hour-of-week coverage uses a difference array over absolute hours,
+and late starts use the first start of each (user, day) pair.
+"""
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # Analytics are optional
+    np = None
+
+
+EVENT_CODES = {'start': 0, 'pause': 1, 'resume': 2, 'end': 3}
+STATE_ENDED, STATE_ACTIVE, STATE_PAUSE = 0, 1, 2
+DAY_NAMES = ['Lun', 'Mar', 'Mer', 'Jeu', 'Ven', 'Sam', 'Dim']
+HEATMAP_LEVELS = " ▁▂▃▄▅▆▇█"
+
+# Local times are counted from a Monday so that hour // 24 % 7 is the weekday
+_EPOCH = "1970-01-05"
+
+_chart_pool = None
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class EventArrays:
+    """Columnar copy of the shift events of one instance, sorted by (user, time)"""
+
+    def __init__(self, events):
+        user_ids = []
+        codes = []
+        times = []
+        for event in events:
+            user_ids.append(event['user_id'])
+            codes.append(EVENT_CODES[event['type']])
+            times.append(event['at'][:19])
+
+        self.user_ids, users = np.unique(np.array(user_ids, dtype=str), return_inverse=True)
+        users = users.astype(np.int64)
+        seconds = (np.array(times, dtype='datetime64[s]') - np.datetime64(_EPOCH, 's')).astype(np.int64)
+        codes = np.array(codes, dtype=np.int8)
+
+        order = np.lexsort((seconds, users))
+        self.users = users[order]
+        self.codes = codes[order]
+        self.seconds = seconds[order]
+
+    def __len__(self) -> int:
+        return len(self.seconds)
+
+    def intervals(self, now: int):
+        """
+        (users, states, starts, ends) of the intervals between consecutive
+        events of each user; the last interval of a user still in shift or on
+        pause runs until `now`.
+        """
+        # State entered by each event: start/resume -> active, pause -> pause, end -> ended
+        states = np.choose(self.codes, [STATE_ACTIVE, STATE_PAUSE, STATE_ACTIVE, STATE_ENDED]).astype(np.int8)
+        same_user = np.zeros(len(self), dtype=bool)
+        same_user[:-1] = self.users[1:] == self.users[:-1]
+        ends = np.where(states != STATE_ENDED, np.maximum(now, self.seconds), self.seconds)
+        ends[:-1] = np.where(same_user[:-1], self.seconds[1:], ends[:-1])
+        return self.users, states, self.seconds, ends
+
+
+def to_local_seconds(value) -> int:
+    """Seconds since the analytics epoch for a naive local datetime"""
+    return int((np.datetime64(value.replace(microsecond=0).isoformat(), 's') - np.datetime64(_EPOCH, 's')).astype(np.int64))
+
+
+def coverage_heatmap(starts, ends, range_start: int, range_end: int):
+    """
+    Average number of users on shift for each hour of the week (7 x 24).
+
+    Full hours are added with a difference array over absolute hours, the
+    partial first/last hour of each interval with np.add.at.
+    """
+    starts = np.clip(starts, range_start, range_end)
+    ends = np.clip(ends, range_start, range_end)
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+
+    base_hour = range_start // 3600
+    hours = (range_end - 1) // 3600 - base_hour + 1
+    busy = np.zeros(hours, dtype=np.float64)  # Person-seconds per absolute hour
+
+    h0 = starts // 3600 - base_hour
+    h1 = (ends - 1) // 3600 - base_hour
+    single = h0 == h1
+    np.add.at(busy, h0[single], (ends - starts)[single])
+
+    multi = ~single
+    m0, m1 = h0[multi], h1[multi]
+    np.add.at(busy, m0, (m0 + base_hour + 1) * 3600 - starts[multi])
+    np.add.at(busy, m1, ends[multi] - (m1 + base_hour) * 3600)
+    diff = np.zeros(hours + 1, dtype=np.float64)
+    np.add.at(diff, m0 + 1, 3600)
+    np.add.at(diff, m1, -3600)
+    busy += np.cumsum(diff)[:hours]
+
+    # Fold absolute hours onto the hour of the week, averaged over the weeks covered
+    hour_of_week = (np.arange(hours) + base_hour) % 168
+    totals = np.bincount(hour_of_week, weights=busy, minlength=168)
+    occurrences = np.bincount(hour_of_week, minlength=168)
+    return (totals / np.maximum(occurrences, 1) / 3600).reshape(7, 24)
+
+
+def average_pause(states, starts, ends, range_start: int, range_end: int) -> float:
+    """Mean length in seconds of the pause time inside [range_start, range_end) (0 if no pause)"""
+    pauses = states == STATE_PAUSE
+    lengths = np.clip(ends[pauses], range_start, range_end) - np.clip(starts[pauses], range_start, range_end)
+    lengths = lengths[lengths > 0]
+    return float(lengths.mean()) if len(lengths) else 0.0
+
+
+def late_starts(arrays: EventArrays, start_of_day: int, range_start: int, range_end: int):
+    """
+    Late starts per user: first 'start' of each (user, day) of the range
+    after `start_of_day` (seconds after midnight). Returns (user_ids,
+    counts), most late first.
+    """
+    starts = (arrays.codes == EVENT_CODES['start']) & (arrays.seconds >= range_start) & (arrays.seconds < range_end)
+    users = arrays.users[starts]
+    seconds = arrays.seconds[starts]
+    days = seconds // 86400
+
+    # Events are sorted by (user, time): the first row of each (user, day) is the first start
+    first = np.ones(len(users), dtype=bool)
+    first[1:] = (users[1:] != users[:-1]) | (days[1:] != days[:-1])
+    late = first & (seconds % 86400 > start_of_day)
+
+    counts = np.bincount(users[late], minlength=len(arrays.user_ids))
+    order = np.argsort(-counts, kind='stable')
+    order = order[counts[order] > 0]
+    return arrays.user_ids[order], counts[order]
+
+
+def compute_summary(events, range_start, range_end, now, start_of_day: int) -> dict:
+    """
+    All statistics of an instance for [range_start, range_end) (naive local
+    datetimes). `events` may start before range_start so that shifts already
+    running at the start of the range are counted.
+    """
+    arrays = EventArrays(events)
+    start_s, end_s, now_s = to_local_seconds(range_start), to_local_seconds(range_end), to_local_seconds(now)
+
+    users, states, starts, ends = arrays.intervals(min(now_s, end_s))
+    active = states == STATE_ACTIVE
+    in_range = (ends > start_s) & (starts < end_s)
+    worked = np.clip(ends[active], start_s, end_s) - np.clip(starts[active], start_s, end_s)
+    pauses = (arrays.codes == EVENT_CODES['pause']) & (arrays.seconds >= start_s) & (arrays.seconds < end_s)
+
+    late_ids, late_counts = late_starts(arrays, start_of_day, start_s, end_s)
+    return {
+        'events': len(arrays),
+        'users': int(len(np.unique(users[in_range]))),
+        'heatmap': coverage_heatmap(starts[active], ends[active], start_s, end_s),
+        'average_pause': average_pause(states[in_range], starts[in_range], ends[in_range], start_s, end_s),
+        'pauses': int(np.count_nonzero(pauses)),
+        'worked_hours': float(worked.sum() / 3600),
+        'late_users': list(zip(late_ids.tolist(), late_counts.tolist()))
+    }
+
+
+def heatmap_text(heatmap) -> str:
+    """7 x 24 heatmap as block characters (one line per weekday)"""
+    peak = heatmap.max()
+    levels = np.zeros(heatmap.shape, dtype=np.int64) if peak <= 0 else np.ceil(heatmap / peak * (len(HEATMAP_LEVELS) - 1)).astype(np.int64)
+    lines = ["    0h    6h    12h   18h"]
+    for day, row in zip(DAY_NAMES, levels):
+        lines.append(f"{day} " + "".join(HEATMAP_LEVELS[level] for level in row))
+    return "\n".join(lines)
+
+
+def render_heatmap_png(heatmap: list, title: str) -> bytes:
+    """PNG chart of the heatmap (runs in the chart process pool, needs matplotlib)"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 3.5))
+    image = ax.imshow(heatmap, aspect='auto', cmap='Greens')
+    ax.set_yticks(range(7), DAY_NAMES)
+    ax.set_xticks(range(0, 24, 2), [f"{hour}h" for hour in range(0, 24, 2)])
+    ax.set_title(title)
+    fig.colorbar(image, ax=ax, label="Utilisateurs en shift (moyenne)")
+    fig.tight_layout()
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=120)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def chart_pool() -> ProcessPoolExecutor:
+    """Process pool used to render charts without blocking the bot"""
+    global _chart_pool
+    if _chart_pool is None:
+        _chart_pool = ProcessPoolExecutor(max_workers=1)
+    return _chart_pool
@@ -1,18 +1,40 @@
 import discord
 from discord import app_commands
 import json
+import os
 from abc import ABC, abstractmethod
+from .export import export_in_thread, parquet_available, parse_day
+from .search_index import PrefixIndex
+from .state_store import shard_for_guild
 
 
 class BaseTool(ABC):
     """Base class for all tool managers"""
 
+    # Cluster mode (see cluster.py): shared state store and shards owned by this process
+    state_store = None
+    shard_ids = None
+    shard_count = 1
+    worker_id = None
+
+    @classmethod
+    def configure_cluster(cls, state_store, shard_ids: list, shard_count: int, worker_id: str):
+        """Run every tool as a cluster worker (must be called before tools are created)"""
+        cls.state_store = state_store
+        cls.shard_ids = set(shard_ids)
+        cls.shard_count = shard_count
+        cls.worker_id = worker_id
+
     def __init__(self, tool_name: str, display_name: str, description: str, emoji: str, json_file: str):
         self.tool_name = tool_name
         self.display_name = display_name
         self.description = description
         self.emoji = emoji
         self.json_file = json_file
+        self.data_version = 0  # Incremented on every save, used to invalidate render caches
+        self.entity_versions = {}  # {(instance_id, entity_id): version}, in memory only
+        self.search_indexes = {}  # {instance_id: PrefixIndex}, built on first search
+        self.message_index = None  # {message_id: (instance_id, entity or None, field)}, built on first use
         self.instances = self.load_instances()
         self.config = self.load_config()
 
@@ -24,8 +46,128 @@ class BaseTool(ABC):
         except FileNotFoundError:
             return {"allowed_user_ids": []}
 
+    def owns_guild(self, guild_id: int) -> bool:
+        """Check if this process handles the shard of a guild"""
+        if self.shard_ids is None:
+            return True
+        return shard_for_guild(guild_id, self.shard_count) in self.shard_ids
+
+    def claim_once(self, key: str) -> bool:
+        """
+        Claim a singleton job run (e.g. one daily reset).
+
+        Returns True if this process must run the job. Always True outside
+        cluster mode; in cluster mode only the first worker claiming `key` wins.
+        """
+        if self.state_store is None:
+            return True
+        return self.state_store.claim(f"{self.tool_name}:{key}", self.worker_id)
+
+    def bump_entity_version(self, instance_id: str, entity_id: str):
+        """Mark one entity (user, task...) as changed so its cached fragments are rebuilt"""
+        key = (instance_id, entity_id)
+        self.entity_versions[key] = self.entity_versions.get(key, 0) + 1
+
+    def entity_version(self, instance_id: str, entity_id: str) -> int:
+        """Current version of an entity (0 until it changes)"""
+        return self.entity_versions.get((instance_id, entity_id), 0)
+
+    async def restore_state(self, bot):
+        """Called once the bot is ready to restart in-memory jobs from the stored instances"""
+        pass
+
+    def searchable_entities(self, instance: dict):
+        """Yield (entity_id, keys) for the entities of an instance that can be searched"""
+        return []
+
+    def search_index(self, instance_id: str) -> PrefixIndex:
+        """Prefix index of an instance, built from its data on first use"""
+        index = self.search_indexes.get(instance_id)
+        if index is None:
+            index = PrefixIndex()
+            instance = self.get_instance(instance_id)
+            if instance:
+                for entity_id, keys in self.searchable_entities(instance):
+                    index.add(entity_id, keys)
+            self.search_indexes[instance_id] = index
+        return index
+
+    def index_entity(self, instance_id: str, entity_id: str, keys):
+        """Keep the search index in sync when an entity is added or renamed"""
+        index = self.search_indexes.get(instance_id)
+        if index is not None:
+            index.add(entity_id, keys)
+
+    def unindex_entity(self, instance_id: str, entity_id: str):
+        """Keep the search index in sync when an entity is removed"""
+        index = self.search_indexes.get(instance_id)
+        if index is not None:
+            index.remove(entity_id)
+
+    def message_entities(self, instance: dict):
+        """
+        Yield (message_id, entity, field) for the Discord messages an
+        instance refers to: entity[field] holds the id (entity None for the
+        instance itself). Tools add their own messages (task cards...).
+        """
+        yield instance.get('admin_message_id'), None, 'admin_message_id'
+
+    def get_message_index(self) -> dict:
+        """Reverse index message_id -> owner, built from the instances on first use"""
+        if self.message_index is None:
+            self.message_index = {}
+            for instance in self.instances['instances']:
+                for message_id, entity, field in self.message_entities(instance):
+                    if message_id:
+                        self.message_index[message_id] = (instance['instance_id'], entity, field)
+        return self.message_index
+
+    def track_message(self, message_id: int, instance_id: str, entity, field: str):
+        """Record that entity[field] (instance[field] if entity is None) now holds message_id"""
+        self.get_message_index()[message_id] = (instance_id, entity, field)
+
+    def untrack_message(self, message_id: int):
+        """Drop a message from the reverse index once its entity is gone"""
+        if self.message_index is not None:
+            self.message_index.pop(message_id, None)
+
+    def forget_message(self, instance: dict, entity, field: str, message_id: int) -> bool:
+        """
+        A tracked message was deleted: clear the reference so later
+        operations don't fetch it. Returns True if the state changed.
+        """
+        target = instance if entity is None else entity
+        if target.get(field) != message_id:
+            return False  # Already replaced (e.g. the bot deleted an old card and sent a new one)
+        target[field] = None
+        return True
+
+    def handle_deleted_messages(self, message_ids) -> int:
+        """
+        Reconcile the state after messages were deleted (raw delete events):
+        O(1) lookup per message, one save for the whole batch. Returns the
+        number of references cleared.
+        """
+        if self.message_index is None and not self.instances['instances']:
+            return 0
+        index = self.get_message_index()
+        changed = 0
+        for message_id in message_ids:
+            owner = index.pop(message_id, None)
+            if owner is None:
+                continue
+            instance_id, entity, field = owner
+            instance = self.get_instance(instance_id)
+            if instance and self.forget_message(instance, entity, field, message_id):
+                changed += 1
+        if changed:
+            self.save_instances()
+        return changed
+
     def load_instances(self):
-        """Load instances from JSON file"""
+        """Load instances from JSON file (or the shared state store in cluster mode)"""
+        if self.state_store is not None:
+            return {"instances": self.state_store.load_instances(self.tool_name, self.owns_guild)}
         try:
             with open(self.json_file, 'r') as f:
                 return json.load(f)
@@ -33,7 +175,11 @@ class BaseTool(ABC):
             return {"instances": []}
 
     def save_instances(self):
-        """Save instances to JSON file"""
+        """Save instances to JSON file (or the shared state store in cluster mode)"""
+        self.data_version += 1
+        if self.state_store is not None:
+            self.state_store.save_instances(self.tool_name, self.instances['instances'], self.owns_guild)
+            return
         with open(self.json_file, 'w') as f:
             json.dump(self.instances, f, indent=2)
 
@@ -106,6 +252,76 @@ class BaseTool(ABC):
             return False
         return True
 
+    async def resolve_command_instance(self, interaction: discord.Interaction):
+        """Check permissions and return the instance of the channel where an admin command is used"""
+        if not await self.check_permission(interaction):
+            return None
+
+        instance = self.get_instance_by_channel(interaction.channel_id)
+        if not instance:
+            await interaction.response.send_message(
+                f"❌ Utilisez cette commande dans un salon configuré pour {self.display_name}.",
+                ephemeral=True,
+                delete_after=60
+            )
+        return instance
+
+    async def run_export(self, interaction: discord.Interaction, start: str, end: str, fmt: str, name: str, build_rows):
+        """
+        Shared flow of the export commands.
+
+        `build_rows(instance, start_day, end_day)` returns (columns, rows) where
+        rows is a generator; it is consumed in a worker thread and written in
+        chunks to a compressed file sent as an ephemeral attachment.
+        """
+        instance = await self.resolve_command_instance(interaction)
+        if not instance:
+            return
+
+        try:
+            start_day, end_day = parse_day(start), parse_day(end)
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ Dates invalides, utilisez le format AAAA-MM-JJ.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        if fmt == 'parquet' and not parquet_available():
+            await interaction.response.send_message(
+                "❌ L'export Parquet nécessite le paquet pyarrow, utilisez le format CSV.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        columns, rows = build_rows(instance, start_day, end_day)
+        try:
+            path, count = await export_in_thread(rows, columns, fmt)
+        except Exception as e:
+            print(f"Error exporting {self.tool_name}: {e}")
+            await interaction.followup.send("❌ Erreur lors de l'export.", ephemeral=True)
+            return
+
+        extension = 'csv.gz' if fmt == 'csv' else 'parquet'
+        try:
+            await interaction.followup.send(
+                f"✅ {count} ligne(s) exportée(s) du {start_day} au {end_day}.",
+                file=discord.File(path, filename=f"{name}_{start_day}_{end_day}.{extension}"),
+                ephemeral=True
+            )
+        except discord.HTTPException as e:
+            print(f"Error sending {self.tool_name} export: {e}")
+            await interaction.followup.send(
+                "❌ Impossible d'envoyer le fichier (trop volumineux ?), réduisez la période.",
+                ephemeral=True
+            )
+        finally:
+            os.remove(path)
+
     @abstractmethod
     async def setup_commands(self, bot):
         """Register tool-specific commands - to be implemented by each tool"""
@@ -0,0 +1,88 @@
+import asyncio
+import csv
+import gzip
+import os
+import tempfile
+from datetime import date, datetime
+from itertools import islice
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pyarrow_parquet
+except ImportError:  # Parquet export is optional
+    pyarrow = None
+    pyarrow_parquet = None
+
+
+EXPORT_FORMATS = ('csv', 'parquet')
+EXPORT_CHUNK_ROWS = 5000
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+def _chunks(rows, size: int):
+    """Group an iterator of rows into lists of at most `size` rows"""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_csv_gz(rows, columns: list, path: str, chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """Write rows (tuples in `columns` order) to a gzip-compressed CSV, chunk by chunk"""
+    count = 0
+    with gzip.open(path, 'wt', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for chunk in _chunks(rows, chunk_rows):
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+
+def write_parquet(rows, columns: list, path: str, chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """Write rows to a zstd-compressed Parquet file, one row group per chunk"""
+    schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+    count = 0
+    with pyarrow_parquet.ParquetWriter(path, schema, compression='zstd') as writer:
+        for chunk in _chunks(rows, chunk_rows):
+            data = {
+                column: [None if row[i] is None else str(row[i]) for row in chunk]
+                for i, column in enumerate(columns)
+            }
+            writer.write_table(pyarrow.Table.from_pydict(data, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def export_to_file(rows, columns: list, fmt: str) -> tuple:
+    """
+    Stream rows to a temporary file, returns (path, row count).
+
+    Blocking: meant to run in a worker thread (see export_in_thread). The
+    caller deletes the file once it has been sent.
+    """
+    suffix = '.csv.gz' if fmt == 'csv' else '.parquet'
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    try:
+        writer = write_csv_gz if fmt == 'csv' else write_parquet
+        count = writer(rows, columns, path)
+    except Exception:
+        os.remove(path)
+        raise
+    return path, count
+
+
+async def export_in_thread(rows, columns: list, fmt: str) -> tuple:
+    """Run export_to_file off the event loop"""
+    return await asyncio.to_thread(export_to_file, rows, columns, fmt)
+
+
+def parse_day(value: str) -> date:
+    """Parse a YYYY-MM-DD date typed in a command"""
+    return datetime.strptime(value.strip(), '%Y-%m-%d').date()
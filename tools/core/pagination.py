@@ -1,5 +1,23 @@
 import discord
-from typing import List, Callable, Any, Optional
+import math
+import uuid
+from collections import OrderedDict
+from collections.abc import Sequence, Sized
+from functools import partial
+from itertools import islice
+from typing import List, Callable, Any, Hashable, Iterable, Optional
+
+
+TRUNCATION_SUFFIX = "... (tronqué)"
+_EXHAUSTED = object()
+
+# Limites réelles de Discord, utilisées en mode pack_fields
+EMBED_MAX_FIELDS = 25
+FIELD_VALUE_MAX_CHARS = 1024
+MESSAGE_MAX_EMBEDS = 10
+MESSAGE_MAX_CHARS = 6000  # Total de tous les embeds d'un même message
+CONTINUATION_FIELD_NAME = "\u200b"  # Nom (invisible) des fields qui prolongent une section
+_FOOTER_PAGE_RESERVE = len(" | Page 99999/99999")
 
 
 class PaginatedEmbed:
@@ -15,7 +33,8 @@ class PaginatedEmbed:
         color: discord.Color = discord.Color.blue(),
         footer_text: str = "",
         items_per_page: int = 5,
-        max_chars_per_page: int = 1900  # Sécurité sous la limite de 2000
+        max_chars_per_page: Optional[int] = None,
+        pack_fields: bool = False
     ):
         """
         Initialize paginated embed system
@@ -25,36 +44,63 @@ class PaginatedEmbed:
             description: Description de l'embed
             color: Couleur de l'embed
             footer_text: Texte de base du footer (la pagination sera ajoutée automatiquement)
-            items_per_page: Nombre maximum d'items par page (par défaut)
-            max_chars_per_page: Nombre maximum de caractères par page
+            items_per_page: Nombre maximum d'items par page (par défaut), ou
+                par field en mode pack_fields
+            max_chars_per_page: Nombre maximum de caractères par page (1900 par
+                défaut, 6000 en mode pack_fields)
+            pack_fields: Remplit chaque page jusqu'aux limites réelles de
+                Discord (1024 caractères par field, 25 fields par embed,
+                10 embeds et 6000 caractères par message) ; les sections se
+                suivent et peuvent occuper plusieurs fields. Voir render_message.
         """
         self.title = title
         self.description = description
         self.color = color
         self.footer_text = footer_text
         self.items_per_page = items_per_page
+        self.pack_fields = pack_fields
+        if max_chars_per_page is None:
+            max_chars_per_page = MESSAGE_MAX_CHARS if pack_fields else 1900  # Sécurité sous la limite de 2000
         self.max_chars_per_page = max_chars_per_page
         self.sections = []  # List of sections to add
+        self._pages_layout = None  # Découpage calculé une seule fois (voir page_count/render_page)
+        self._fixed_pages = _EXHAUSTED  # Nombre de pages si le découpage est calculable sans formater
+        self._packed_fields = None  # Mode pack_fields à taille fixe : (fields par page, [(1er field, items par field)])
+        self._item_positions = None  # {clé d'item: (section_idx, item_idx)}, voir find_page
 
     def add_section(
         self,
         name: str,
-        items: List[Any],
+        items: Iterable[Any],
         formatter: Callable[[Any], str],
         empty_message: str = "Aucun élément",
         inline: bool = False,
-        max_items: Optional[int] = None
+        max_items: Optional[int] = None,
+        cache: Optional['FragmentCache'] = None,
+        cache_key: Optional[Callable[[Any], Hashable]] = None,
+        total: Optional[int] = None,
+        max_item_chars: Optional[int] = None
     ):
         """
         Ajoute une section à l'embed avec pagination automatique
 
+        Les items peuvent être une liste, un itérable paresseux (vue de dict,
+        générateur...) ou une source de type curseur exposant
+        fetch(start, stop) -> list. Ils ne sont consommés qu'au besoin.
+
         Args:
             name: Nom de la section
-            items: Liste des items à afficher
+            items: Items à afficher (liste, itérable ou curseur)
             formatter: Fonction pour formatter chaque item en string
             empty_message: Message si la liste est vide
             inline: Si le field doit être inline
             max_items: Nombre maximum d'items à afficher (None = tous)
+            cache: Cache de fragments partagé entre les rendus (optionnel)
+            cache_key: Clé de cache d'un item, doit inclure sa version
+            total: Nombre d'items s'il est connu (évite de tout matérialiser)
+            max_item_chars: Longueur maximale d'un item formaté (au-delà il est
+                coupé). Si chaque field tient forcément dans la page, seules
+                les items de la page demandée sont lus et formatés.
         """
         self.sections.append({
             'name': name,
@@ -62,8 +108,15 @@ class PaginatedEmbed:
             'formatter': formatter,
             'empty_message': empty_message,
             'inline': inline,
-            'max_items': max_items
+            'max_items': max_items,
+            'cache': cache,
+            'cache_key': cache_key,
+            'total': total,
+            'max_item_chars': max_item_chars
         })
+        self._pages_layout = None
+        self._fixed_pages = _EXHAUSTED
+        self._item_positions = None
 
     def _calculate_embed_size(self, embed: discord.Embed) -> int:
         """Calcule la taille totale d'un embed en caractères"""
@@ -79,178 +132,730 @@ class PaginatedEmbed:
 
         return size
 
-    def _build_section_content(self, section: dict, start_idx: int, items_count: int) -> tuple[str, int]:
+    def _layout(self) -> List[List[tuple]]:
         """
-        Construit le contenu d'une section
+        Calcule le découpage en pages sans construire d'embed.
+
+        Chaque item est formaté une seule fois (voir _SectionText) et la taille
+        d'un field est obtenue par sommes préfixes, ce qui rend le découpage
+        linéaire en nombre d'items. Les règles sont celles d'origine : au plus
+        items_per_page items par field, un field par section et par page,
+        réduction par moitié quand le field ne rentre pas, troncature si un
+        seul field ne rentre pas dans une page vide.
 
         Returns:
-            (content, items_used) - Le contenu formaté et le nombre d'items utilisés
+            Liste de pages, chaque page étant une liste de
+            (section_idx, start, end, truncated)
         """
-        items = section['items']
-        formatter = section['formatter']
-        max_items = section['max_items']
+        texts = [_SectionText(section) for section in self.sections]
+        base_size = len(self.title or "") + len(self.description or "")
+
+        pages = []
+        section_indices = [0] * len(texts)
+        sections_completed = [False] * len(texts)
+
+        while not all(sections_completed):
+            page = []
+            page_size = base_size
+            page_created = False
+
+            for section_idx, text in enumerate(texts):
+                if sections_completed[section_idx]:
+                    continue
 
-        if not items:
-            return section['empty_message'], 0
+                start_idx = section_indices[section_idx]
+                items_remaining = text.count - start_idx
+
+                if items_remaining <= 0:
+                    sections_completed[section_idx] = True
+                    continue
+
+                name_size = len(self.sections[section_idx]['name'])
+                items_to_try = min(self.items_per_page, items_remaining)
 
-        # Limite le nombre d'items si spécifié
-        if max_items is not None:
-            items = items[:max_items]
+                while items_to_try > 0:
+                    end_idx = start_idx + items_to_try
+                    field_size = name_size + text.content_length(start_idx, end_idx)
 
-        content = ""
-        items_used = 0
+                    if page_size + field_size <= self.max_chars_per_page:
+                        # Ça rentre ! Ajoute le field
+                        page.append((section_idx, start_idx, end_idx, False))
+                        page_size += field_size
+                        section_indices[section_idx] = end_idx
+                        page_created = True
 
-        # Commence à partir de start_idx
-        for i in range(start_idx, min(start_idx + items_count, len(items))):
-            item_text = formatter(items[i])
-            content += item_text + "\n"
-            items_used += 1
+                        if end_idx >= text.count:
+                            sections_completed[section_idx] = True
+                        break
 
-        # Ajoute un indicateur s'il reste des items
-        remaining = len(items) - (start_idx + items_used)
-        if remaining > 0:
-            content += f"\n*... et {remaining} autre(s)*"
+                    # Trop grand, réduis le nombre d'items
+                    items_to_try = max(1, items_to_try // 2)
 
-        return content.strip(), items_used
+                    if items_to_try == 1:
+                        # Si la page est vide, on prend le dernier essai tronqué (1 item consommé)
+                        if not page:
+                            page.append((section_idx, start_idx, end_idx, True))
+                            page_size += name_size + min(field_size - name_size, 1500) + len(TRUNCATION_SUFFIX)
+                            section_indices[section_idx] += 1
+                            page_created = True
+                        # Sinon on arrête et crée une nouvelle page
+                        break
 
-    def generate_pages(self) -> List[discord.Embed]:
+            if page:
+                pages.append(page)
+            elif not page_created:
+                # Aucun progrès fait, on arrête pour éviter une boucle infinie
+                break
+
+        self._texts = texts
+        return pages
+
+    def _build_page(self, layout_page: List[tuple], page_idx: int, total_pages: int) -> discord.Embed:
+        """Construit l'embed d'une page à partir de son découpage"""
+        embed = self._empty_page()
+
+        for section_idx, start_idx, end_idx, truncated in layout_page:
+            section = self.sections[section_idx]
+            content = self._texts[section_idx].content(start_idx, end_idx)
+            if truncated:
+                content = content[:1500] + TRUNCATION_SUFFIX
+            embed.add_field(
+                name=section['name'],
+                value=content,
+                inline=section['inline']
+            )
+
+        self._finish_page(embed, page_idx, total_pages)
+        return embed
+
+    def _finish_page(self, embed: discord.Embed, page_idx: int, total_pages: int):
+        """Ajoute le footer avec le numéro de page et le timestamp"""
+        footer = self.footer_text
+        if total_pages > 1:
+            footer += f" | Page {page_idx + 1}/{total_pages}"
+        embed.set_footer(text=footer)
+        embed.timestamp = discord.utils.utcnow()
+
+    def _get_layout(self) -> List[List[tuple]]:
+        """Retourne le découpage en pages (calculé au premier appel)"""
+        if self._pages_layout is None:
+            self._pages_layout = self._packed_layout() if self.pack_fields else self._layout()
+        return self._pages_layout
+
+    def _packed_budget(self) -> int:
+        """Caractères disponibles pour les fields d'une page en mode pack_fields"""
+        return (
+            self.max_chars_per_page
+            - len(self.title or "") - len(self.description or "")
+            - len(self.footer_text or "") - _FOOTER_PAGE_RESERVE
+        )
+
+    def _packed_layout(self) -> List[List[tuple]]:
         """
-        Génère toutes les pages avec pagination automatique
+        Découpage en mode pack_fields.
+
+        Les sections sont parcourues dans l'ordre et découpées en fields d'au
+        plus items_per_page items et FIELD_VALUE_MAX_CHARS caractères ; une
+        page reçoit des fields tant que le total du message et le nombre de
+        fields (25 par embed, 10 embeds) le permettent. Un item seul trop long
+        pour un field est tronqué.
 
         Returns:
-            Liste d'embeds, un par page
+            Même format que _layout : (section_idx, start, end, truncated)
         """
+        texts = [_SectionText(section) for section in self.sections]
+        budget = self._packed_budget()
+        max_fields = EMBED_MAX_FIELDS * MESSAGE_MAX_EMBEDS
+
         pages = []
-        current_embed = discord.Embed(
+        page = []
+        page_size = 0
+        named = set()  # Sections dont le nom est déjà affiché sur la page courante
+
+        for section_idx, text in enumerate(texts):
+            name = self.sections[section_idx]['name'] or CONTINUATION_FIELD_NAME
+            start_idx = 0
+
+            while start_idx < text.count:
+                name_size = len(CONTINUATION_FIELD_NAME if section_idx in named else name)
+
+                # Agrandit le field item par item (taille en O(1) par essai)
+                end_idx = start_idx + 1
+                value_size = text.content_length(start_idx, end_idx, more=False)
+                truncated = value_size > FIELD_VALUE_MAX_CHARS
+                if truncated:
+                    value_size = FIELD_VALUE_MAX_CHARS
+                else:
+                    last_idx = min(start_idx + self.items_per_page, text.count)
+                    while end_idx < last_idx:
+                        next_size = text.content_length(start_idx, end_idx + 1, more=False)
+                        if next_size > FIELD_VALUE_MAX_CHARS:
+                            break
+                        end_idx += 1
+                        value_size = next_size
+
+                field_size = name_size + value_size
+                if page and (page_size + field_size > budget or len(page) >= max_fields):
+                    # Page pleine : le field est recalculé sur une nouvelle page
+                    pages.append(page)
+                    page = []
+                    page_size = 0
+                    named = set()
+                    continue
+
+                page.append((section_idx, start_idx, end_idx, truncated))
+                page_size += field_size
+                named.add(section_idx)
+                start_idx = end_idx
+
+        if page:
+            pages.append(page)
+
+        self._texts = texts
+        return pages
+
+    def _packed_fixed_page_count(self) -> Optional[int]:
+        """
+        Équivalent de _fixed_page_count en mode pack_fields.
+
+        Avec des totaux connus et des items bornés, chaque section est découpée
+        en fields de taille fixe et chaque page reçoit le même nombre de fields
+        (calculé sur la taille maximale d'un field) : la page p affiche les
+        fields [p * F, (p + 1) * F) sans lire les autres items.
+        """
+        worst_field = 0
+        sections = []
+        total_fields = 0
+        for section in self.sections:
+            count = _known_count(section)
+            bound = section['max_item_chars']
+            if count is None or bound is None or not _is_reiterable(section['items']):
+                return None
+            items_per_field = min(self.items_per_page, FIELD_VALUE_MAX_CHARS // (bound + 1))
+            if items_per_field < 1:
+                return None
+            sections.append((total_fields, items_per_field))
+            if count == 0:
+                continue
+            total_fields += math.ceil(count / items_per_field)
+            name_size = max(len(section['name']), len(CONTINUATION_FIELD_NAME))
+            worst_field = max(worst_field, name_size + items_per_field * (bound + 1))
+
+        if total_fields == 0:
+            self._packed_fields = (1, sections)
+            return 0
+
+        fields_per_page = min(EMBED_MAX_FIELDS * MESSAGE_MAX_EMBEDS, self._packed_budget() // worst_field)
+        if fields_per_page < 1:
+            return None
+
+        self._packed_fields = (fields_per_page, sections)
+        return math.ceil(total_fields / fields_per_page)
+
+    def _packed_fixed_fields(self, page: int) -> List[tuple]:
+        """Fields (name, value, inline) d'une page du découpage pack_fields à taille fixe"""
+        fields_per_page, sections = self._packed_fields
+        first_field = page * fields_per_page
+        last_field = first_field + fields_per_page
+
+        fields = []
+        for section, (section_first, items_per_field) in zip(self.sections, sections):
+            count = _known_count(section)
+            section_last = section_first + math.ceil(count / items_per_field)
+            lo, hi = max(first_field, section_first), min(last_field, section_last)
+            if lo >= hi:
+                continue
+
+            # Une seule lecture pour tous les items de la section sur cette page
+            start_idx = (lo - section_first) * items_per_field
+            end_idx = min((hi - section_first) * items_per_field, count)
+            items = _fetch_items(section['items'], start_idx, end_idx)
+            name = section['name'] or CONTINUATION_FIELD_NAME
+            for offset in range(0, len(items), items_per_field):
+                chunk = items[offset:offset + items_per_field]
+                value = "".join(_format_item(section, item) + "\n" for item in chunk).strip()
+                fields.append((name, value, section['inline']))
+                name = CONTINUATION_FIELD_NAME
+        return fields
+
+    def _packed_layout_fields(self, layout_page: List[tuple]) -> List[tuple]:
+        """Fields (name, value, inline) d'une page du découpage pack_fields"""
+        fields = []
+        named = set()
+        for section_idx, start_idx, end_idx, truncated in layout_page:
+            section = self.sections[section_idx]
+            content = self._texts[section_idx].content(start_idx, end_idx, more=False)
+            if truncated:
+                content = content[:FIELD_VALUE_MAX_CHARS - len(TRUNCATION_SUFFIX)] + TRUNCATION_SUFFIX
+            name = CONTINUATION_FIELD_NAME if section_idx in named else (section['name'] or CONTINUATION_FIELD_NAME)
+            named.add(section_idx)
+            fields.append((name, content, section['inline']))
+        return fields
+
+    def _build_message(self, fields: List[tuple], page_idx: int, total_pages: int) -> List[discord.Embed]:
+        """Répartit les fields d'une page sur des embeds de 25 fields au plus"""
+        embeds = [self._empty_page()]
+        for i, (name, value, inline) in enumerate(fields):
+            if i and i % EMBED_MAX_FIELDS == 0:
+                embeds.append(discord.Embed(color=self.color))
+            embeds[-1].add_field(name=name, value=value, inline=inline)
+
+        self._finish_page(embeds[-1], page_idx, total_pages)
+        return embeds
+
+    def render_message(self, page: int) -> List[discord.Embed]:
+        """
+        Construit les embeds d'un message pour la page demandée
+
+        En mode pack_fields une page peut occuper jusqu'à 10 embeds (le titre
+        sur le premier, le footer sur le dernier) ; sinon c'est [render_page(page)].
+
+        Args:
+            page: Numéro de page (0-indexed), ramené dans les bornes
+
+        Returns:
+            Liste des embeds à envoyer ensemble (embeds=...)
+        """
+        if not self.pack_fields:
+            return [self.render_page(page)]
+
+        fixed_pages = self._fixed_page_count()
+        if fixed_pages is not None:
+            if fixed_pages == 0:
+                return [self._empty_page()]
+            page = max(0, min(page, fixed_pages - 1))
+            return self._build_message(self._packed_fixed_fields(page), page, fixed_pages)
+
+        layout = self._get_layout()
+        if not layout:
+            return [self._empty_page()]
+
+        page = max(0, min(page, len(layout) - 1))
+        return self._build_message(self._packed_layout_fields(layout[page]), page, len(layout))
+
+    def _empty_page(self) -> discord.Embed:
+        return discord.Embed(
             title=self.title,
             description=self.description,
             color=self.color
         )
 
-        # Si pas de sections, retourne un embed vide
-        if not self.sections:
-            pages.append(current_embed)
-            return pages
+    def _fixed_page_count(self) -> Optional[int]:
+        """
+        Nombre de pages si le découpage ne dépend que du nombre d'items.
 
-        section_indices = [0] * len(self.sections)  # Track position in each section
-        sections_completed = [False] * len(self.sections)
+        C'est le cas quand chaque section a un total connu et une longueur
+        d'item bornée telle qu'un field plein de chaque section tient dans une
+        page : la page p contient alors les items [p * items_per_page, ...) de
+        chaque section. Retourne None si ce n'est pas garanti.
+        """
+        if self._fixed_pages is not _EXHAUSTED:
+            return self._fixed_pages
 
-        while not all(sections_completed):
-            page_created = False
+        if self.pack_fields:
+            self._fixed_pages = self._packed_fixed_page_count()
+            return self._fixed_pages
 
+        budget = len(self.title or "") + len(self.description or "")
+        pages = 0
+        for section in self.sections:
+            count = _known_count(section)
+            bound = section['max_item_chars']
+            if count is None or bound is None or not _is_reiterable(section['items']):
+                pages = None
+                break
+            if count == 0:
+                continue
+            items_in_field = min(self.items_per_page, count)
+            budget += len(section['name']) + items_in_field * (bound + 1) + len(_more_indicator(count))
+            pages = max(pages, math.ceil(count / self.items_per_page))
+
+        if pages is not None and budget > self.max_chars_per_page:
+            pages = None
+
+        self._fixed_pages = pages
+        return pages
+
+    def _render_fixed_page(self, page: int, total_pages: int) -> discord.Embed:
+        """Construit une page du découpage à taille fixe en ne lisant que ses items"""
+        embed = self._empty_page()
+        start_idx = page * self.items_per_page
+
+        for section in self.sections:
+            count = _known_count(section)
+            if start_idx >= count:
+                continue
+            end_idx = min(start_idx + self.items_per_page, count)
+            items = _fetch_items(section['items'], start_idx, end_idx)
+            content = "".join(_format_item(section, item) + "\n" for item in items)
+            embed.add_field(
+                name=section['name'],
+                value=(content + _more_indicator(count - end_idx)).strip(),
+                inline=section['inline']
+            )
+
+        self._finish_page(embed, page, total_pages)
+        return embed
+
+    def page_count(self) -> int:
+        """Nombre de pages (au moins 1)"""
+        fixed_pages = self._fixed_page_count()
+        if fixed_pages is not None:
+            return max(1, fixed_pages)
+        return max(1, len(self._get_layout()))
+
+    def render_page(self, page: int) -> discord.Embed:
+        """
+        Construit uniquement l'embed de la page demandée
+
+        Args:
+            page: Numéro de page (0-indexed), ramené dans les bornes
+
+        Returns:
+            L'embed de la page (le premier embed du message en mode pack_fields)
+        """
+        if self.pack_fields:
+            return self.render_message(page)[0]
+
+        fixed_pages = self._fixed_page_count()
+        if fixed_pages is not None:
+            if fixed_pages == 0:
+                return self._empty_page()
+            page = max(0, min(page, fixed_pages - 1))
+            return self._render_fixed_page(page, fixed_pages)
+
+        layout = self._get_layout()
+
+        # Si pas de sections (ou rien à afficher), retourne un embed vide
+        if not layout:
+            return self._empty_page()
+
+        page = max(0, min(page, len(layout) - 1))
+        return self._build_page(layout[page], page, len(layout))
+
+    def page_of(self, section_idx: int, item_idx: int) -> Optional[int]:
+        """Page affichant l'item item_idx de la section section_idx (None si absent)"""
+        fixed_pages = self._fixed_page_count()
+        if fixed_pages is not None:
+            count = _known_count(self.sections[section_idx])
+            if not 0 <= item_idx < count:
+                return None
+            if self.pack_fields:
+                fields_per_page, sections = self._packed_fields
+                section_first, items_per_field = sections[section_idx]
+                return (section_first + item_idx // items_per_field) // fields_per_page
+            return item_idx // self.items_per_page
+
+        for page_idx, layout_page in enumerate(self._get_layout()):
+            for idx, start, end, truncated in layout_page:
+                if truncated:
+                    end = start + 1  # Un seul item consommé par un field tronqué
+                if idx == section_idx and start <= item_idx < end:
+                    return page_idx
+        return None
+
+    def find_page(self, keys: Iterable[Hashable], key: Callable[[Any], Hashable]) -> Optional[int]:
+        """
+        Première page affichant un des items dont la clé est dans keys
+
+        Les positions des items sont calculées une seule fois par PaginatedEmbed
+        (sans formater les items) ; les sources doivent être ré-itérables.
+
+        Args:
+            keys: Clés recherchées (ex: ids trouvés dans un index de recherche)
+            key: Fonction donnant la clé d'un item
+
+        Returns:
+            Numéro de page (0-indexed) ou None si aucun item ne correspond
+        """
+        if self._item_positions is None:
+            self._item_positions = {}
             for section_idx, section in enumerate(self.sections):
-                if sections_completed[section_idx]:
+                if not _is_reiterable(section['items']):
                     continue
+                for item_idx, item in enumerate(_iterate(section['items'])):
+                    self._item_positions.setdefault(key(item), (section_idx, item_idx))
 
-                start_idx = section_indices[section_idx]
-                items_remaining = len(section['items']) - start_idx
+        positions = [self._item_positions[k] for k in keys if k in self._item_positions]
+        if not positions:
+            return None
+        return self.page_of(*min(positions))
 
-                if items_remaining <= 0:
-                    sections_completed[section_idx] = True
-                    continue
+    def generate_pages(self) -> List[discord.Embed]:
+        """
+        Génère toutes les pages avec pagination automatique
 
-                # Essaye d'ajouter des items de cette section
-                items_to_try = min(self.items_per_page, items_remaining)
+        En mode pack_fields une page ne tient pas dans un seul embed : utiliser
+        generate_messages.
 
-                while items_to_try > 0:
-                    content, items_used = self._build_section_content(
-                        section,
-                        start_idx,
-                        items_to_try
-                    )
-
-                    # Créer un embed temporaire pour tester la taille
-                    test_embed = current_embed.copy()
-                    test_embed.add_field(
-                        name=section['name'],
-                        value=content,
-                        inline=section['inline']
-                    )
-
-                    # Vérifie la taille
-                    if self._calculate_embed_size(test_embed) <= self.max_chars_per_page:
-                        # Ça rentre ! Ajoute le field
-                        current_embed.add_field(
-                            name=section['name'],
-                            value=content,
-                            inline=section['inline']
-                        )
-                        section_indices[section_idx] += items_used
-                        page_created = True
+        Returns:
+            Liste d'embeds, un par page
+        """
+        if self.pack_fields:
+            raise ValueError("pack_fields : une page peut occuper plusieurs embeds, utiliser generate_messages()")
 
-                        # Si on a tout affiché de cette section
-                        if section_indices[section_idx] >= len(section['items']):
-                            sections_completed[section_idx] = True
-                        break
-                    else:
-                        # Trop grand, réduis le nombre d'items
-                        items_to_try = max(1, items_to_try // 2)
-
-                        # Si même avec 1 item ça ne rentre pas
-                        if items_to_try == 1:
-                            # Si l'embed est vide, on prend l'item quand même (tronqué)
-                            if len(current_embed.fields) == 0:
-                                content = content[:1500] + "... (tronqué)"
-                                current_embed.add_field(
-                                    name=section['name'],
-                                    value=content,
-                                    inline=section['inline']
-                                )
-                                section_indices[section_idx] += 1
-                                page_created = True
-                            # Sinon on arrête et crée une nouvelle page
-                            break
-                        elif items_to_try < 1:
-                            # On ne peut plus réduire, nouvelle page
-                            break
+        layout = self._get_layout()
 
-            # Si on a créé du contenu ou qu'il faut créer une nouvelle page
-            if len(current_embed.fields) > 0:
-                pages.append(current_embed)
-                current_embed = discord.Embed(
-                    title=self.title,
-                    description=self.description,
-                    color=self.color
-                )
-            elif not page_created:
-                # Aucun progrès fait, on arrête pour éviter une boucle infinie
+        # Si pas de sections (ou rien à afficher), retourne un embed vide
+        if not layout:
+            return [self._empty_page()]
+
+        total_pages = len(layout)
+        return [self._build_page(page, i, total_pages) for i, page in enumerate(layout)]
+
+    def generate_messages(self) -> List[List[discord.Embed]]:
+        """
+        Génère les embeds de toutes les pages, une liste par message
+
+        Chaque page passe par render_message, donc par le découpage pack_fields
+        (25 fields par embed, 6000 caractères par message) quand il est actif.
+
+        Returns:
+            Liste de listes d'embeds, une par page
+        """
+        return [self.render_message(page) for page in range(self.page_count())]
+
+
+class FragmentCache:
+    """
+    Cache borné (LRU) de fragments de texte formatés.
+
+    Les clés doivent inclure la version de l'entité formatée : une entité
+    modifiée change de clé, et l'ancienne entrée finit par être évincée.
+    """
+
+    def __init__(self, max_size: int = 5000):
+        self.max_size = max_size
+        self._fragments = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], str]) -> str:
+        """Retourne le fragment en cache ou le construit avec build()"""
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            self._fragments.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+        self.misses += 1
+        fragment = build()
+        self._fragments[key] = fragment
+        if len(self._fragments) > self.max_size:
+            self._fragments.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        self._fragments.clear()
+
+
+class SequenceChain:
+    """
+    Concaténation de plusieurs listes sans copie, utilisable comme source
+    de section (len, itération et fetch(start, stop)).
+    """
+
+    def __init__(self, *sequences):
+        self.sequences = sequences
+
+    def __len__(self) -> int:
+        return sum(len(sequence) for sequence in self.sequences)
+
+    def __iter__(self):
+        for sequence in self.sequences:
+            yield from sequence
+
+    def fetch(self, start: int, stop: int) -> list:
+        items = []
+        for sequence in self.sequences:
+            if start < len(sequence) and stop > 0:
+                items.extend(sequence[max(start, 0):stop])
+            start -= len(sequence)
+            stop -= len(sequence)
+        return items
+
+
+def _known_count(section: dict) -> Optional[int]:
+    """Nombre d'items d'une section s'il est connu sans consommer la source"""
+    items = section['items']
+    if section['total'] is not None:
+        count = section['total']
+    elif isinstance(items, Sized):
+        count = len(items)
+    else:
+        return None
+    if section['max_items'] is not None:
+        count = min(count, section['max_items'])
+    return count
+
+
+def _is_reiterable(items) -> bool:
+    """Un générateur ne peut être parcouru qu'une fois, une liste ou un curseur si"""
+    return hasattr(items, 'fetch') or iter(items) is not items
+
+
+def _fetch_items(items, start: int, stop: int) -> list:
+    """Lit les items [start, stop) d'une source (liste, curseur ou itérable)"""
+    if hasattr(items, 'fetch'):
+        return items.fetch(start, stop)
+    if isinstance(items, Sequence):
+        return items[start:stop]
+    return list(islice(items, start, stop))
+
+
+def _iterate(items, chunk_size: int = 100):
+    """Itère sur une source, par paquets pour un curseur"""
+    if not hasattr(items, 'fetch'):
+        yield from items
+        return
+    start = 0
+    while True:
+        chunk = items.fetch(start, start + chunk_size)
+        if not chunk:
+            return
+        yield from chunk
+        start += len(chunk)
+
+
+def _format_item(section: dict, item) -> str:
+    """Formate un item (via le cache de fragments si fourni), borné à max_item_chars"""
+    cache, cache_key = section['cache'], section['cache_key']
+    if cache is not None and cache_key is not None:
+        text = cache.get(cache_key(item), partial(section['formatter'], item))
+    else:
+        text = section['formatter'](item)
+
+    bound = section['max_item_chars']
+    if bound is not None and len(text) > bound:
+        text = text[:bound]
+    return text
+
+
+def _more_indicator(remaining: int) -> str:
+    return f"\n*... et {remaining} autre(s)*" if remaining > 0 else ""
+
+
+class _SectionText:
+    """
+    Texte formaté d'une section.
+
+    Les items sont lus et formatés paresseusement, une seule fois chacun ;
+    les longueurs sont gardées en sommes préfixes pour connaître la taille de
+    n'importe quel field en O(1) (hors cas dégénéré d'items composés
+    uniquement d'espaces).
+    """
+
+    def __init__(self, section: dict):
+        self.section = section
+        items = section['items']
+
+        count = _known_count(section)
+        if count is None:
+            # Total inconnu : la source doit être lue en entier
+            items = list(_iterate(items))
+            count = len(items)
+            if section['max_items'] is not None:
+                count = min(count, section['max_items'])
+
+        self.count = count
+        self._iterator = _iterate(items)
+        self.pieces = []
+        self.prefix = [0]
+        self.leading = []  # Espaces retirés par strip() en début de morceau
+        self.trailing = []  # Espaces retirés par strip() en fin de morceau
+
+    def _ensure(self, end: int):
+        """Formate les items jusqu'à l'index end (exclu)"""
+        while len(self.pieces) < min(end, self.count):
+            item = next(self._iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                # La source contenait moins d'items que le total annoncé
+                self.count = len(self.pieces)
                 break
+            piece = _format_item(self.section, item) + "\n"
+            self.pieces.append(piece)
+            self.prefix.append(self.prefix[-1] + len(piece))
+            self.leading.append(len(piece) - len(piece.lstrip()))
+            self.trailing.append(len(piece) - len(piece.rstrip()))
+
+    def content_length(self, start: int, end: int, more: bool = True) -> int:
+        """Longueur de content(start, end, more) sans construire la chaîne"""
+        self._ensure(end)
+        end = min(end, self.count)
+        indicator = _more_indicator(self.count - end) if more else ""
+        length = self.prefix[end] - self.prefix[start] + len(indicator)
+
+        # strip() en tête : peut traverser des morceaux entièrement blancs
+        stripped = 0
+        i = start
+        while i < end and self.leading[i] == len(self.pieces[i]):
+            stripped += len(self.pieces[i])
+            i += 1
+        if i < end:
+            stripped += self.leading[i]
+        elif indicator:
+            stripped += 1  # Le "\n" initial de l'indicateur
+        else:
+            return 0
 
-        # Ajoute les footers avec numéros de page
-        total_pages = len(pages)
-        for i, page in enumerate(pages):
-            footer = self.footer_text
-            if total_pages > 1:
-                footer += f" | Page {i + 1}/{total_pages}"
-            page.set_footer(text=footer)
-            page.timestamp = discord.utils.utcnow()
+        # strip() en queue : l'indicateur se termine par "*"
+        if not indicator:
+            i = end - 1
+            while self.trailing[i] == len(self.pieces[i]):
+                stripped += len(self.pieces[i])
+                i -= 1
+            stripped += self.trailing[i]
 
-        return pages if pages else [current_embed]
+        return length - stripped
+
+    def content(self, start: int, end: int, more: bool = True) -> str:
+        """Contenu du field pour les items [start, end) (more : indicateur des items restants)"""
+        self._ensure(end)
+        end = min(end, self.count)
+        indicator = _more_indicator(self.count - end) if more else ""
+        return ("".join(self.pieces[start:end]) + indicator).strip()
 
 
 class PaginationView(discord.ui.View):
-    """Vue avec boutons de navigation pour la pagination"""
+    """
+    Vue avec boutons de navigation pour la pagination.
+
+    Une seule vue est utilisée par message : la navigation modifie la page
+    courante et l'état des boutons de cette vue, puis édite le message avec
+    la même vue. Les pages sont soit fournies déjà rendues, soit rendues à
+    la demande depuis un PaginatedEmbed et gardées en cache.
+    """
 
     def __init__(
         self,
-        pages: List[discord.Embed],
+        pages: Optional[List[discord.Embed]] = None,
         current_page: int = 0,
         timeout: Optional[float] = None,
-        extra_buttons: Optional[List[discord.ui.Button]] = None
+        extra_buttons: Optional[List[discord.ui.Button]] = None,
+        paginated: Optional[PaginatedEmbed] = None,
+        find_page: Optional[Callable[[str], Optional[int]]] = None
     ):
         """
         Initialize pagination view
 
         Args:
-            pages: Liste des embeds (pages)
+            pages: Liste des embeds (pages) déjà rendus
             current_page: Page actuelle (0-indexed)
             timeout: Timeout pour les boutons (None = pas de timeout)
             extra_buttons: Boutons supplémentaires à ajouter
+            paginated: Source des pages rendues à la demande (à la place de pages)
+            find_page: Recherche d'un élément, retourne sa page (active le champ
+                de recherche du bouton "Aller à...")
         """
         super().__init__(timeout=timeout)
-        self.pages = pages
-        self.current_page = max(0, min(current_page, len(pages) - 1))
-        self.total_pages = len(pages)
+        self.paginated = paginated
+        self.find_page = find_page
+        self._page_cache = {i: [embed] for i, embed in enumerate(pages)} if pages else {}
+        self.total_pages = len(pages) if pages else (paginated.page_count() if paginated else 1)
+        self.current_page = max(0, min(current_page, self.total_pages - 1))
+
+        # custom_id unique par vue : plusieurs paginateurs peuvent être affichés en même temps
+        self._view_key = uuid.uuid4().hex
 
         # Ajoute les boutons de navigation
         self._add_navigation_buttons()
@@ -260,27 +865,65 @@ class PaginationView(discord.ui.View):
             for button in extra_buttons:
                 self.add_item(button)
 
+    @property
+    def pages(self) -> List[discord.Embed]:
+        """Premier embed de toutes les pages (rend celles qui ne sont pas encore en cache)"""
+        return [self._get_page(i)[0] for i in range(self.total_pages)]
+
+    def _get_page(self, page: int) -> List[discord.Embed]:
+        embeds = self._page_cache.get(page)
+        if embeds is None:
+            embeds = self.paginated.render_message(page)
+            self._page_cache[page] = embeds
+        return embeds
+
     def _add_navigation_buttons(self):
         """Ajoute les boutons de navigation"""
         # Bouton précédent
-        prev_button = discord.ui.Button(
+        self.prev_button = discord.ui.Button(
             label="◀️ Précédent",
             style=discord.ButtonStyle.gray,
-            disabled=(self.current_page == 0),
-            custom_id="prev"
+            custom_id=f"pagination:{self._view_key}:prev"
         )
-        prev_button.callback = self._previous_page
-        self.add_item(prev_button)
+        self.prev_button.callback = self._previous_page
+        self.add_item(self.prev_button)
 
         # Bouton suivant
-        next_button = discord.ui.Button(
+        self.next_button = discord.ui.Button(
             label="Suivant ▶️",
             style=discord.ButtonStyle.gray,
-            disabled=(self.current_page >= self.total_pages - 1),
-            custom_id="next"
+            custom_id=f"pagination:{self._view_key}:next"
+        )
+        self.next_button.callback = self._next_page
+        self.add_item(self.next_button)
+
+        # Bouton recherche / saut de page
+        self.jump_button = discord.ui.Button(
+            label="🔎 Aller à...",
+            style=discord.ButtonStyle.gray,
+            custom_id=f"pagination:{self._view_key}:jump"
         )
-        next_button.callback = self._next_page
-        self.add_item(next_button)
+        self.jump_button.callback = self._open_jump_modal
+        self.add_item(self.jump_button)
+
+        self._update_buttons()
+
+    def _update_buttons(self):
+        """Active/désactive les boutons selon la page actuelle"""
+        self.prev_button.disabled = (self.current_page == 0)
+        self.next_button.disabled = (self.current_page >= self.total_pages - 1)
+        self.jump_button.disabled = (self.total_pages <= 1 and self.find_page is None)
+
+    async def _open_jump_modal(self, interaction: discord.Interaction):
+        """Ouvre le modal de recherche / saut de page"""
+        await interaction.response.send_modal(
+            JumpToPageModal(self.total_pages, self._jump_to_page, self.find_page)
+        )
+
+    async def _jump_to_page(self, interaction: discord.Interaction, page: int):
+        """Aller directement à une page"""
+        self.current_page = max(0, min(page, self.total_pages - 1))
+        await self._update_message(interaction)
 
     async def _previous_page(self, interaction: discord.Interaction):
         """Aller à la page précédente"""
@@ -293,22 +936,83 @@ class PaginationView(discord.ui.View):
         await self._update_message(interaction)
 
     async def _update_message(self, interaction: discord.Interaction):
-        """Met à jour le message avec la nouvelle page"""
-        # Crée une nouvelle vue avec la page mise à jour
-        new_view = PaginationView(
-            pages=self.pages,
-            current_page=self.current_page,
-            timeout=self.timeout
-        )
-
+        """Met à jour le message avec la nouvelle page (même vue, un seul edit)"""
+        self._update_buttons()
         await interaction.response.edit_message(
-            embed=self.pages[self.current_page],
-            view=new_view
+            embeds=self.get_current_embeds(),
+            view=self
         )
 
     def get_current_embed(self) -> discord.Embed:
-        """Retourne l'embed de la page actuelle"""
-        return self.pages[self.current_page]
+        """Retourne l'embed de la page actuelle (le premier en mode pack_fields)"""
+        return self._get_page(self.current_page)[0]
+
+    def get_current_embeds(self) -> List[discord.Embed]:
+        """Retourne tous les embeds de la page actuelle"""
+        return self._get_page(self.current_page)
+
+
+class JumpToPageModal(discord.ui.Modal):
+    """
+    Modal de navigation : recherche d'un élément (nom, ID...) ou numéro de page.
+
+    La recherche est déléguée à find_page (qui s'appuie sur un index, pas sur
+    le texte des pages) ; show_page affiche ensuite la page trouvée.
+    """
+
+    def __init__(
+        self,
+        total_pages: int,
+        show_page: Callable[[discord.Interaction, int], Any],
+        find_page: Optional[Callable[[str], Optional[int]]] = None,
+        search_label: str = "Rechercher (nom ou ID)"
+    ):
+        super().__init__(title="Aller à...")
+        self.total_pages = total_pages
+        self.show_page = show_page
+        self.find_page = find_page
+
+        self.query = discord.ui.TextInput(
+            label=search_label,
+            placeholder="Début du nom ou de l'ID",
+            required=False,
+            max_length=100
+        )
+        if find_page is not None:
+            self.add_item(self.query)
+
+        self.page_number = discord.ui.TextInput(
+            label=f"Numéro de page (1-{total_pages})",
+            placeholder="Ex: 3",
+            required=False,
+            max_length=5
+        )
+        self.add_item(self.page_number)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        query = self.query.value.strip() if self.find_page is not None and self.query.value else ""
+        number = (self.page_number.value or "").strip()
+
+        if query:
+            page = self.find_page(query)
+            if page is None:
+                await interaction.response.send_message(
+                    f"❌ Aucun résultat pour « {query} ».",
+                    ephemeral=True,
+                    delete_after=60
+                )
+                return
+        elif number.isdigit() and 1 <= int(number) <= self.total_pages:
+            page = int(number) - 1
+        else:
+            await interaction.response.send_message(
+                f"❌ Indiquez une recherche ou un numéro de page entre 1 et {self.total_pages}.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        await self.show_page(interaction, page)
 
 
 def create_simple_paginated_view(
@@ -351,7 +1055,6 @@ def create_simple_paginated_view(
         empty_message=empty_message
     )
 
-    pages = paginated.generate_pages()
-    view = PaginationView(pages=pages, current_page=current_page, timeout=None)
+    view = PaginationView(paginated=paginated, current_page=current_page, timeout=None)
 
     return view.get_current_embed(), view
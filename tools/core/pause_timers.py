@@ -0,0 +1,115 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+
+class PauseTimerService:
+    """
+    Single background task delivering pause expiries.
+
+    Pending expiries live in a min-heap keyed on their due time instead of one
+    sleeping coroutine per paused user. The task sleeps until the earliest
+    due time (or until an earlier expiry is scheduled), then pops every entry
+    due within `batch_window` seconds and delivers the batch with at most
+    `max_concurrency` callbacks running at once.
+
+    Cancelling marks the heap entry as removed (O(1)) and the heap is
+    compacted when removed entries dominate, so schedule/cancel stay O(log n).
+    """
+
+    def __init__(self, on_expired, max_concurrency: int = 5, batch_window: float = 1.0):
+        self.on_expired = on_expired  # async callback(key)
+        self.max_concurrency = max_concurrency
+        self.batch_window = batch_window
+        self.heap = []  # [due, seq, key, active]
+        self.entries = {}  # {key: heap entry}
+        self._counter = itertools.count()
+        self._removed = 0
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries
+
+    def start(self):
+        """Start the delivery task (no-op if already running)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def schedule(self, key, due: float):
+        """Schedule (or reschedule) `key` to expire at the `due` unix timestamp"""
+        self.cancel(key)
+        entry = [due, next(self._counter), key, True]
+        self.entries[key] = entry
+        heapq.heappush(self.heap, entry)
+        if self.heap[0] is entry:
+            self._wakeup.set()  # New earliest expiry: re-arm the sleep
+
+    def cancel(self, key) -> bool:
+        """Cancel a pending expiry, returns True if one was pending"""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[3] = False
+        self._removed += 1
+        if self._removed > 64 and self._removed > len(self.heap) // 2:
+            self.heap = [e for e in self.heap if e[3]]
+            heapq.heapify(self.heap)
+            self._removed = 0
+        return True
+
+    def _pop_due(self, now: float) -> list:
+        """Pop every active entry due before now + batch_window"""
+        batch = []
+        while self.heap and self.heap[0][0] <= now + self.batch_window:
+            due, _, key, active = heapq.heappop(self.heap)
+            if not active:
+                self._removed -= 1
+                continue
+            del self.entries[key]
+            batch.append(key)
+        return batch
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            while self.heap and not self.heap[0][3]:
+                heapq.heappop(self.heap)
+                self._removed -= 1
+
+            if not self.heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self.heap[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue  # Woken by an earlier schedule
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._pop_due(time.time())
+            if batch:
+                asyncio.create_task(self._deliver(batch))
+
+    async def _deliver(self, batch: list):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def deliver_one(key):
+            async with semaphore:
+                try:
+                    await self.on_expired(key)
+                except Exception as e:
+                    print(f"Error delivering pause expiry {key}: {e}")
+
+        await asyncio.gather(*(deliver_one(key) for key in batch))
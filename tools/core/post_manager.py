@@ -1,3 +1,4 @@
+import asyncio
 import discord
 from discord import app_commands
 from .base_tool import BaseTool
@@ -18,6 +19,33 @@ class PostManager(BaseTool):
         )
         self.bot = None
 
+    def message_entities(self, instance: dict):
+        yield from super().message_entities(instance)
+        for post in instance.get('posts', []):
+            for field in ('video_message_id', 'response_message_id', 'admin_message_id'):
+                yield post.get(field), post, field
+
+    def forget_message(self, instance: dict, entity, field: str, message_id: int) -> bool:
+        if not super().forget_message(instance, entity, field, message_id):
+            return False
+        if field == 'video_message_id' and entity.get('status') == 'draft' and entity in instance.get('posts', []):
+            # The user deleted their video before submitting it: drop the draft and its reply
+            instance['posts'].remove(entity)
+            self.untrack_message(entity.get('response_message_id'))
+            if entity.get('response_message_id') and self.bot:
+                asyncio.create_task(self.delete_message(instance['setup_channel'], entity['response_message_id']))
+        return True
+
+    async def delete_message(self, channel_id: int, message_id: int):
+        """Delete a message the bot sent, ignoring it if already gone"""
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            return
+        try:
+            await channel.get_partial_message(message_id).delete()
+        except discord.HTTPException:
+            pass
+
     async def send_setup_embeds(self, bot, instance_id: str, setup_channel_id: int, admin_channel_id: int):
         """Send setup embeds to both channels"""
         self.bot = bot
@@ -107,6 +135,8 @@ class PostManager(BaseTool):
             if 'posts' not in instance:
                 instance['posts'] = []
             instance['posts'].append(post_data)
+            self.track_message(message.id, instance_id, post_data, 'video_message_id')
+            self.track_message(response_message.id, instance_id, post_data, 'response_message_id')
             for i, inst in enumerate(self.instances['instances']):
                 if inst.get('instance_id') == instance_id:
                     self.instances['instances'][i] = instance
@@ -142,8 +172,39 @@ class PostManager(BaseTool):
         embed.set_footer(text="Ajoutez des descriptions puis envoyez pour évaluation")
         return embed
 
-    async def add_description(self, bot, instance_id: str, post_id: str, description: str):
-        """Add a description to a post"""
+    async def update_draft_message(self, bot, instance: dict, post: dict, interaction: discord.Interaction = None, message: discord.Message = None):
+        """
+        Show the current descriptions on the draft reply. When the
+        interaction comes from the draft itself, its response is the edit
+        (one call, no fetch); a known `message` is edited directly; the
+        stored message id is fetched only as a last resort.
+        """
+        if not post.get('response_message_id'):
+            return
+
+        # Only the author can change descriptions, so the user is already known
+        if interaction is not None and interaction.user.id == post['user_id']:
+            author = interaction.user
+        else:
+            author = await bot.fetch_user(post['user_id'])
+        new_embed = self.create_post_draft_embed(post, author)
+        view = PostDraftView(self, instance['instance_id'], post['post_id'])
+
+        try:
+            if interaction is not None and interaction.message is not None and interaction.message.id == post['response_message_id']:
+                await interaction.response.edit_message(embed=new_embed, view=view)
+                return
+            if message is None or message.id != post['response_message_id']:
+                setup_channel = bot.get_channel(instance['setup_channel'])
+                if not setup_channel:
+                    return
+                message = await setup_channel.fetch_message(post['response_message_id'])
+            await message.edit(embed=new_embed, view=view)
+        except Exception as e:
+            print(f"Error updating post draft embed: {e}")
+
+    async def add_description(self, bot, instance_id: str, post_id: str, description: str, interaction: discord.Interaction = None):
+        """Add a description to a post (the draft is edited through `interaction` when given)"""
         instance = self.get_instance(instance_id)
         if not instance or 'posts' not in instance:
             return False
@@ -161,24 +222,11 @@ class PostManager(BaseTool):
                 break
         self.save_instances()
 
-        # Update the draft embed
-        if post.get('response_message_id'):
-            setup_channel = bot.get_channel(instance['setup_channel'])
-            if setup_channel:
-                try:
-                    message = await setup_channel.fetch_message(post['response_message_id'])
-                    # Get author
-                    author = await bot.fetch_user(post['user_id'])
-                    new_embed = self.create_post_draft_embed(post, author)
-                    view = PostDraftView(self, instance_id, post_id)
-                    await message.edit(embed=new_embed, view=view)
-                except Exception as e:
-                    print(f"Error updating post draft embed: {e}")
-
+        await self.update_draft_message(bot, instance, post, interaction=interaction)
         return True
 
-    async def remove_description(self, bot, instance_id: str, post_id: str, description_index: int):
-        """Remove a description from a post"""
+    async def remove_description(self, bot, instance_id: str, post_id: str, description_index: int, interaction: discord.Interaction = None, draft_message: discord.Message = None):
+        """Remove a description from a post (`draft_message`: the draft reply, when already at hand)"""
         instance = self.get_instance(instance_id)
         if not instance or 'posts' not in instance:
             return False
@@ -196,20 +244,7 @@ class PostManager(BaseTool):
                 break
         self.save_instances()
 
-        # Update the draft embed
-        if post.get('response_message_id'):
-            setup_channel = bot.get_channel(instance['setup_channel'])
-            if setup_channel:
-                try:
-                    message = await setup_channel.fetch_message(post['response_message_id'])
-                    # Get author
-                    author = await bot.fetch_user(post['user_id'])
-                    new_embed = self.create_post_draft_embed(post, author)
-                    view = PostDraftView(self, instance_id, post_id)
-                    await message.edit(embed=new_embed, view=view)
-                except Exception as e:
-                    print(f"Error updating post draft embed: {e}")
-
+        await self.update_draft_message(bot, instance, post, interaction=interaction, message=draft_message)
         return True
 
     async def submit_for_review(self, bot, instance_id: str, post_id: str):
@@ -286,6 +321,7 @@ class PostManager(BaseTool):
                 admin_message = await admin_channel.send(embed=embed, view=view)
 
             post['admin_message_id'] = admin_message.id
+            self.track_message(admin_message.id, instance_id, post, 'admin_message_id')
 
         # Save
         for i, inst in enumerate(self.instances['instances']):
@@ -377,6 +413,8 @@ class PostManager(BaseTool):
 
         # Remove post from list
         instance['posts'].remove(post)
+        for field in ('video_message_id', 'response_message_id', 'admin_message_id'):
+            self.untrack_message(post.get(field))
 
         # Save
         for i, inst in enumerate(self.instances['instances']):
@@ -503,7 +541,7 @@ class PostDraftView(discord.ui.View):
             return
 
         # Create view with dropdown to select which description to remove
-        view = RemoveDescriptionView(self.manager, self.instance_id, self.post_id, post['descriptions'])
+        view = RemoveDescriptionView(self.manager, self.instance_id, self.post_id, post['descriptions'], draft_message=interaction.message)
         await interaction.response.send_message(
             "Sélectionnez la description à supprimer :",
             view=view,
@@ -567,11 +605,12 @@ class PostDraftView(discord.ui.View):
 
 # Remove Description View
 class RemoveDescriptionView(discord.ui.View):
-    def __init__(self, manager: PostManager, instance_id: str, post_id: str, descriptions: list):
+    def __init__(self, manager: PostManager, instance_id: str, post_id: str, descriptions: list, draft_message: discord.Message = None):
         super().__init__(timeout=60)
         self.manager = manager
         self.instance_id = instance_id
         self.post_id = post_id
+        self.draft_message = draft_message  # The draft the selector was opened from, edited without a fetch
 
         # Create dropdown with all descriptions
         options = []
@@ -603,15 +642,14 @@ class RemoveDescriptionView(discord.ui.View):
             bot,
             self.instance_id,
             self.post_id,
-            selected_index
+            selected_index,
+            interaction=interaction,
+            draft_message=self.draft_message
         )
 
         if success:
-            await interaction.response.send_message(
-                "✅ Description supprimée !",
-                ephemeral=True,
-                delete_after=60
-            )
+            # Replace the selector by the confirmation (the answer to this interaction)
+            await interaction.response.edit_message(content="✅ Description supprimée !", view=None)
         else:
             await interaction.response.send_message(
                 "❌ Erreur lors de la suppression.",
@@ -643,15 +681,18 @@ class AddDescriptionModal(discord.ui.Modal):
             bot,
             self.instance_id,
             self.post_id,
-            self.description.value
+            self.description.value,
+            interaction=interaction
         )
 
         if success:
-            await interaction.response.send_message(
-                "✅ Description ajoutée !",
-                ephemeral=True,
-                delete_after=60
-            )
+            # Usually answered already by editing the draft in place
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "✅ Description ajoutée !",
+                    ephemeral=True,
+                    delete_after=60
+                )
         else:
             await interaction.response.send_message(
                 "❌ Erreur lors de l'ajout de la description.",
@@ -0,0 +1,153 @@
+"""
+Recurrence rules of the recurring TaskManager tasks.
+
+Rules are stored as short strings on the task ('recurrence'):
+
+    daily                 every day at the instance reset time
+    weekdays              Monday to Friday at the reset time
+    weekly:0,2,4          on these weekdays (0 = Monday) at the reset time
+    every:3:2026-01-05    every 3 days counted from the anchor day
+    cron:0 9 * * 1-5      5-field cron (minute hour day month weekday, 0 = Sunday)
+"""
+from datetime import date, datetime, timedelta
+
+from .reset_scheduler import occurrence_timestamp
+
+DAY_NAMES = ['lun', 'mar', 'mer', 'jeu', 'ven', 'sam', 'dim']
+FILLER_WORDS = {'tous', 'toutes', 'les', 'le', 'chaque', 'et'}  # "tous les lundis et jeudis"
+MAX_DAYS_AHEAD = 366 * 8  # Enough for a 29/02 cron rule
+
+
+def _parse_cron_field(field: str, low: int, high: int) -> set:
+    values = set()
+    for part in field.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"invalid step: {field}")
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+        else:
+            start = end = int(part)
+        if start < low or end > high or start > end:
+            raise ValueError(f"value out of range: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expression: str) -> tuple:
+    """(minutes, hours, days, months, weekdays, day restricted, weekday restricted) of a cron expression"""
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ValueError("a cron rule has 5 fields")
+    minutes = _parse_cron_field(fields[0], 0, 59)
+    hours = _parse_cron_field(fields[1], 0, 23)
+    days = _parse_cron_field(fields[2], 1, 31)
+    months = _parse_cron_field(fields[3], 1, 12)
+    weekdays = {value % 7 for value in _parse_cron_field(fields[4], 0, 7)}  # 7 is Sunday too
+    return minutes, hours, days, months, weekdays, fields[2] != '*', fields[4] != '*'
+
+
+def parse_rule(text: str, anchor: date = None) -> str:
+    """
+    Canonical rule from what an admin typed (French), raises ValueError.
+
+    Accepted: "" / "chaque jour", "semaine" / "jours ouvrés", a list of days
+    ("lun, mer, ven", "tous les lundis et jeudis"), "tous les 3 jours" and
+    "cron 0 9 * * 1-5".
+    """
+    text = text.strip().lower()
+    if text in ('', 'quotidien', 'chaque jour', 'tous les jours', 'daily'):
+        return 'daily'
+    if text in ('semaine', 'jours ouvrés', 'jours ouvres', 'weekdays'):
+        return 'weekdays'
+    if text.startswith('cron'):
+        expression = text[4:].strip(' :')
+        parse_cron(expression)
+        return f"cron:{expression}"
+
+    words = [word for word in text.replace(',', ' ').split() if word not in FILLER_WORDS]
+    if len(words) == 2 and words[0].isdigit() and words[1] in ('jours', 'jour', 'j'):
+        interval = int(words[0])
+        if interval < 1:
+            raise ValueError("interval must be positive")
+        if interval == 1:
+            return 'daily'
+        return f"every:{interval}:{(anchor or date.today()).isoformat()}"
+
+    days = []
+    for name in words:  # "lundi", "lundis" and "lun" all match on their first 3 letters
+        if name[:3] not in DAY_NAMES:
+            raise ValueError(f"unknown day: {name}")
+        days.append(DAY_NAMES.index(name[:3]))
+    if not days:
+        raise ValueError("empty rule")
+    return "weekly:" + ",".join(str(day) for day in sorted(set(days)))
+
+
+def describe_rule(rule: str) -> str:
+    """Short French label of a rule (shown on the dashboard)"""
+    kind, _, value = (rule or 'daily').partition(':')
+    if kind == 'daily':
+        return "chaque jour"
+    if kind == 'weekdays':
+        return "lun-ven"
+    if kind == 'weekly':
+        return ",".join(DAY_NAMES[int(day)] for day in value.split(','))
+    if kind == 'every':
+        return f"tous les {value.split(':')[0]} j"
+    return f"cron {value}"
+
+
+def _day_matcher(rule: str):
+    kind, _, value = rule.partition(':')
+    if kind == 'daily':
+        return lambda day: True
+    if kind == 'weekdays':
+        return lambda day: day.weekday() < 5
+    if kind == 'weekly':
+        weekdays = {int(day) for day in value.split(',')}
+        return lambda day: day.weekday() in weekdays
+    if kind == 'every':
+        interval, anchor = value.split(':')
+        interval, anchor = int(interval), date.fromisoformat(anchor)
+        return lambda day: (day - anchor).days % interval == 0
+    raise ValueError(f"unknown rule: {rule}")
+
+
+def next_occurrence(rule: str, hour: int, minute: int, zone, after: float):
+    """
+    Timestamp of the first occurrence of `rule` strictly after `after`
+    (None if the rule never fires). Non-cron rules fire at hour:minute.
+    """
+    rule = rule or 'daily'
+    day = datetime.fromtimestamp(after, zone).date()
+
+    if rule.startswith('cron:'):
+        minutes, hours, days, months, weekdays, day_restricted, weekday_restricted = parse_cron(rule[5:])
+        times = sorted((h, m) for h in hours for m in minutes)
+        for _ in range(MAX_DAYS_AHEAD):
+            in_month = day.day in days
+            in_week = (day.weekday() + 1) % 7 in weekdays
+            # Like cron: when both day fields are restricted, either one matches
+            matches = (in_month or in_week) if day_restricted and weekday_restricted else (in_month and in_week)
+            if day.month in months and matches:
+                for h, m in times:
+                    ts = occurrence_timestamp(day, h, m, zone)
+                    if ts > after:
+                        return ts
+            day += timedelta(days=1)
+        return None
+
+    matches = _day_matcher(rule)
+    for _ in range(MAX_DAYS_AHEAD):
+        if matches(day):
+            ts = occurrence_timestamp(day, hour, minute, zone)
+            if ts > after:
+                return ts
+        day += timedelta(days=1)
+    return None
@@ -0,0 +1,199 @@
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python < 3.9: only the host time zone is available
+    ZoneInfo = None
+    ZoneInfoNotFoundError = Exception
+
+
+# Catch-up after downtime walks the missed occurrences up to this many
+MAX_MISSED_OCCURRENCES = 1000
+
+
+def get_zone(name: str):
+    """ZoneInfo for an IANA name (e.g. "Europe/Paris"), None if empty or unknown"""
+    if not name or ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def occurrence_timestamp(day, hour: int, minute: int, zone) -> float:
+    """Unix timestamp of HH:MM on `day` in `zone` (host time zone if None)"""
+    local = datetime(day.year, day.month, day.day, hour, minute, tzinfo=zone)
+    return local.timestamp()
+
+
+class ResetScheduler:
+    """
+    One background task firing every recurring reset (e.g. the recurring
+    tasks of all TaskManager instances).
+
+    Each key (instance_id, task_id) has one heap entry holding its next
+    occurrence, given by its `next_fn(after)` function; occurrences are
+    computed in the instance's IANA time zone, so DST changes move the fire
+    time instead of drifting it. The task sleeps until the earliest
+    occurrence but never longer than `max_sleep` seconds: each wakeup
+    recomputes the delay from the wall clock, which corrects drift and clock
+    changes. Everything due at once is delivered as one batch per group (the
+    first item of the key), and groups falling in the same minute are spread
+    `stagger` seconds apart. An occurrence missed while the bot was offline
+    (after `last_fire`) fires right away, once.
+    """
+
+    def __init__(self, on_due, stagger: float = 5.0, max_sleep: float = 60.0):
+        self.on_due = on_due  # async callback(group, [(key, occurrence timestamp)])
+        self.stagger = stagger
+        self.max_sleep = max_sleep
+        self.heap = []  # [fire_at, seq, key, occurrence, active, minute slot]
+        self.entries = {}  # {key: heap entry}
+        self.rules = {}  # {key: next_fn}
+        self.minute_slots = {}  # Groups placed in each minute: {minute: {group: [slot, entry count]}}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries
+
+    @staticmethod
+    def group_of(key):
+        return key[0] if isinstance(key, tuple) else key
+
+    def start(self):
+        """Start the scheduler task (no-op if already running)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def schedule(self, key, next_fn, last_fire: float = None) -> bool:
+        """
+        (Re)schedule `key`. `next_fn(after)` returns the first occurrence
+        timestamp after `after` (None when the rule never fires again).
+        `last_fire` is the occurrence of the last reset done, used to catch
+        up one missed during downtime. Returns False if nothing is scheduled.
+        """
+        self.rules[key] = next_fn
+        now = time.time()
+
+        missed = next_fn(last_fire) if last_fire is not None else None
+        if missed is not None and missed <= now:
+            # Fire once for the latest missed occurrence
+            for _ in range(MAX_MISSED_OCCURRENCES):
+                following = next_fn(missed)
+                if following is None or following > now:
+                    break
+                missed = following
+            self._push(key, missed, now)
+            return True
+
+        occurrence = next_fn(now)
+        if occurrence is None:
+            self.cancel(key)
+            return False
+        self._push(key, occurrence, occurrence)
+        return True
+
+    def cancel(self, key) -> bool:
+        self.rules.pop(key, None)
+        return self._remove(key)
+
+    def next_fire(self, key):
+        """Timestamp of the next occurrence of a key (None if not scheduled)"""
+        entry = self.entries.get(key)
+        return entry[0] if entry else None
+
+    def _remove(self, key) -> bool:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[4] = False
+        self._release_slot(entry[5], self.group_of(key))
+        return True
+
+    def _push(self, key, occurrence: float, fire_at: float):
+        self._remove(key)
+        minute = int(fire_at // 60)
+        groups = self.minute_slots.setdefault(minute, {})
+        slot = groups.get(self.group_of(key))
+        if slot is None:
+            # Lowest slot not in use: after a release, len(groups) may already be taken
+            used = {position for position, _ in groups.values()}
+            slot = groups[self.group_of(key)] = [next(i for i in itertools.count() if i not in used), 0]
+        slot[1] += 1
+        entry = [fire_at + slot[0] * self.stagger, next(self._counter), key, occurrence, True, minute]
+        self.entries[key] = entry
+        heapq.heappush(self.heap, entry)
+        if self.heap[0] is entry:
+            self._wakeup.set()
+
+    def _release_slot(self, minute: int, group):
+        groups = self.minute_slots.get(minute)
+        if not groups or group not in groups:
+            return
+        groups[group][1] -= 1
+        if groups[group][1] <= 0:
+            del groups[group]
+        if not groups:
+            del self.minute_slots[minute]
+
+    def _pop_due(self, now: float) -> dict:
+        """Pop every active entry due, rescheduling its next occurrence: {group: [(key, occurrence)]}"""
+        batches = {}
+        while self.heap and self.heap[0][0] <= now:
+            entry = heapq.heappop(self.heap)
+            if not entry[4]:
+                continue
+            _, _, key, occurrence, _, slot_minute = entry
+            del self.entries[key]
+            self._release_slot(slot_minute, self.group_of(key))
+            batches.setdefault(self.group_of(key), []).append((key, occurrence))
+
+            upcoming = self.rules[key](max(occurrence, now))
+            if upcoming is not None:
+                self._push(key, upcoming, upcoming)
+            else:
+                del self.rules[key]
+        return batches
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            while self.heap and not self.heap[0][4]:
+                heapq.heappop(self.heap)
+
+            if not self.heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self.heap[0][0] - time.time()
+            if delay > 0:
+                # Bounded sleep on the loop's monotonic clock, re-checked against wall time
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, self.max_sleep))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            for group, items in self._pop_due(time.time()).items():
+                asyncio.create_task(self._deliver(group, items))
+
+    async def _deliver(self, group, items: list):
+        try:
+            await self.on_due(group, items)
+        except Exception as e:
+            print(f"Error running scheduled resets for {group}: {e}")
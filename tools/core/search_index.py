@@ -0,0 +1,55 @@
+from bisect import bisect_left, insort
+
+
+class PrefixIndex:
+    """
+    Sorted prefix index over the entities of one instance.
+
+    Each entity (user, task...) is indexed under a few lowercase keys (name,
+    id...). Entries are kept sorted so a prefix lookup is a binary search
+    followed by a walk over the matching range, without formatting or
+    scanning the entities themselves.
+    """
+
+    def __init__(self):
+        self.entries = []  # Sorted [(key, entity_id)]
+        self.keys_by_entity = {}  # {entity_id: [keys]}
+
+    def __len__(self) -> int:
+        return len(self.keys_by_entity)
+
+    @staticmethod
+    def normalize(text) -> str:
+        return str(text).strip().lower()
+
+    def add(self, entity_id: str, keys):
+        """Index (or re-index) an entity under the given keys"""
+        self.remove(entity_id)
+        normalized = sorted({self.normalize(key) for key in keys if key})
+        for key in normalized:
+            insort(self.entries, (key, entity_id))
+        self.keys_by_entity[entity_id] = normalized
+
+    def remove(self, entity_id: str):
+        """Remove an entity from the index"""
+        for key in self.keys_by_entity.pop(entity_id, []):
+            i = bisect_left(self.entries, (key, entity_id))
+            if i < len(self.entries) and self.entries[i] == (key, entity_id):
+                del self.entries[i]
+
+    def search(self, prefix: str, limit: int = 25) -> list:
+        """Entity ids having a key starting with `prefix` (at most `limit`)"""
+        prefix = self.normalize(prefix)
+        if not prefix:
+            return []
+
+        found = []
+        i = bisect_left(self.entries, (prefix,))
+        while i < len(self.entries) and len(found) < limit:
+            key, entity_id = self.entries[i]
+            if not key.startswith(prefix):
+                break
+            if entity_id not in found:
+                found.append(entity_id)
+            i += 1
+        return found
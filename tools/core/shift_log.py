@@ -0,0 +1,111 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+
+EVENT_TYPES = ('start', 'pause', 'resume', 'end')
+EVENT_STATUS = {'start': 'active', 'pause': 'pause', 'resume': 'active', 'end': 'ended'}  # Status entered by each event
+
+
+def shift_event_type(old_status: str, new_status: str):
+    """Event recorded for a status change (None if the status did not change)"""
+    if old_status == new_status:
+        return None
+    if new_status == 'pause':
+        return 'pause'
+    if new_status == 'ended':
+        return 'end'
+    if new_status == 'active':
+        return 'resume' if old_status == 'pause' else 'start'
+    return None
+
+
+def split_by_day(start: datetime, end: datetime):
+    """Yield (day, seconds) for the part of [start, end) falling on each day"""
+    while start < end:
+        next_midnight = datetime.combine(start.date() + timedelta(days=1), datetime.min.time())
+        chunk_end = min(end, next_midnight)
+        yield start.date().isoformat(), (chunk_end - start).total_seconds()
+        start = chunk_end
+
+
+class ShiftLog:
+    """
+    Append-only shift event stream (JSON Lines file).
+
+    One line per event: {"instance_id", "user_id", "type", "at"}. Events are
+    only ever appended; readers stream the file line by line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def append(self, instance_id: str, user_id: str, event_type: str, at: datetime):
+        event = {
+            'instance_id': instance_id,
+            'user_id': user_id,
+            'type': event_type,
+            'at': at.isoformat()
+        }
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(event) + "\n")
+
+    def append_many(self, events: list):
+        """Append [(instance_id, user_id, event_type, at)] with one write (after a batch was saved)"""
+        if not events:
+            return
+        lines = [
+            json.dumps({'instance_id': instance_id, 'user_id': user_id, 'type': event_type, 'at': at.isoformat()})
+            for instance_id, user_id, event_type, at in events
+        ]
+        with open(self.path, 'a') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def iter_events(self, instance_id: str = None, since: datetime = None, until: datetime = None):
+        """Stream the events of an instance (or all), optionally within [since, until)"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if instance_id is not None and event['instance_id'] != instance_id:
+                    continue
+                at = datetime.fromisoformat(event['at'])
+                if since is not None and at < since:
+                    continue
+                if until is not None and at >= until:
+                    continue
+                yield event
+
+    def daily_rollups(self, instance_id: str, since: datetime, until: datetime) -> dict:
+        """
+        Daily rollups {user_id: {day: {'worked', 'paused', 'pauses'}}} of
+        [since, until), rebuilt by replaying the events. Used for the days
+        older than the rollups kept in the instance; intervals still open
+        at `until` are counted up to `until`.
+        """
+        rollups = {}
+        state = {}  # Status entered by the last event of each user: {user_id: (status, at)}
+
+        def add(user_id, field, start, end):
+            days = rollups.setdefault(user_id, {})
+            for day, seconds in split_by_day(max(start, since), min(end, until)):
+                days.setdefault(day, {'worked': 0, 'paused': 0, 'pauses': 0})[field] += round(seconds)
+
+        for event in self.iter_events(instance_id, until=until):
+            user_id = event['user_id']
+            at = datetime.fromisoformat(event['at'])
+            previous = state.get(user_id)
+            if previous and previous[0] in ('active', 'pause'):
+                add(user_id, 'worked' if previous[0] == 'active' else 'paused', previous[1], at)
+            if event['type'] == 'pause' and at >= since:
+                days = rollups.setdefault(user_id, {})
+                days.setdefault(at.date().isoformat(), {'worked': 0, 'paused': 0, 'pauses': 0})['pauses'] += 1
+            state[user_id] = (EVENT_STATUS[event['type']], at)
+
+        for user_id, (status, at) in state.items():
+            if status in ('active', 'pause'):
+                add(user_id, 'worked' if status == 'active' else 'paused', at, until)
+        return rollups
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import sqlite3
+import time
+
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    """Return the shard handling a guild (same formula as Discord)"""
+    return (guild_id >> 22) % shard_count
+
+
+class StateStore:
+    """
+    Shared local state store used in cluster mode.
+
+    Every worker process opens its own connection to the same SQLite file.
+    Instances are stored one row per (tool, instance_id) so that each worker
+    only rewrites the instances of the guilds it owns, and singleton jobs are
+    coordinated through leases (leader election) and one-shot claims.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS instances (
+                tool TEXT NOT NULL,
+                instance_id TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (tool, instance_id)
+            );
+            CREATE TABLE IF NOT EXISTS leases (
+                name TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS claims (
+                key TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                claimed_at REAL NOT NULL
+            );
+            """
+        )
+
+    def close(self):
+        self.conn.close()
+
+    def load_instances(self, tool_name: str, owns_guild=None) -> list:
+        """Load the instances of a tool, optionally only those of owned guilds"""
+        rows = self.conn.execute(
+            "SELECT guild_id, data FROM instances WHERE tool = ? ORDER BY rowid",
+            (tool_name,)
+        ).fetchall()
+        return [
+            json.loads(data) for guild_id, data in rows
+            if owns_guild is None or owns_guild(guild_id)
+        ]
+
+    def save_instances(self, tool_name: str, instances: list, owns_guild=None):
+        """
+        Write the instances of a tool in one transaction.
+
+        Rows of guilds owned by other workers are left untouched; owned rows
+        missing from `instances` are deleted.
+        """
+        keep = {inst['instance_id'] for inst in instances}
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = self.conn.execute(
+                "SELECT instance_id, guild_id FROM instances WHERE tool = ?",
+                (tool_name,)
+            ).fetchall()
+            stale = [
+                (tool_name, instance_id) for instance_id, guild_id in existing
+                if instance_id not in keep and (owns_guild is None or owns_guild(guild_id))
+            ]
+            self.conn.executemany(
+                "DELETE FROM instances WHERE tool = ? AND instance_id = ?",
+                stale
+            )
+            self.conn.executemany(
+                "INSERT INTO instances (tool, instance_id, guild_id, data) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (tool, instance_id) DO UPDATE SET guild_id = excluded.guild_id, data = excluded.data",
+                [
+                    (tool_name, inst['instance_id'], inst['guild_id'], json.dumps(inst))
+                    for inst in instances
+                ]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def acquire_lease(self, name: str, holder: str, ttl: float) -> bool:
+        """Acquire or renew a lease; returns True if `holder` owns it afterwards"""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "INSERT INTO leases (name, holder, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at "
+                "WHERE leases.holder = excluded.holder OR leases.expires_at < ?",
+                (name, holder, now + ttl, now)
+            )
+            row = self.conn.execute("SELECT holder FROM leases WHERE name = ?", (name,)).fetchone()
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return row is not None and row[0] == holder
+
+    def release_lease(self, name: str, holder: str):
+        """Release a lease held by `holder`"""
+        self.conn.execute("DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder))
+
+    def claim(self, key: str, holder: str) -> bool:
+        """Claim a one-shot job; only the first caller for a key gets True"""
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO claims (key, holder, claimed_at) VALUES (?, ?, ?)",
+            (key, holder, time.time())
+        )
+        return cursor.rowcount == 1
+
+    def prune_claims(self, older_than: float) -> int:
+        """Delete claims older than `older_than` seconds"""
+        cursor = self.conn.execute(
+            "DELETE FROM claims WHERE claimed_at < ?",
+            (time.time() - older_than,)
+        )
+        return cursor.rowcount
+
+
+class LeaderElection:
+    """Keeps a leader lease alive for one worker and runs leader-only housekeeping"""
+
+    LEASE_NAME = "leader"
+
+    def __init__(self, store: StateStore, worker_id: str, ttl: float = 30.0, claim_retention: float = 7 * 86400):
+        self.store = store
+        self.worker_id = worker_id
+        self.ttl = ttl
+        self.claim_retention = claim_retention
+        self.is_leader = False
+
+    def step(self) -> bool:
+        """Try to acquire/renew the lease once, returns leadership"""
+        was_leader = self.is_leader
+        self.is_leader = self.store.acquire_lease(self.LEASE_NAME, self.worker_id, self.ttl)
+        if self.is_leader and not was_leader:
+            print(f"Worker {self.worker_id} is now cluster leader")
+        elif was_leader and not self.is_leader:
+            print(f"Worker {self.worker_id} lost cluster leadership")
+        if self.is_leader:
+            self.store.prune_claims(self.claim_retention)
+        return self.is_leader
+
+    async def run(self):
+        """Renew the lease every ttl/3 seconds until cancelled"""
+        try:
+            while True:
+                try:
+                    self.step()
+                except sqlite3.Error as e:
+                    print(f"Error in leader election for worker {self.worker_id}: {e}")
+                    self.is_leader = False
+                await asyncio.sleep(self.ttl / 3)
+        finally:
+            if self.is_leader:
+                self.store.release_lease(self.LEASE_NAME, self.worker_id)
+                self.is_leader = False
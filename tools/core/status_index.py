@@ -0,0 +1,83 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+
+
+STATUS_ORDER = {'active': 0, 'pause': 1, 'ended': 2}
+
+
+class StatusIndex:
+    """
+    Live status counters and ordering of the users of one instance.
+
+    Users are kept sorted by (status, most recent last_action first) in a
+    list searched with bisect, so a status change costs one removal and one
+    insertion instead of a scan, and counters per status are always
+    available. The index can be used directly as a PaginatedEmbed section
+    source: it yields (user_id, data) pairs in order.
+    """
+
+    def __init__(self, users: dict):
+        self.users = users  # The instance's users dict (shared, not copied)
+        self.counts = {status: 0 for status in STATUS_ORDER}
+        self.entries = []  # Sorted [(rank, -last_action timestamp, user_id)]
+        self.entry_of = {}  # {user_id: (entry, status)}
+
+        for user_id, data in users.items():
+            entry, status = self._entry(user_id, data)
+            self.entries.append(entry)
+            self.entry_of[user_id] = (entry, status)
+            self.counts[status] = self.counts.get(status, 0) + 1
+        self.entries.sort()
+
+    @staticmethod
+    def _entry(user_id: str, data: dict) -> tuple:
+        status = data.get('status')
+        last_action = data.get('last_action')
+        timestamp = datetime.fromisoformat(last_action).timestamp() if last_action else 0.0
+        return (STATUS_ORDER.get(status, len(STATUS_ORDER)), -timestamp, user_id), status
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        for _, _, user_id in self.entries:
+            yield user_id, self.users[user_id]
+
+    def fetch(self, start: int, stop: int) -> list:
+        return [(user_id, self.users[user_id]) for _, _, user_id in self.entries[start:stop]]
+
+    def remove(self, user_id: str):
+        """Remove a user from the index"""
+        previous = self.entry_of.pop(user_id, None)
+        if previous is None:
+            return
+        entry, status = previous
+        i = bisect_left(self.entries, entry)
+        if i < len(self.entries) and self.entries[i] == entry:
+            del self.entries[i]
+        self.counts[status] -= 1
+
+    def update(self, user_id: str):
+        """Re-position a user after its status/last_action changed (or it was added)"""
+        self.remove(user_id)
+        data = self.users.get(user_id)
+        if data is None:
+            return
+        entry, status = self._entry(user_id, data)
+        insort(self.entries, entry)
+        self.entry_of[user_id] = (entry, status)
+        self.counts[status] = self.counts.get(status, 0) + 1
+
+    def users_with_status(self, status: str) -> list:
+        """Ids of all the users in `status`"""
+        rank = STATUS_ORDER[status]
+        start = bisect_left(self.entries, (rank,))
+        end = bisect_left(self.entries, (rank + 1,))
+        return [user_id for _, _, user_id in self.entries[start:end]]
+
+    def users_with_status_before(self, status: str, before: datetime) -> list:
+        """Ids of the users in `status` whose last_action is older than `before`"""
+        rank = STATUS_ORDER[status]
+        start = bisect_left(self.entries, (rank, -before.timestamp()))
+        end = bisect_left(self.entries, (rank + 1,))
+        return [user_id for _, timestamp, user_id in self.entries[start:end] if -timestamp < before.timestamp()]
@@ -0,0 +1,132 @@
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta
+
+
+def parse_due(value: str):
+    """Due day (ISO "YYYY-MM-DD", sortable) of a task date typed as JJ/MM/AAAA, None if unparsable"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value.strip(), '%d/%m/%Y').date().isoformat()
+    except ValueError:
+        return None
+
+
+def content_preview(content: str, length: int) -> str:
+    """First `length` characters of a task, with "..." when cut"""
+    return content[:length] + "..." if len(content) > length else content
+
+
+class TaskBucket:
+    """Tasks of one (is_daily, status) bucket in creation order (len, iteration and slicing)"""
+
+    def __init__(self, tasks_by_id: dict):
+        self.tasks_by_id = tasks_by_id  # Shared with the index
+        self.keys = []  # Sorted [(created_at, task_id)]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self):
+        for _, task_id in self.keys:
+            yield self.tasks_by_id[task_id]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.tasks_by_id[task_id] for _, task_id in self.keys[index]]
+        return self.tasks_by_id[self.keys[index][1]]
+
+    def add(self, key: tuple):
+        insort(self.keys, key)
+
+    def discard(self, key: tuple):
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            del self.keys[i]
+
+
+class TaskBucketIndex:
+    """
+    Tasks of one instance grouped by (is_daily, status).
+
+    Each bucket keeps its tasks sorted by creation, so moving a task to
+    another bucket is one bisect removal and one insertion, and dashboards
+    read the buckets directly instead of partitioning the task list. Content
+    previews are cached per task and dropped when the task changes.
+
+    Open specific tasks with a due day are also kept sorted by due day, so
+    the tasks due up to a given day are a bisect and a slice: O(k) for the k
+    tasks returned, whatever the number of tasks.
+    """
+
+    def __init__(self, tasks: list):
+        self.tasks_by_id = {}
+        self.buckets = {}  # {(is_daily, status): TaskBucket}
+        self.bucket_of = {}  # {task_id: ((is_daily, status), sort key)}
+        self.previews = {}  # {task_id: {length: preview}}
+        self.due = []  # Sorted [(due day, created_at, task_id)] of the open specific tasks
+        self.due_of = {}  # {task_id: due entry}
+        for task in tasks:
+            self.update(task)
+
+    def bucket(self, is_daily: bool, status: str) -> TaskBucket:
+        bucket = self.buckets.get((is_daily, status))
+        if bucket is None:
+            bucket = self.buckets[(is_daily, status)] = TaskBucket(self.tasks_by_id)
+        return bucket
+
+    def count(self, is_daily: bool, status: str) -> int:
+        bucket = self.buckets.get((is_daily, status))
+        return len(bucket) if bucket else 0
+
+    def tasks(self, is_daily: bool) -> list:
+        """Every task of a kind (daily or specific), all statuses, in creation order"""
+        keys = sorted(
+            key for (daily, _), bucket in self.buckets.items() if daily == is_daily for key in bucket.keys
+        )
+        return [self.tasks_by_id[task_id] for _, task_id in keys]
+
+    def preview(self, task: dict, length: int) -> str:
+        previews = self.previews.setdefault(task['task_id'], {})
+        preview = previews.get(length)
+        if preview is None:
+            preview = previews[length] = content_preview(task['content'], length)
+        return preview
+
+    def update(self, task: dict):
+        """Add a task, or move it after its status/content changed"""
+        self.remove(task['task_id'])
+        bucket_key = (task.get('is_daily', False), task['status'])
+        sort_key = (task.get('created_at') or '', task['task_id'])
+        self.tasks_by_id[task['task_id']] = task
+        self.bucket(*bucket_key).add(sort_key)
+        self.bucket_of[task['task_id']] = (bucket_key, sort_key)
+
+        due = task.get('due') or parse_due(task.get('date'))
+        if due and not task.get('is_daily', False) and task['status'] != 'done':
+            entry = (due,) + sort_key
+            insort(self.due, entry)
+            self.due_of[task['task_id']] = entry
+
+    def due_until(self, day: date) -> list:
+        """Open specific tasks due on `day` or before (overdue first)"""
+        end = bisect_left(self.due, ((day + timedelta(days=1)).isoformat(),))
+        return [self.tasks_by_id[task_id] for _, _, task_id in self.due[:end]]
+
+    def count_due_before(self, day: date) -> int:
+        return bisect_left(self.due, (day.isoformat(),))
+
+    def remove(self, task_id: str):
+        previous = self.bucket_of.pop(task_id, None)
+        if previous is None:
+            return
+        bucket_key, sort_key = previous
+        self.buckets[bucket_key].discard(sort_key)
+        del self.tasks_by_id[task_id]
+        self.previews.pop(task_id, None)
+
+        entry = self.due_of.pop(task_id, None)
+        if entry is not None:
+            i = bisect_left(self.due, entry)
+            if i < len(self.due) and self.due[i] == entry:
+                del self.due[i]
@@ -1,12 +1,44 @@
 import discord
 from discord import app_commands
 from .base_tool import BaseTool
-from .pagination import PaginatedEmbed, PaginationView
+from .pagination import PaginatedEmbed, PaginationView, FragmentCache, SequenceChain, JumpToPageModal
+from .reset_scheduler import ResetScheduler, get_zone
+from .recurrence import next_occurrence, parse_rule, describe_rule
+from .task_index import TaskBucketIndex, parse_due
 import asyncio
-from datetime import datetime, time, timedelta
+import csv
+import io
+from datetime import date, datetime, timedelta
 import uuid
 
 
+STATUS_LABELS = {
+    'in_progress': '⏳ **En cours**',
+    'pending': '⏸️ **En attente**'
+}
+
+STATUS_EMOJIS = {
+    'in_progress': '⏳',
+    'pending': '⏸️'
+}
+
+# Longest dashboard line: emoji, short id, date or recurrence and a 50 char preview
+TASK_LINE_MAX_CHARS = 90
+RECURRENCE_LABEL_MAX_CHARS = 20
+
+# Bulk import: at most this many tasks per import, cards posted this many at a time
+IMPORT_MAX_TASKS = 200
+IMPORT_MAX_FILE_BYTES = 256 * 1024
+IMPORT_CARD_CONCURRENCY = 3
+
+# Startup card check: setup channel messages read per instance (newest first), reposts in flight
+CARD_RECONCILE_DEPTH = 500
+CARD_RECONCILE_CONCURRENCY = 3
+BULK_DELETE_MAX_AGE = timedelta(days=14)  # Discord only bulk-deletes recent messages
+
+TASK_CARD_TITLE = "📋 Tâche"
+
+
 class TaskManager(BaseTool):
     """Task Manager - Manages tasks/todos with daily recurring tasks"""
 
@@ -19,7 +51,13 @@ class TaskManager(BaseTool):
             json_file="tools/data/task_manager.json"
         )
         self.refresh_tasks = {}  # Store auto-refresh tasks: {instance_id: task}
-        self.daily_tasks = {}  # Store daily task schedulers: {instance_id: task}
+        self.reset_scheduler = ResetScheduler(self.on_tasks_due)  # Next occurrence of every recurring task: {(instance_id, task_id)}
+        self.due_sweeper = ResetScheduler(self.on_due_sweep)  # Daily due-date sweep of every instance, at its reset time
+        self.admin_layouts = {}  # Cached dashboard layouts: {instance_id: (data_version, PaginatedEmbed)}
+        self.admin_pages = {}  # Page shown on each admin panel message, in memory only: {message_id: page}
+        self.task_fragments = FragmentCache()  # Formatted task lines keyed by (instance_id, task_id, version)
+        self.task_indexes = {}  # Tasks bucketed by (is_daily, status) with cached previews: {instance_id: TaskBucketIndex}
+        self.cards_reconciled = set()  # Instances whose cards were checked since the bot started
         self.bot = None
 
     async def send_setup_embeds(self, bot, instance_id: str, setup_channel_id: int, admin_channel_id: int):
@@ -45,9 +83,9 @@ class TaskManager(BaseTool):
         await setup_channel.send(embed=setup_embed)
 
         # Admin channel - dashboard
-        admin_embed = self.create_admin_embed(instance_id, page=0)
+        admin_embeds = self.create_admin_embeds(instance_id, page=0)
         admin_view = AdminPanelView(self, instance_id, page=0)
-        admin_message = await admin_channel.send(embed=admin_embed, view=admin_view)
+        admin_message = await admin_channel.send(embeds=admin_embeds, view=admin_view)
 
         # Initialize instance data
         instance = self.get_instance(instance_id)
@@ -57,7 +95,7 @@ class TaskManager(BaseTool):
             if 'daily_reset_time' not in instance:
                 instance['daily_reset_time'] = "00:00"  # Default midnight
             instance['admin_message_id'] = admin_message.id
-            instance['admin_page'] = 0
+            self.track_message(admin_message.id, instance_id, None, 'admin_message_id')
             for i, inst in enumerate(self.instances['instances']):
                 if inst.get('instance_id') == instance_id:
                     self.instances['instances'][i] = instance
@@ -70,148 +108,423 @@ class TaskManager(BaseTool):
         refresh_task = asyncio.create_task(self.auto_refresh_admin_panel(bot, instance_id, admin_channel_id))
         self.refresh_tasks[instance_id] = refresh_task
 
-        # Start daily task scheduler
-        if instance_id in self.daily_tasks:
-            self.daily_tasks[instance_id].cancel()
-        daily_task = asyncio.create_task(self.daily_task_scheduler(bot, instance_id))
-        self.daily_tasks[instance_id] = daily_task
+        # Schedule the recurring tasks (kept when an instance is set up again) and the due-date sweep
+        if instance:
+            self.schedule_instance_tasks(instance)
+            self.schedule_due_sweep(instance)
 
         return True
 
-    def create_admin_embed(self, instance_id: str, page: int = 0) -> discord.Embed:
-        """Create the admin dashboard embed with PaginatedEmbed"""
+    def get_admin_paginated(self, instance_id: str) -> PaginatedEmbed:
+        """Get the dashboard PaginatedEmbed, rebuilt only when the data changed"""
         instance = self.get_instance(instance_id)
-        tasks = instance.get('tasks', []) if instance else []
+        today = self.instance_today(instance)
+        # The due section changes with the day even if no task changed
+        cached = self.admin_layouts.get(instance_id)
+        if cached and cached[0] == (self.data_version, today):
+            return cached[1]
+
         daily_reset_time = instance.get('daily_reset_time', '00:00') if instance else '00:00'
+        timezone = f" ({instance['timezone']})" if instance and instance.get('timezone') else ""
+        task_index = self.get_task_index(instance_id)
 
-        # Separate tasks by type
-        daily_tasks = [t for t in tasks if t.get('is_daily', False)]
-        specific_tasks = [t for t in tasks if not t.get('is_daily', False)]
-
-        # Filter specific tasks by status (no done tasks)
-        specific_in_progress = [t for t in specific_tasks if t['status'] == 'in_progress']
-        specific_pending = [t for t in specific_tasks if t['status'] == 'pending']
-
-        # Daily tasks (show all regardless of status)
-        daily_in_progress = [t for t in daily_tasks if t['status'] == 'in_progress']
-        daily_pending = [t for t in daily_tasks if t['status'] == 'pending']
-
-        # Combine daily tasks by status
-        daily_combined = []
-        if daily_in_progress:
-            daily_combined.append(('in_progress', daily_in_progress))
-        if daily_pending:
-            daily_combined.append(('pending', daily_pending))
-
-        # Combine specific tasks by status
-        specific_combined = []
-        if specific_in_progress:
-            specific_combined.append(('in_progress', specific_in_progress))
-        if specific_pending:
-            specific_combined.append(('pending', specific_pending))
-
-        def format_daily_task(task_data):
-            status, task_list = task_data
-            status_labels = {
-                'in_progress': '⏳ **En cours**',
-                'pending': '⏸️ **En attente**'
-            }
-
-            result = f"{status_labels.get(status, 'Inconnu')} ({len(task_list)})\n"
-            for task in task_list:
-                content_preview = task['content'][:50]
-                if len(task['content']) > 50:
-                    content_preview += "..."
-                result += f"• `{task['task_id'][:8]}` {content_preview}\n"
-            return result
-
-        def format_specific_task(task_data):
-            status, task_list = task_data
-            status_labels = {
-                'in_progress': '⏳ **En cours**',
-                'pending': '⏸️ **En attente**'
-            }
-
-            result = f"{status_labels.get(status, 'Inconnu')} ({len(task_list)})\n"
-            for task in task_list:
-                date_str = task.get('date', 'Aucune date')
-                content_preview = task['content'][:50]
-                if len(task['content']) > 50:
-                    content_preview += "..."
-                result += f"• `{task['task_id'][:8]}` [{date_str}] {content_preview}\n"
-            return result
+        def task_key(task):
+            return (instance_id, task['task_id'], self.entity_version(instance_id, task['task_id']))
 
         # Create PaginatedEmbed
         paginated = PaginatedEmbed(
             title="✅ Todo",
-            description=f"Tableau de bord des tâches\n🕐 Heure de réinitialisation : **{daily_reset_time}**",
+            description=f"Tableau de bord des tâches\n🕐 Heure de réinitialisation : **{daily_reset_time}**{timezone}",
             color=discord.Color.from_rgb(255, 255, 255),
             footer_text="Mise à jour automatique toutes les 60s",
-            items_per_page=10,
-            max_chars_per_page=1900
+            items_per_page=10,  # Tasks per field, a page holds as many fields as Discord allows
+            pack_fields=True
         )
 
-        # Add daily tasks section
+        # Overdue and due today first (O(k) slice of the due index)
+        due_tasks = task_index.due_until(today)
+        overdue = task_index.count_due_before(today)
         paginated.add_section(
-            name="🔄 **Tâches Journalières**",
-            items=daily_combined,
-            formatter=format_daily_task,
-            empty_message="*Aucune tâche journalière*",
-            inline=False
+            name=f"⚠️ **Échéances** (🔴 {overdue} · 📅 {len(due_tasks) - overdue})",
+            items=due_tasks,
+            formatter=lambda task: self.format_due_task_line(task, task_index.preview(task, 50), today),
+            empty_message="*Aucune tâche en retard ou pour aujourd'hui*",
+            inline=False,
+            cache=self.task_fragments,
+            cache_key=lambda task: task_key(task) + ('due', today),
+            max_item_chars=TASK_LINE_MAX_CHARS
         )
 
-        # Add specific tasks section
-        paginated.add_section(
-            name="📌 **Tâches Spécifiques**",
-            items=specific_combined,
-            formatter=format_specific_task,
-            empty_message="*Aucune tâche spécifique*",
-            inline=False
-        )
+        for is_daily, name, empty_message, format_line in (
+            (True, "🔄 **Tâches Journalières**", "*Aucune tâche journalière*", self.format_daily_task_line),
+            (False, "📌 **Tâches Spécifiques**", "*Aucune tâche spécifique*", self.format_specific_task_line),
+        ):
+            # Done tasks are not shown, in progress before pending
+            groups = [task_index.bucket(is_daily, status) for status in STATUS_LABELS]
+            counts = " · ".join(f"{STATUS_EMOJIS[status]} {len(group)}" for status, group in zip(STATUS_LABELS, groups))
+            items = SequenceChain(*groups)
+            # Only the tasks of the requested page are formatted (lines are bounded)
+            paginated.add_section(
+                name=f"{name} ({counts})",
+                items=items,
+                formatter=lambda task, format_line=format_line: format_line(task, task_index.preview(task, 50)),
+                empty_message=empty_message,
+                inline=False,
+                cache=self.task_fragments,
+                cache_key=task_key,
+                max_item_chars=TASK_LINE_MAX_CHARS
+            )
 
-        pages = paginated.generate_pages()
+        self.admin_layouts[instance_id] = ((self.data_version, today), paginated)
+        return paginated
+
+    @staticmethod
+    def format_daily_task_line(task: dict, content_preview: str) -> str:
+        rule = task.get('recurrence') or 'daily'
+        recurrence = "" if rule == 'daily' else f"🔁 {describe_rule(rule)[:RECURRENCE_LABEL_MAX_CHARS]} · "
+        return f"{STATUS_EMOJIS.get(task['status'], '')} `{task['task_id'][:8]}` {recurrence}{content_preview}"
+
+    @staticmethod
+    def format_specific_task_line(task: dict, content_preview: str) -> str:
+        date_str = task.get('date', 'Aucune date')
+        return f"{STATUS_EMOJIS.get(task['status'], '')} `{task['task_id'][:8]}` [{date_str}] {content_preview}"
+
+    @staticmethod
+    def format_due_task_line(task: dict, content_preview: str, today: date) -> str:
+        marker = "🔴" if (task.get('due') or parse_due(task.get('date'))) < today.isoformat() else "📅"
+        return f"{marker} `{task['task_id'][:8]}` [{task.get('date')}] {content_preview}"
+
+    @staticmethod
+    def instance_today(instance: dict) -> date:
+        """Current day in the instance's time zone"""
+        return datetime.now(get_zone(instance.get('timezone') if instance else None)).date()
+
+    def get_task_index(self, instance_id: str) -> TaskBucketIndex:
+        """Task bucket index of an instance, built from its tasks on first use"""
+        task_index = self.task_indexes.get(instance_id)
+        if task_index is None:
+            instance = self.get_instance(instance_id)
+            task_index = TaskBucketIndex(instance.get('tasks', []) if instance else [])
+            self.task_indexes[instance_id] = task_index
+        return task_index
+
+    def reindex_task(self, instance_id: str, task: dict):
+        """Keep the bucket index in sync after a task was added or changed"""
+        task_index = self.task_indexes.get(instance_id)
+        if task_index is not None:
+            task_index.update(task)
+
+    def unindex_task(self, instance_id: str, task_id: str):
+        """Keep the bucket and search indexes in sync after a task was removed"""
+        task_index = self.task_indexes.get(instance_id)
+        if task_index is not None:
+            task_index.remove(task_id)
+        self.unindex_entity(instance_id, task_id)
+
+    def create_admin_embeds(self, instance_id: str, page: int = 0) -> list:
+        """Create the dashboard embeds of one page (only the requested page is built)"""
+        return self.get_admin_paginated(instance_id).render_message(page)
+
+    def get_admin_page_count(self, instance_id: str) -> int:
+        """Number of dashboard pages, from the same cached layout as create_admin_embeds"""
+        return self.get_admin_paginated(instance_id).page_count()
+
+    def message_entities(self, instance: dict):
+        yield from super().message_entities(instance)
+        for task in instance.get('tasks', []):
+            yield task.get('message_id'), task, 'message_id'
+
+    def searchable_entities(self, instance: dict):
+        for task in instance.get('tasks', []):
+            yield task['task_id'], (task['task_id'], task['content'])
+
+    def find_admin_page(self, instance_id: str, query: str):
+        """Dashboard page showing the first task whose ID or content starts with query"""
+        matches = self.search_index(instance_id).search(query)
+        if not matches:
+            return None
+        return self.get_admin_paginated(instance_id).find_page(matches, key=lambda task: task['task_id'])
+
+    def schedule_task(self, instance: dict, task: dict, catch_up: bool = True):
+        """
+        (Re)schedule the next occurrence of a recurring task. Rules other
+        than cron fire at the instance reset time, in its time zone.
+        """
+        key = (instance['instance_id'], task['task_id'])
+        if not task.get('is_daily', False):
+            self.reset_scheduler.cancel(key)
+            return
 
-        # Ensure requested page exists
-        page = max(0, min(page, len(pages) - 1))
+        hour, minute = map(int, instance.get('daily_reset_time', '00:00').split(':'))
+        zone = get_zone(instance.get('timezone'))
+        rule = task.get('recurrence') or 'daily'
+
+        last_fire = None
+        if catch_up:
+            # Tasks reset before recurrences existed fall back to the instance's last reset
+            last_fire = task.get('last_reset')
+            if last_fire is None:
+                created = datetime.fromisoformat(task['created_at']).timestamp() if task.get('created_at') else None
+                last_fire = max(filter(None, (created, instance.get('last_daily_reset'))), default=None)
+
+        self.reset_scheduler.schedule(
+            key,
+            lambda after: next_occurrence(rule, hour, minute, zone, after),
+            last_fire
+        )
+        self.reset_scheduler.start()
+
+    def schedule_instance_tasks(self, instance: dict, catch_up: bool = True):
+        for task in self.get_task_index(instance['instance_id']).tasks(is_daily=True):
+            self.schedule_task(instance, task, catch_up)
+
+    def schedule_due_sweep(self, instance: dict):
+        """(Re)schedule the daily due-date sweep of an instance, at its reset time"""
+        hour, minute = map(int, instance.get('daily_reset_time', '00:00').split(':'))
+        zone = get_zone(instance.get('timezone'))
+        self.due_sweeper.schedule(instance['instance_id'], lambda after: next_occurrence('daily', hour, minute, zone, after))
+        self.due_sweeper.start()
+
+    async def on_due_sweep(self, instance_id: str, due: list):
+        """
+        Start of day of an instance: refresh the dashboard (its due section
+        depends on the day) and post the digest of the overdue and due today
+        tasks if enabled. Only the k due tasks are read from the index.
+        """
+        instance = self.get_instance(instance_id)
+        if not instance:
+            self.due_sweeper.cancel(instance_id)
+            return
 
-        return pages[page]
+        today = self.instance_today(instance)
+        await self.refresh_admin_panel_now(instance_id)
+        if not instance.get('due_digest') or not self.claim_once(f"due_digest:{instance_id}:{today.isoformat()}"):
+            return
 
-    async def daily_task_scheduler(self, bot, instance_id: str):
-        """Schedule daily task reset at configured time"""
-        await bot.wait_until_ready()
+        task_index = self.get_task_index(instance_id)
+        tasks = task_index.due_until(today)
+        if not tasks:
+            return
 
-        while not bot.is_closed():
+        admin_channel = self.bot.get_channel(instance['admin_channel']) if self.bot else None
+        if admin_channel:
             try:
-                instance = self.get_instance(instance_id)
-                if not instance:
+                await admin_channel.send(embed=self.create_due_digest_embed(tasks, task_index.count_due_before(today), today))
+            except Exception as e:
+                print(f"Error sending due digest: {e}")
+
+    def create_due_digest_embed(self, tasks: list, overdue: int, today: date) -> discord.Embed:
+        """One digest message: overdue tasks then the ones due today (fields bounded to 1024 chars)"""
+        embed = discord.Embed(
+            title="📅 Récap des échéances",
+            description=f"Tâches en retard ou à faire aujourd'hui ({today.strftime('%d/%m/%Y')})",
+            color=discord.Color.from_rgb(255, 255, 255)
+        )
+        for name, group in (("🔴 En retard", tasks[:overdue]), ("📅 Aujourd'hui", tasks[overdue:])):
+            if not group:
+                continue
+            lines = []
+            length = 0
+            for shown, task in enumerate(group):
+                line = f"`{task['task_id'][:8]}` [{task.get('date')}] {task['content'][:50]}"
+                if length + len(line) + 1 > 990:
+                    lines.append(f"*... et {len(group) - shown} autre(s)*")
                     break
+                lines.append(line)
+                length += len(line) + 1
+            embed.add_field(name=f"{name} ({len(group)})", value="\n".join(lines), inline=False)
+        return embed
 
-                # Get reset time (format: "HH:MM")
-                reset_time_str = instance.get('daily_reset_time', '00:00')
-                hour, minute = map(int, reset_time_str.split(':'))
+    async def set_due_digest(self, interaction: discord.Interaction, enabled: bool):
+        instance = await self.resolve_command_instance(interaction)
+        if not instance:
+            return
 
-                # Calculate next reset time
-                now = datetime.now()
-                next_reset = datetime.combine(now.date(), time(hour, minute))
-                if next_reset <= now:
-                    next_reset += timedelta(days=1)
+        instance['due_digest'] = enabled
+        self.save_instances()
+        await interaction.response.send_message(
+            f"✅ Récap quotidien des échéances {'activé' if enabled else 'désactivé'} "
+            f"(à {instance.get('daily_reset_time', '00:00')}).",
+            ephemeral=True,
+            delete_after=60
+        )
 
-                # Wait until next reset
-                wait_seconds = (next_reset - now).total_seconds()
-                await asyncio.sleep(wait_seconds)
+    async def restore_state(self, bot):
+        self.bot = bot
+        for instance in self.instances['instances']:
+            self.schedule_instance_tasks(instance)
+            self.schedule_due_sweep(instance)
+        if len(self.reset_scheduler):
+            print(f"Scheduled {len(self.reset_scheduler)} recurring task(s) for {self.display_name}")
+        # on_ready also runs on reconnects: check each instance once per process
+        pending = [inst['instance_id'] for inst in self.instances['instances'] if inst['instance_id'] not in self.cards_reconciled]
+        if pending:
+            self.cards_reconciled.update(pending)
+            asyncio.create_task(self.reconcile_all_task_cards(bot, pending))
+
+    async def reconcile_all_task_cards(self, bot, instance_ids: list):
+        """Startup job: reconcile the cards of each instance, one channel at a time"""
+        for instance_id in instance_ids:
+            try:
+                report = await self.reconcile_task_cards(bot, instance_id)
+            except Exception as e:
+                print(f"Error reconciling task cards of {instance_id}: {e}")
+                continue
+            if report['reposted'] or report['orphans']:
+                print(f"Task cards of {instance_id}: {report['reposted']} reposted, {len(report['orphans'])} orphan(s) left (/verifier_cartes)")
+
+    @staticmethod
+    def is_task_card(message: discord.Message) -> bool:
+        return bool(message.embeds) and message.embeds[0].title == TASK_CARD_TITLE
+
+    async def reconcile_task_cards(self, bot, instance_id: str, depth: int = None) -> dict:
+        """
+        Check the stored cards against the setup channel, whose history is
+        read once, newest first, in pages of 100 messages (at most `depth`
+        messages: the instance's 'card_history_depth' or CARD_RECONCILE_DEPTH)
+        instead of fetching each card.
+
+        Open tasks whose card is gone get a new one and the state is saved
+        once. Bot cards no open task points to are only reported: deleting
+        them is left to delete_orphan_cards, after an admin confirmed (a
+        wrong state file must not wipe the channel). Cards older than the
+        window read are left as they are. Returns {'checked', 'reposted',
+        'orphans': [messages]}.
+        """
+        report = {'checked': 0, 'reposted': 0, 'orphans': []}
+        instance = self.get_instance(instance_id)
+        if not instance:
+            return report
+        setup_channel = bot.get_channel(instance['setup_channel'])
+        if not setup_channel:
+            return report
+        depth = depth or instance.get('card_history_depth') or CARD_RECONCILE_DEPTH
 
-                # Reset daily tasks
-                await self.reset_daily_tasks(bot, instance_id)
+        cards = {task['task_id']: task.get('message_id') for task in instance.get('tasks', []) if task['status'] != 'done'}
+        card_ids = set(cards.values())
 
-            except Exception as e:
-                print(f"Error in daily task scheduler for instance {instance_id}: {e}")
-                await asyncio.sleep(3600)  # Wait 1 hour on error
+        seen, orphans, oldest = set(), [], None
+        try:
+            async for message in setup_channel.history(limit=depth):
+                report['checked'] += 1
+                oldest = message.id
+                if message.id in card_ids:
+                    seen.add(message.id)
+                elif message.author.id == bot.user.id and self.is_task_card(message):
+                    orphans.append(message)
+        except discord.HTTPException as e:
+            print(f"Error reading the history of {setup_channel.id}: {e}")
+            return report
+
+        # Snowflakes grow with time: a card newer than the oldest message read was deleted
+        # Cards sent meanwhile (e.g. by a reset) are neither missing nor orphaned
+        exhausted = report['checked'] < depth
+        missing = [
+            task for task in instance.get('tasks', [])
+            if task['status'] != 'done' and task['task_id'] in cards and task.get('message_id') == cards[task['task_id']]
+            and (not task.get('message_id') or (task['message_id'] not in seen and (exhausted or task['message_id'] > oldest)))
+        ]
+        current_ids = {task.get('message_id') for task in instance.get('tasks', []) if task['status'] != 'done'}
+        report['orphans'] = [message for message in orphans if message.id not in current_ids]
+
+        changed = False
+        for task in instance.get('tasks', []):
+            if task['status'] == 'done' and task.get('message_id'):
+                # The card was deleted when the task was completed
+                self.untrack_message(task['message_id'])
+                task['message_id'] = None
+                changed = True
+
+        if missing:
+            semaphore = asyncio.Semaphore(CARD_RECONCILE_CONCURRENCY)
+
+            async def repost(task):
+                async with semaphore:
+                    self.untrack_message(task.get('message_id'))
+                    try:
+                        await self.post_task_card(setup_channel, instance_id, task)
+                        report['reposted'] += 1
+                    except Exception as e:
+                        task['message_id'] = None
+                        print(f"Error reposting task card: {e}")
 
-        if instance_id in self.daily_tasks:
-            del self.daily_tasks[instance_id]
+            await asyncio.gather(*(repost(task) for task in missing))
+            changed = True
 
-    async def reset_daily_tasks(self, bot, instance_id: str):
-        """Reset all daily tasks (set back to pending and resend to setup channel)"""
+        if changed:
+            self.save_instances()
+        return report
+
+    async def delete_orphan_cards(self, instance_id: str, orphans: list) -> int:
+        """Delete confirmed orphan cards (bulk delete when recent enough), skipping any a task uses again"""
+        instance = self.get_instance(instance_id)
+        if not instance:
+            return 0
+        channel = self.bot.get_channel(instance['setup_channel'])
+        if not channel:
+            return 0
+        current_ids = {task.get('message_id') for task in instance.get('tasks', []) if task['status'] != 'done'}
+        orphans = [message for message in orphans if message.id not in current_ids]
+
+        deleted = 0
+        limit = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        recent = [message for message in orphans if message.created_at > limit]
+        for i in range(0, len(recent), 100):
+            try:
+                await channel.delete_messages(recent[i:i + 100])
+                deleted += len(recent[i:i + 100])
+            except discord.HTTPException as e:
+                print(f"Error deleting orphaned task cards: {e}")
+        for message in orphans:
+            if message.created_at <= limit:
+                try:
+                    await message.delete()
+                    deleted += 1
+                except discord.HTTPException:
+                    pass
+        return deleted
+
+    async def run_card_reconciliation(self, interaction: discord.Interaction, depth: int = None):
+        instance = await self.resolve_command_instance(interaction)
+        if not instance:
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        report = await self.reconcile_task_cards(interaction.client, instance['instance_id'], depth)
+        message = (
+            f"✅ {report['checked']} message(s) vérifié(s) : {report['reposted']} carte(s) republiée(s)."
+        )
+        if not report['orphans']:
+            await interaction.followup.send(message, ephemeral=True)
+            return
+
+        # Orphans are only deleted once an admin has seen how many there are
+        view = DeleteOrphanCardsView(self, instance['instance_id'], report['orphans'])
+        await interaction.followup.send(
+            message + f"\n⚠️ {len(report['orphans'])} carte(s) orpheline(s) (sans tâche ouverte). Les supprimer ?",
+            view=view,
+            ephemeral=True
+        )
+
+    async def on_tasks_due(self, instance_id: str, due: list):
+        """Called by the reset scheduler with the tasks of an instance due now: [((instance_id, task_id), occurrence)]"""
+        instance = self.get_instance(instance_id)
+        if not instance:
+            for key, _ in due:
+                self.reset_scheduler.cancel(key)
+            return
+
+        # Each occurrence is reset only once across cluster workers
+        zone = get_zone(instance.get('timezone'))
+        claimed = [
+            (task_id, occurrence) for (_, task_id), occurrence in due
+            if self.claim_once(f"task_reset:{instance_id}:{task_id}:{datetime.fromtimestamp(occurrence, zone).isoformat()}")
+        ]
+        if claimed:
+            await self.reset_recurring_tasks(self.bot, instance_id, claimed)
+
+    async def reset_recurring_tasks(self, bot, instance_id: str, due: list):
+        """Reset the given recurring tasks [(task_id, occurrence)]: back to pending, card sent again"""
         instance = self.get_instance(instance_id)
         if not instance:
             return
@@ -220,27 +533,31 @@ class TaskManager(BaseTool):
         if not setup_channel:
             return
 
-        tasks = instance.get('tasks', [])
-        for task in tasks:
-            if task.get('is_daily', False):
-                # Delete old message if exists
-                if task.get('message_id'):
-                    try:
-                        old_message = await setup_channel.fetch_message(task['message_id'])
-                        await old_message.delete()
-                    except:
-                        pass
-
-                # Reset task status
-                task['status'] = 'pending'
-                task['started_at'] = None
-                task['completed_at'] = None
+        tasks_by_id = self.get_task_index(instance_id).tasks_by_id
+        for task_id, occurrence in due:
+            task = tasks_by_id.get(task_id)
+            if not task:
+                continue
 
-                # Send new task card
-                task_embed = self.create_task_card_embed(task)
-                view = TaskCardView(self, instance_id, task['task_id'])
-                message = await setup_channel.send(content="@everyone", embed=task_embed, view=view)
-                task['message_id'] = message.id
+            # Delete old message if exists
+            if task.get('message_id'):
+                try:
+                    old_message = await setup_channel.fetch_message(task['message_id'])
+                    await old_message.delete()
+                except:
+                    pass
+
+            # Reset task status
+            task['status'] = 'pending'
+            task['started_at'] = None
+            task['completed_at'] = None
+            # Remembered to catch up a reset missed while the bot is offline
+            task['last_reset'] = occurrence
+            self.bump_entity_version(instance_id, task_id)
+            self.reindex_task(instance_id, task)
+
+            # Send new task card
+            await self.post_task_card(setup_channel, instance_id, task)
 
         # Save changes
         for i, inst in enumerate(self.instances['instances']):
@@ -261,7 +578,7 @@ class TaskManager(BaseTool):
         }
 
         embed = discord.Embed(
-            title="📋 Tâche",
+            title=TASK_CARD_TITLE,
             description=task['content'],
             color=status_colors.get(task['status'], discord.Color.greyple())
         )
@@ -276,7 +593,7 @@ class TaskManager(BaseTool):
 
         return embed
 
-    async def add_task(self, bot, instance_id: str, content: str, user_id: int, is_daily: bool = False, date: str = None):
+    async def add_task(self, bot, instance_id: str, content: str, user_id: int, is_daily: bool = False, date: str = None, recurrence: str = None):
         """Add a new task"""
         instance = self.get_instance(instance_id)
         if not instance:
@@ -285,29 +602,19 @@ class TaskManager(BaseTool):
         if 'tasks' not in instance:
             instance['tasks'] = []
 
-        task_id = str(uuid.uuid4())
-        task = {
-            'task_id': task_id,
-            'content': content,
-            'status': 'pending',
-            'created_at': datetime.now().isoformat(),
-            'created_by': user_id,
-            'started_at': None,
-            'completed_at': None,
-            'message_id': None,
-            'is_daily': is_daily,
-            'date': date
-        }
+        task = self.new_task(content, user_id, is_daily, date, recurrence)
+        task_id = task['task_id']
 
         # Send to setup channel
         setup_channel = bot.get_channel(instance['setup_channel'])
         if setup_channel:
-            task_embed = self.create_task_card_embed(task)
-            view = TaskCardView(self, instance_id, task_id)
-            message = await setup_channel.send(content="@everyone", embed=task_embed, view=view)
-            task['message_id'] = message.id
+            await self.post_task_card(setup_channel, instance_id, task)
 
         instance['tasks'].append(task)
+        self.bump_entity_version(instance_id, task_id)
+        self.index_entity(instance_id, task_id, (task_id, content))
+        self.reindex_task(instance_id, task)
+        self.schedule_task(instance, task)
 
         for i, inst in enumerate(self.instances['instances']):
             if inst.get('instance_id') == instance_id:
@@ -318,8 +625,163 @@ class TaskManager(BaseTool):
         await self.refresh_admin_panel_now(instance_id)
         return task_id
 
-    async def update_task_status(self, bot, instance_id: str, task_id: str, new_status: str):
-        """Update task status"""
+    @staticmethod
+    def new_task(content: str, user_id: int, is_daily: bool = False, date: str = None, recurrence: str = None) -> dict:
+        """Task dict; recurring tasks (is_daily) repeat following `recurrence` (every day by default)"""
+        now = datetime.now()
+        return {
+            'task_id': str(uuid.uuid4()),
+            'content': content,
+            'status': 'pending',
+            'created_at': now.isoformat(),
+            'created_by': user_id,
+            'started_at': None,
+            'completed_at': None,
+            'message_id': None,
+            'is_daily': is_daily,
+            'date': date,
+            'due': None if is_daily else parse_due(date),
+            'recurrence': (recurrence or 'daily') if is_daily else None,
+            'last_reset': now.timestamp() if is_daily else None
+        }
+
+    async def post_task_card(self, setup_channel, instance_id: str, task: dict):
+        """Send the card of a task to the setup channel and remember its message"""
+        task_embed = self.create_task_card_embed(task)
+        view = TaskCardView(self, instance_id, task['task_id'], show_in_progress=task['status'] != 'in_progress')
+        message = await setup_channel.send(content="@everyone", embed=task_embed, view=view)
+        task['message_id'] = message.id
+        self.track_message(message.id, instance_id, task, 'message_id')
+
+    @staticmethod
+    def parse_import_lines(text: str, default_date: str = None) -> tuple:
+        """
+        Parse a bulk import, one task per line: "contenu" or
+        "JJ/MM/AAAA | contenu". Lines without a date get `default_date`
+        (daily task if empty). Returns ([(content, date)], [error lines]).
+        """
+        entries, errors = [], []
+        for number, line in enumerate(text.splitlines(), start=1):
+            line = line.strip()
+            if not line:
+                continue
+            task_date = default_date or None
+            if '|' in line:
+                task_date, line = (part.strip() for part in line.split('|', 1))
+            entry = TaskManager.check_import_entry(line, task_date)
+            if entry is None:
+                errors.append(f"Ligne {number} : date invalide ou tâche vide")
+            else:
+                entries.append(entry)
+        return entries, errors
+
+    @staticmethod
+    def parse_import_csv(text: str) -> tuple:
+        """Parse a CSV import with columns contenu[,date] (header optional, empty date = daily task)"""
+        entries, errors = [], []
+        for number, row in enumerate(csv.reader(io.StringIO(text)), start=1):
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            if number == 1 and row[0].strip().lower() in ('contenu', 'content'):
+                continue
+            entry = TaskManager.check_import_entry(row[0].strip(), row[1].strip() if len(row) > 1 else None)
+            if entry is None:
+                errors.append(f"Ligne {number} : date invalide ou tâche vide")
+            else:
+                entries.append(entry)
+        return entries, errors
+
+    @staticmethod
+    def check_import_entry(content: str, task_date: str):
+        """(content, date) if valid (date JJ/MM/AAAA or empty), else None"""
+        if not content or len(content) > 500:
+            return None
+        if task_date:
+            try:
+                datetime.strptime(task_date, '%d/%m/%Y')
+            except ValueError:
+                return None
+        return content, task_date or None
+
+    async def import_tasks(self, bot, instance_id: str, entries: list, user_id: int) -> tuple:
+        """
+        Create many tasks in one transaction: all tasks are added and saved
+        once before any card is sent (a crash mid-import leaves no card
+        without its task), then cards are posted with at most
+        IMPORT_CARD_CONCURRENCY sends in flight (discord.py waits out rate
+        limits per route) and the admin panel refreshed once. The card ids
+        are only kept in memory until the next save: if the bot stops before
+        it, the startup card check posts the cards again. Returns (tasks
+        created, cards that could not be posted).
+        """
+        instance = self.get_instance(instance_id)
+        if not instance or not entries:
+            return 0, 0
+
+        tasks = [self.new_task(content, user_id, is_daily=task_date is None, date=task_date) for content, task_date in entries]
+
+        instance.setdefault('tasks', []).extend(tasks)
+        for task in tasks:
+            self.bump_entity_version(instance_id, task['task_id'])
+            self.index_entity(instance_id, task['task_id'], (task['task_id'], task['content']))
+            self.reindex_task(instance_id, task)
+            self.schedule_task(instance, task)
+        self.save_instances()
+
+        failed = len(tasks)
+        setup_channel = bot.get_channel(instance['setup_channel'])
+        if setup_channel:
+            semaphore = asyncio.Semaphore(IMPORT_CARD_CONCURRENCY)
+
+            async def post(task) -> bool:
+                async with semaphore:
+                    try:
+                        await self.post_task_card(setup_channel, instance_id, task)
+                        return True
+                    except Exception as e:
+                        print(f"Error posting imported task card: {e}")
+                        return False
+
+            posted = await asyncio.gather(*(post(task) for task in tasks))
+            failed = posted.count(False)
+
+        await self.refresh_admin_panel_now(instance_id)
+        return len(tasks), failed
+
+    async def run_import(self, interaction: discord.Interaction, instance_id: str, entries: list, errors: list):
+        """Shared end of the import modal and command: import and report"""
+        if not entries:
+            await interaction.response.send_message(
+                "❌ Aucune tâche valide à importer." + ("\n" + "\n".join(errors[:10]) if errors else ""),
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+        if len(entries) > IMPORT_MAX_TASKS:
+            await interaction.response.send_message(
+                f"❌ Trop de tâches ({len(entries)}), maximum {IMPORT_MAX_TASKS} par import.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        count, failed = await self.import_tasks(interaction.client, instance_id, entries, interaction.user.id)
+
+        message = f"✅ {count} tâche(s) importée(s) !"
+        if failed:
+            message += f"\n⚠️ {failed} carte(s) non publiée(s), à republier avec /verifier_cartes."
+        if errors:
+            message += f"\n⚠️ {len(errors)} ligne(s) ignorée(s) :\n" + "\n".join(errors[:10])
+        await interaction.followup.send(message, ephemeral=True)
+
+    async def update_task_status(self, bot, instance_id: str, task_id: str, new_status: str, interaction: discord.Interaction = None):
+        """
+        Update task status. When `interaction` comes from the task card, it is
+        answered by the card update itself (edit_message, or the confirmation
+        before the card is deleted through the interaction's message) instead
+        of fetching the card, and before the admin panel refresh.
+        """
         instance = self.get_instance(instance_id)
         if not instance or 'tasks' not in instance:
             return False
@@ -336,6 +798,8 @@ class TaskManager(BaseTool):
             task['started_at'] = datetime.now().isoformat()
         elif new_status == 'done':
             task['completed_at'] = datetime.now().isoformat()
+        self.bump_entity_version(instance_id, task_id)
+        self.reindex_task(instance_id, task)
 
         # Save changes first
         for i, inst in enumerate(self.instances['instances']):
@@ -345,9 +809,18 @@ class TaskManager(BaseTool):
         self.save_instances()
 
         # Then update the message
+        from_card = interaction is not None and interaction.message is not None and interaction.message.id == task.get('message_id')
         if new_status == 'done':
+            # The card is deleted below: its delete event has nothing left to reconcile
+            self.untrack_message(task.get('message_id'))
             # Delete the task card from setup channel
-            if task.get('message_id'):
+            if from_card:
+                await interaction.response.send_message("✅ Tâche marquée comme terminée !", ephemeral=True, delete_after=60)
+                try:
+                    await interaction.message.delete()
+                except discord.HTTPException as e:
+                    print(f"Error deleting task card: {e}")
+            elif task.get('message_id'):
                 setup_channel = bot.get_channel(instance['setup_channel'])
                 if setup_channel:
                     try:
@@ -359,6 +832,7 @@ class TaskManager(BaseTool):
             # Remove task from list if it's not daily (daily tasks stay for next reset)
             if not task.get('is_daily', False):
                 instance['tasks'].remove(task)
+                self.unindex_task(instance_id, task_id)
                 # Save again after removing task
                 for i, inst in enumerate(self.instances['instances']):
                     if inst.get('instance_id') == instance_id:
@@ -367,7 +841,10 @@ class TaskManager(BaseTool):
                 self.save_instances()
         else:
             # Update the task card embed
-            if task.get('message_id'):
+            if from_card:
+                view = TaskCardView(self, instance_id, task_id, show_in_progress=(new_status != 'in_progress'))
+                await interaction.response.edit_message(embed=self.create_task_card_embed(task), view=view)
+            elif task.get('message_id'):
                 setup_channel = bot.get_channel(instance['setup_channel'])
                 if setup_channel:
                     try:
@@ -405,6 +882,10 @@ class TaskManager(BaseTool):
                 pass
 
         instance['tasks'].remove(task)
+        self.bump_entity_version(instance_id, task['task_id'])
+        self.unindex_task(instance_id, task['task_id'])
+        self.reset_scheduler.cancel((instance_id, task['task_id']))
+        self.untrack_message(task.get('message_id'))
 
         for i, inst in enumerate(self.instances['instances']):
             if inst.get('instance_id') == instance_id:
@@ -415,13 +896,19 @@ class TaskManager(BaseTool):
         await self.refresh_admin_panel_now(instance_id)
         return True
 
-    async def set_daily_reset_time(self, instance_id: str, reset_time: str):
-        """Set the daily reset time (format: HH:MM)"""
+    async def set_daily_reset_time(self, instance_id: str, reset_time: str, timezone: str = None):
+        """Set the daily reset time (format: HH:MM) and optionally the IANA time zone ("" for the host's)"""
         instance = self.get_instance(instance_id)
         if not instance:
             return False
 
         instance['daily_reset_time'] = reset_time
+        if timezone is not None:
+            instance['timezone'] = timezone or None
+        # A new time doesn't trigger a catch-up of today's reset
+        now = datetime.now().timestamp()
+        for task in self.get_task_index(instance_id).tasks(is_daily=True):
+            task['last_reset'] = now
 
         for i, inst in enumerate(self.instances['instances']):
             if inst.get('instance_id') == instance_id:
@@ -429,13 +916,10 @@ class TaskManager(BaseTool):
                 break
         self.save_instances()
 
-        # Restart scheduler with new time
-        if instance_id in self.daily_tasks:
-            self.daily_tasks[instance_id].cancel()
+        # Reschedule with the new time
         if self.bot:
-            admin_channel_id = instance.get('admin_channel')
-            daily_task = asyncio.create_task(self.daily_task_scheduler(self.bot, instance_id))
-            self.daily_tasks[instance_id] = daily_task
+            self.schedule_instance_tasks(instance, catch_up=False)
+            self.schedule_due_sweep(instance)
 
         await self.refresh_admin_panel_now(instance_id)
         return True
@@ -458,18 +942,25 @@ class TaskManager(BaseTool):
                         del self.refresh_tasks[instance_id]
                     break
 
-                try:
-                    admin_message = await admin_channel.fetch_message(instance['admin_message_id'])
-                    current_page = instance.get('admin_page', 0)
-                    new_embed = self.create_admin_embed(instance_id, page=current_page)
+                # A panel known to be deleted (raw delete event) is sent again without a failing fetch
+                admin_message = None
+                if instance['admin_message_id']:
+                    try:
+                        admin_message = await admin_channel.fetch_message(instance['admin_message_id'])
+                    except discord.NotFound:
+                        pass
+
+                if admin_message:
+                    current_page = self.admin_pages.get(admin_message.id, 0)
+                    new_embeds = self.create_admin_embeds(instance_id, page=current_page)
                     admin_view = AdminPanelView(self, instance_id, page=current_page)
-                    await admin_message.edit(embed=new_embed, view=admin_view)
-                except discord.NotFound:
-                    new_embed = self.create_admin_embed(instance_id, page=0)
+                    await admin_message.edit(embeds=new_embeds, view=admin_view)
+                else:
+                    new_embeds = self.create_admin_embeds(instance_id, page=0)
                     admin_view = AdminPanelView(self, instance_id, page=0)
-                    admin_message = await admin_channel.send(embed=new_embed, view=admin_view)
+                    admin_message = await admin_channel.send(embeds=new_embeds, view=admin_view)
                     instance['admin_message_id'] = admin_message.id
-                    instance['admin_page'] = 0
+                    self.track_message(admin_message.id, instance_id, None, 'admin_message_id')
                     for i, inst in enumerate(self.instances['instances']):
                         if inst.get('instance_id') == instance_id:
                             self.instances['instances'][i] = instance
@@ -491,7 +982,7 @@ class TaskManager(BaseTool):
                 return
 
             instance = self.get_instance(instance_id)
-            if not instance or 'admin_message_id' not in instance:
+            if not instance or not instance.get('admin_message_id'):
                 return
 
             admin_channel = self.bot.get_channel(instance['admin_channel'])
@@ -499,29 +990,92 @@ class TaskManager(BaseTool):
                 return
 
             admin_message = await admin_channel.fetch_message(instance['admin_message_id'])
-            current_page = instance.get('admin_page', 0)
-            new_embed = self.create_admin_embed(instance_id, page=current_page)
+            current_page = self.admin_pages.get(admin_message.id, 0)
+            new_embeds = self.create_admin_embeds(instance_id, page=current_page)
             admin_view = AdminPanelView(self, instance_id, page=current_page)
-            await admin_message.edit(embed=new_embed, view=admin_view)
+            await admin_message.edit(embeds=new_embeds, view=admin_view)
         except Exception as e:
             print(f"Error refreshing todo admin panel immediately: {e}")
 
-    def update_admin_page(self, instance_id: str, page: int):
-        """Update the current admin page"""
-        instance = self.get_instance(instance_id)
-        if instance:
-            instance['admin_page'] = page
-            for i, inst in enumerate(self.instances['instances']):
-                if inst.get('instance_id') == instance_id:
-                    self.instances['instances'][i] = instance
-                    break
-            self.save_instances()
 
+    def build_export_rows(self, instance: dict, start_day: date, end_day: date):
+        """Columns and row generator of the tasks created between start_day and end_day"""
+        columns = ['task_id', 'contenu', 'type', 'date', 'statut', 'cree_le', 'cree_par', 'commencee_le', 'terminee_le']
+        # Only references are taken here, the generator runs in the export thread
+        tasks = list(instance.get('tasks', []))
+        start_iso, end_iso = start_day.isoformat(), end_day.isoformat()
+
+        def task_rows():
+            for task in tasks:
+                created_day = (task.get('created_at') or '')[:10]
+                if start_iso <= created_day <= end_iso:
+                    yield (
+                        task['task_id'], task['content'],
+                        'journaliere' if task.get('is_daily', False) else 'specifique',
+                        task.get('date'), task['status'], task.get('created_at'), task.get('created_by'),
+                        task.get('started_at'), task.get('completed_at')
+                    )
+
+        return columns, task_rows()
 
     async def setup_commands(self, bot):
         """Register TaskManager-specific commands"""
         self.bot = bot
 
+        @bot.tree.command(name="export_taches", description="Exporter l'historique des tâches")
+        @app_commands.describe(
+            debut="Date de création minimale (AAAA-MM-JJ)",
+            fin="Date de création maximale incluse (AAAA-MM-JJ)",
+            format="Format du fichier"
+        )
+        @app_commands.choices(format=[
+            app_commands.Choice(name="CSV (gzip)", value="csv"),
+            app_commands.Choice(name="Parquet", value="parquet")
+        ])
+        async def export_taches(interaction: discord.Interaction, debut: str, fin: str, format: str = 'csv'):
+            await self.run_export(interaction, debut, fin, format, "taches", self.build_export_rows)
+
+        @bot.tree.command(name="recap_taches", description="Activer le récap quotidien des tâches en retard ou du jour")
+        @app_commands.describe(actif="Poster le récap chaque jour à l'heure de réinitialisation")
+        async def recap_taches(interaction: discord.Interaction, actif: bool):
+            await self.set_due_digest(interaction, actif)
+
+        @bot.tree.command(name="import_taches", description="Importer des tâches depuis un fichier CSV ou texte")
+        @app_commands.describe(fichier="CSV (contenu,date) ou texte (une tâche par ligne, « JJ/MM/AAAA | contenu »)")
+        async def import_taches(interaction: discord.Interaction, fichier: discord.Attachment):
+            instance = await self.resolve_command_instance(interaction)
+            if not instance:
+                return
+
+            if fichier.size > IMPORT_MAX_FILE_BYTES:
+                await interaction.response.send_message(
+                    f"❌ Fichier trop volumineux (maximum {IMPORT_MAX_FILE_BYTES // 1024} Ko).",
+                    ephemeral=True,
+                    delete_after=60
+                )
+                return
+
+            try:
+                text = (await fichier.read()).decode('utf-8-sig')
+            except (discord.HTTPException, UnicodeDecodeError):
+                await interaction.response.send_message(
+                    "❌ Impossible de lire le fichier (encodage UTF-8 attendu).",
+                    ephemeral=True,
+                    delete_after=60
+                )
+                return
+
+            if fichier.filename.lower().endswith('.csv'):
+                entries, errors = self.parse_import_csv(text)
+            else:
+                entries, errors = self.parse_import_lines(text)
+            await self.run_import(interaction, instance['instance_id'], entries, errors)
+
+        @bot.tree.command(name="verifier_cartes", description="Republier les cartes de tâches supprimées et proposer de retirer les cartes orphelines")
+        @app_commands.describe(profondeur=f"Nombre de messages du salon à parcourir (défaut {CARD_RECONCILE_DEPTH})")
+        async def verifier_cartes(interaction: discord.Interaction, profondeur: app_commands.Range[int, 1, 10000] = None):
+            await self.run_card_reconciliation(interaction, profondeur)
+
 
 # Task Card View (for setup channel)
 class TaskCardView(discord.ui.View):
@@ -556,11 +1110,14 @@ class TaskCardView(discord.ui.View):
             bot,
             self.instance_id,
             self.task_id,
-            'in_progress'
+            'in_progress',
+            interaction=interaction
         )
 
         if success:
-            await interaction.response.send_message("⏳ Tâche marquée en cours !", ephemeral=True, delete_after=60)
+            # Answered by the card update unless the click came from an outdated card
+            if not interaction.response.is_done():
+                await interaction.response.send_message("⏳ Tâche marquée en cours !", ephemeral=True, delete_after=60)
         else:
             await interaction.response.send_message("❌ Erreur lors de la mise à jour.", ephemeral=True, delete_after=60)
 
@@ -570,15 +1127,45 @@ class TaskCardView(discord.ui.View):
             bot,
             self.instance_id,
             self.task_id,
-            'done'
+            'done',
+            interaction=interaction
         )
 
         if success:
-            await interaction.response.send_message("✅ Tâche marquée comme terminée !", ephemeral=True, delete_after=60)
+            # Answered by the card update unless the click came from an outdated card
+            if not interaction.response.is_done():
+                await interaction.response.send_message("✅ Tâche marquée comme terminée !", ephemeral=True, delete_after=60)
         else:
             await interaction.response.send_message("❌ Erreur lors de la mise à jour.", ephemeral=True, delete_after=60)
 
 
+# Orphan cards confirmation (/verifier_cartes)
+class DeleteOrphanCardsView(discord.ui.View):
+    def __init__(self, manager: TaskManager, instance_id: str, orphans: list):
+        super().__init__(timeout=120)
+        self.manager = manager
+        self.instance_id = instance_id
+        self.orphans = orphans
+
+    @discord.ui.button(label="Supprimer", style=discord.ButtonStyle.red, emoji="🗑️")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not self.manager.is_user_allowed(interaction.user.id):
+            await interaction.response.send_message(
+                "❌ Vous n'avez pas la permission de supprimer des tâches.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        await interaction.response.defer()
+        deleted = await self.manager.delete_orphan_cards(self.instance_id, self.orphans)
+        await interaction.edit_original_response(content=f"✅ {deleted} carte(s) orpheline(s) supprimée(s).", view=None)
+
+    @discord.ui.button(label="Annuler", style=discord.ButtonStyle.gray)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.edit_message(content="Aucune carte supprimée.", view=None)
+
+
 # Admin Panel View
 class AdminPanelView(discord.ui.View):
     def __init__(self, manager: TaskManager, instance_id: str, page: int = 0):
@@ -623,6 +1210,71 @@ class AdminPanelView(discord.ui.View):
         view_daily_button.callback = self.view_daily_tasks
         self.add_item(view_daily_button)
 
+        # Bulk import button
+        import_button = discord.ui.Button(
+            label="Importer",
+            style=discord.ButtonStyle.secondary,
+            emoji="📥"
+        )
+        import_button.callback = self.import_tasks
+        self.add_item(import_button)
+
+        self.prev_button = discord.ui.Button(
+            label="◀️ Précédent",
+            style=discord.ButtonStyle.gray,
+            row=1
+        )
+        self.prev_button.callback = self.previous_page
+        self.add_item(self.prev_button)
+
+        self.next_button = discord.ui.Button(
+            label="Suivant ▶️",
+            style=discord.ButtonStyle.gray,
+            row=1
+        )
+        self.next_button.callback = self.next_page
+        self.add_item(self.next_button)
+
+        self.jump_button = discord.ui.Button(
+            label="🔎 Rechercher",
+            style=discord.ButtonStyle.gray,
+            row=1
+        )
+        self.jump_button.callback = self.open_search
+        self.add_item(self.jump_button)
+
+        self._update_buttons()
+
+    def _update_buttons(self):
+        total_pages = self.manager.get_admin_page_count(self.instance_id)
+        self.page = max(0, min(self.page, total_pages - 1))
+        self.prev_button.disabled = (self.page == 0)
+        self.next_button.disabled = (self.page >= total_pages - 1)
+
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        """Navigation purely in memory: no state is written to disk"""
+        self.page = page
+        self._update_buttons()
+        self.manager.admin_pages[interaction.message.id] = self.page
+
+        new_embeds = self.manager.create_admin_embeds(self.instance_id, page=self.page)
+        await interaction.response.edit_message(embeds=new_embeds, view=self)
+
+    async def previous_page(self, interaction: discord.Interaction):
+        await self._show_page(interaction, self.page - 1)
+
+    async def next_page(self, interaction: discord.Interaction):
+        await self._show_page(interaction, self.page + 1)
+
+    async def open_search(self, interaction: discord.Interaction):
+        modal = JumpToPageModal(
+            self.manager.get_admin_page_count(self.instance_id),
+            self._show_page,
+            lambda query: self.manager.find_admin_page(self.instance_id, query),
+            search_label="Tâche (ID ou début du texte)"
+        )
+        await interaction.response.send_modal(modal)
+
     async def add_task(self, interaction: discord.Interaction):
         if not self.manager.is_user_allowed(interaction.user.id):
             await interaction.response.send_message(
@@ -640,6 +1292,18 @@ class AdminPanelView(discord.ui.View):
             delete_after=60
         )
 
+    async def import_tasks(self, interaction: discord.Interaction):
+        if not self.manager.is_user_allowed(interaction.user.id):
+            await interaction.response.send_message(
+                "❌ Vous n'avez pas la permission d'ajouter des tâches.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        modal = ImportTasksModal(self.manager, self.instance_id)
+        await interaction.response.send_modal(modal)
+
     async def delete_task(self, interaction: discord.Interaction):
         if not self.manager.is_user_allowed(interaction.user.id):
             await interaction.response.send_message(
@@ -682,8 +1346,8 @@ class AdminPanelView(discord.ui.View):
             )
             return
 
-        tasks = instance.get('tasks', [])
-        daily_tasks = [t for t in tasks if t.get('is_daily', False)]
+        task_index = self.manager.get_task_index(self.instance_id)
+        daily_tasks = task_index.tasks(is_daily=True)
 
         if not daily_tasks:
             await interaction.response.send_message(
@@ -701,13 +1365,9 @@ class AdminPanelView(discord.ui.View):
         )
 
         for task in daily_tasks:
-            content_preview = task['content'][:100]
-            if len(task['content']) > 100:
-                content_preview += "..."
-
             embed.add_field(
-                name=f"`{task['task_id'][:8]}`",
-                value=content_preview,
+                name=f"`{task['task_id'][:8]}` · 🔁 {describe_rule(task.get('recurrence'))}",
+                value=task_index.preview(task, 100),
                 inline=False
             )
 
@@ -736,7 +1396,7 @@ class TaskTypeSelectView(discord.ui.View):
                 ),
                 discord.SelectOption(
                     label="Tâche Journalière",
-                    description="Se répète chaque jour automatiquement",
+                    description="Se répète automatiquement (chaque jour par défaut)",
                     value="daily",
                     emoji="🔄"
                 )
@@ -821,7 +1481,25 @@ class AddDailyTaskModal(discord.ui.Modal):
         )
         self.add_item(self.content)
 
+        self.recurrence = discord.ui.TextInput(
+            label="Récurrence (optionnel, vide = chaque jour)",
+            placeholder="Ex: lun, mer, ven · semaine · tous les 3 jours · cron 0 9 * * 1-5",
+            required=False,
+            max_length=100
+        )
+        self.add_item(self.recurrence)
+
     async def on_submit(self, interaction: discord.Interaction):
+        try:
+            recurrence = parse_rule(self.recurrence.value)
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ Récurrence invalide. Exemples : `lun, mer, ven`, `semaine`, `tous les 3 jours`, `cron 0 9 * * 1-5`",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
         bot = interaction.client
         task_id = await self.manager.add_task(
             bot,
@@ -829,13 +1507,14 @@ class AddDailyTaskModal(discord.ui.Modal):
             self.content.value,
             interaction.user.id,
             is_daily=True,
-            date=None
+            date=None,
+            recurrence=recurrence
         )
 
         if task_id:
             await interaction.response.send_message(
                 f"✅ Tâche journalière ajoutée avec succès !\n"
-                f"Elle se réinitialisera automatiquement chaque jour.",
+                f"Elle se réinitialisera automatiquement ({describe_rule(recurrence)}).",
                 ephemeral=True,
                 delete_after=60
             )
@@ -847,6 +1526,44 @@ class AddDailyTaskModal(discord.ui.Modal):
             )
 
 
+# Import Tasks Modal
+class ImportTasksModal(discord.ui.Modal):
+    def __init__(self, manager: TaskManager, instance_id: str):
+        super().__init__(title="Importer des tâches")
+        self.manager = manager
+        self.instance_id = instance_id
+
+        self.lines = discord.ui.TextInput(
+            label="Tâches (une par ligne)",
+            placeholder="Vérifier les emails\n25/12/2024 | Préparer le rapport mensuel",
+            required=True,
+            style=discord.TextStyle.paragraph,
+            max_length=4000
+        )
+        self.add_item(self.lines)
+
+        self.date = discord.ui.TextInput(
+            label="Date par défaut (JJ/MM/YYYY, vide = journalière)",
+            placeholder="Ex: 25/12/2024",
+            required=False,
+            max_length=10
+        )
+        self.add_item(self.date)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        default_date = self.date.value.strip()
+        if default_date and self.manager.check_import_entry("-", default_date) is None:
+            await interaction.response.send_message(
+                "❌ Date par défaut invalide. Utilisez JJ/MM/YYYY.",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
+        entries, errors = self.manager.parse_import_lines(self.lines.value, default_date)
+        await self.manager.run_import(interaction, self.instance_id, entries, errors)
+
+
 # Delete Task Modal
 class DeleteTaskModal(discord.ui.Modal):
     def __init__(self, manager: TaskManager, instance_id: str):
@@ -899,6 +1616,16 @@ class SetResetTimeModal(discord.ui.Modal):
         )
         self.add_item(self.reset_time)
 
+        instance = manager.get_instance(instance_id)
+        self.timezone = discord.ui.TextInput(
+            label="Fuseau horaire (optionnel)",
+            placeholder="Ex: Europe/Paris (vide = heure du serveur)",
+            default=(instance or {}).get('timezone') or None,
+            required=False,
+            max_length=64
+        )
+        self.add_item(self.timezone)
+
     async def on_submit(self, interaction: discord.Interaction):
         # Validate time format
         try:
@@ -913,9 +1640,19 @@ class SetResetTimeModal(discord.ui.Modal):
             )
             return
 
+        timezone = self.timezone.value.strip()
+        if timezone and get_zone(timezone) is None:
+            await interaction.response.send_message(
+                "❌ Fuseau horaire inconnu. Utilisez un nom IANA (ex: Europe/Paris)",
+                ephemeral=True,
+                delete_after=60
+            )
+            return
+
         success = await self.manager.set_daily_reset_time(
             self.instance_id,
-            self.reset_time.value
+            self.reset_time.value,
+            timezone
         )
 
         if success: